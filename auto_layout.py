@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""автоматическая раскладка блок-схемы по слоям (метод Сугиямы) для графа связей child. каждая конструкция
+ (блок вместе со смердженными блоками, строками и дополнительными конструкциями) - один узел графа со своим
+ размером. модуль не зависит от Qt: раскладка считается по снимку размеров и связей, поэтому ее можно считать
+ в фоновом потоке"""
+import collections
+
+H_GAP = 40  # расстояние между соседними узлами слоя
+V_GAP = 50  # расстояние между слоями
+DUMMY_WIDTH = 10  # ширина фиктивного узла, через который проходит длинная связь
+SWEEPS = 8  # проходов упорядочивания слоев для уменьшения числа пересечений
+ALIGN_ITERATIONS = 4
+
+
+def remove_cycles(nodes: list, edges: list) -> list:
+    """связи без циклов: обратные связи обхода в глубину разворачиваются"""
+    successors = collections.defaultdict(list)
+    for source, destination in edges:
+        successors[source].append(destination)
+    state = {}  # 1 - узел в стеке обхода, 2 - обработан
+    reversed_edges = set()
+    for start in nodes:
+        if start in state:
+            continue
+        state[start] = 1
+        stack = [(start, iter(successors[start]))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if state.get(child) == 1:
+                    reversed_edges.add((node, child))
+                elif child not in state:
+                    state[child] = 1
+                    stack.append((child, iter(successors[child])))
+                    break
+            else:
+                state[node] = 2
+                stack.pop()
+    return [(destination, source) if (source, destination) in reversed_edges else (source, destination)
+            for source, destination in edges]
+
+
+def assign_layers(nodes: list, edges: list) -> dict:
+    """слой узла - длина самого длинного пути до него из узлов без входящих связей"""
+    successors = collections.defaultdict(list)
+    incoming = collections.Counter()
+    for source, destination in edges:
+        successors[source].append(destination)
+        incoming[destination] += 1
+    layers = {node: 0 for node in nodes}
+    queue = collections.deque(node for node in nodes if not incoming[node])
+    while queue:
+        node = queue.popleft()
+        for child in successors[node]:
+            layers[child] = max(layers[child], layers[node] + 1)
+            incoming[child] -= 1
+            if not incoming[child]:
+                queue.append(child)
+    return layers
+
+
+class Dummy:
+    """фиктивный узел на связи, которая пересекает несколько слоев"""
+    __slots__ = ()
+
+
+def split_long_edges(layers: dict, edges: list) -> list:
+    """заменяет связи через несколько слоев цепочками связей между соседними слоями"""
+    result = []
+    for source, destination in edges:
+        if source == destination:
+            continue
+        previous = source
+        for layer in range(layers[source] + 1, layers[destination]):
+            dummy = Dummy()
+            layers[dummy] = layer
+            result.append((previous, dummy))
+            previous = dummy
+        result.append((previous, destination))
+    return result
+
+
+def order_layers(layers: dict, edges: list) -> list:
+    """порядок узлов в каждом слое: барицентрический метод, проходы сверху вниз и снизу вверх"""
+    rows = [[] for _ in range(max(layers.values(), default=-1) + 1)]
+    for node, layer in layers.items():
+        rows[layer].append(node)
+    predecessors = collections.defaultdict(list)
+    successors = collections.defaultdict(list)
+    for source, destination in edges:
+        successors[source].append(destination)
+        predecessors[destination].append(source)
+
+    def reorder(row: list, neighbours: dict, positions: dict) -> list:
+        def barycenter(item):
+            index, node = item
+            linked = [positions[i] for i in neighbours[node] if i in positions]
+            return sum(linked) / len(linked) if linked else index
+        return [node for _, node in sorted(enumerate(row), key=barycenter)]
+
+    for sweep in range(SWEEPS):
+        downward = sweep % 2 == 0
+        indexes = range(1, len(rows)) if downward else range(len(rows) - 2, -1, -1)
+        for index in indexes:
+            fixed_row = rows[index - 1] if downward else rows[index + 1]
+            positions = {node: position for position, node in enumerate(fixed_row)}
+            rows[index] = reorder(rows[index], predecessors if downward else successors, positions)
+    return rows
+
+
+def assign_coordinates(rows: list, edges: list, sizes: dict) -> dict:
+    """координаты левого верхнего угла узлов. узел тянется к медиане связанных с ним узлов соседнего слоя,
+     не налезая на левого соседа по слою"""
+    predecessors = collections.defaultdict(list)
+    successors = collections.defaultdict(list)
+    for source, destination in edges:
+        successors[source].append(destination)
+        predecessors[destination].append(source)
+
+    def width(node) -> int:
+        return sizes[node][0] if node in sizes else DUMMY_WIDTH
+
+    def height(node) -> int:
+        return sizes[node][1] if node in sizes else 0
+
+    centers = {}
+    for row in rows:
+        x = 0
+        for node in row:
+            centers[node] = x + width(node) / 2
+            x += width(node) + H_GAP
+
+    def align(row: list, neighbours: dict):
+        for index, node in enumerate(row):
+            linked = sorted(centers[i] for i in neighbours[node])
+            center = linked[len(linked) // 2] if linked else centers[node]
+            if index:
+                left = row[index - 1]
+                center = max(center, centers[left] + (width(left) + width(node)) / 2 + H_GAP)
+            centers[node] = center
+
+    for iteration in range(ALIGN_ITERATIONS):
+        for row in (rows if iteration % 2 == 0 else reversed(rows)):
+            align(row, predecessors if iteration % 2 == 0 else successors)
+
+    left = min((centers[node] - width(node) / 2 for row in rows for node in row), default=0)
+    result = {}
+    y = 0
+    for row in rows:
+        for node in row:
+            if not isinstance(node, Dummy):
+                result[node] = (int(centers[node] - width(node) / 2 - left), y)
+        y += max((height(node) for node in row), default=0) + V_GAP
+    return result
+
+
+def arrange(sizes: dict, edges: list) -> dict:
+    """раскладывает граф по слоям. sizes - {узел: (ширина, высота)}, edges - [(откуда, куда)]. возвращает
+     {узел: (x, y)} с началом в (0, 0), связи идут сверху вниз"""
+    nodes = list(sizes)
+    edges = [(source, destination) for source, destination in edges
+             if source in sizes and destination in sizes and source != destination]
+    edges = remove_cycles(nodes, edges)
+    layers = assign_layers(nodes, edges)
+    edges = split_long_edges(layers, edges)
+    rows = order_layers(layers, edges)
+    return assign_coordinates(rows, edges, sizes)
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""генератор синтетических блок-схем для бенчмарков. схема собирается из тех же связей, что создает редактор,
+ и всегда переводится в корректный код
+
+пример: python benchmarks/generator.py diagram.sqlite --blocks 5000 --merge-chain 4 --depth 3 --elifs 3
+"""
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import diagram_model  # noqa: E402
+
+
+class DiagramGenerator:
+    """строит схему из присваиваний, циклов for и условий if/elif/else, пока в ней не наберется blocks узлов
+
+    merge_chain - число смердженных блоков в присваивании, depth - глубина вложенности lines,
+    elifs - число Elif Block после каждого If Block"""
+
+    def __init__(self, blocks: int = 1000, merge_chain: int = 3, depth: int = 2, elifs: int = 1, seed: int = 0):
+        self.blocks = blocks
+        self.merge_chain = max(merge_chain, 3)
+        self.depth = depth
+        self.elifs = elifs
+        self.random = random.Random(seed)
+        self.diagram = diagram_model.Diagram()
+        self.variables = 0
+
+    def add(self, type_name: str, arg: str = None, data_type: str = None) -> diagram_model.Node:
+        return self.diagram.add(diagram_model.Node(type_name, arg=arg, data_type=data_type))
+
+    def merge(self, chain: list) -> diagram_model.Node:
+        for upper, lower in zip(chain, chain[1:]):
+            upper.layer_down_block = lower
+            lower.layer_up_block = upper
+        return chain[0]
+
+    def assignment(self) -> diagram_model.Node:
+        """x = 1 + 1 + ... , всего merge_chain смердженных блоков"""
+        chain = [self.add('VariableBlock', f'x{self.variables}'), self.add('OperatorBlock', '='),
+                 self.add('DataBlock', str(self.random.randint(0, 99)), 'int')]
+        self.variables += 1
+        while len(chain) + 2 <= self.merge_chain:
+            chain.extend([self.add('OperatorBlock', '+'), self.add('DataBlock', str(self.random.randint(0, 9)), 'int')])
+        return self.merge(chain)
+
+    def for_loop(self, depth: int) -> diagram_model.Node:
+        loop = self.merge([self.add('ForLoopBlock', 'for i in '), self.add('FunctionBlock', 'range()'),
+                           self.add('DataBlock', '2', 'int')])
+        self.fill_lines(loop, depth)
+        return loop
+
+    def condition(self, keyword: str) -> diagram_model.Node:
+        return self.merge([self.add(keyword, keyword[:-len('Block')].lower() + ' '), self.add('VariableBlock', 'x0'),
+                           self.add('LogicalBlock', '== '), self.add('DataBlock', str(self.random.randint(0, 99)),
+                                                                     'int')])
+
+    def if_block(self, depth: int) -> diagram_model.Node:
+        """if с elifs дополнительными Elif Block и Else Block в конце"""
+        head = self.condition('IfBlock')
+        self.fill_lines(head, depth)
+        previous = head
+        for _ in range(self.elifs):
+            elif_block = self.condition('ElifBlock')
+            self.append_additional(previous, elif_block)
+            self.fill_lines(elif_block, depth)
+            previous = elif_block
+        else_block = self.add('ElseBlock', 'else ')
+        self.append_additional(previous, else_block)
+        self.fill_lines(else_block, depth)
+        return head
+
+    def append_additional(self, parent: diagram_model.Node, node: diagram_model.Node):
+        parent.layer_down_additional_block = node
+        node.layer_up_additional_block = parent
+
+    def fill_lines(self, general_block: diagram_model.Node, depth: int):
+        for _ in range(self.random.randint(1, 3)):
+            line = self.statement(depth - 1)
+            general_block.append_line(line)
+            current_node = line.layer_down_additional_block
+            while current_node is not None:
+                current_node.general_block = general_block
+                current_node = current_node.layer_down_additional_block
+
+    def statement(self, depth: int) -> diagram_model.Node:
+        if depth <= 0:
+            return self.assignment()
+        kind = self.random.random()
+        if kind < 0.4:
+            return self.assignment()
+        if kind < 0.7:
+            return self.for_loop(depth)
+        return self.if_block(depth)
+
+    def generate(self) -> diagram_model.Diagram:
+        start = self.add('StartBlock')
+        previous = start
+        roots = [start, self.assignment()]
+        while len(self.diagram) < self.blocks:
+            roots.append(self.statement(self.depth))
+        end = self.add('EndBlock')
+        roots.append(end)
+        for index, root in enumerate(roots):
+            if root is not start:
+                previous.child = root
+                previous = root
+            root.x, root.y = (index % 20) * 300, (index // 20) * 300
+        return self.diagram
+
+
+def generate_diagram(blocks: int = 1000, merge_chain: int = 3, depth: int = 2, elifs: int = 1,
+                     seed: int = 0) -> diagram_model.Diagram:
+    return DiagramGenerator(blocks, merge_chain, depth, elifs, seed).generate()
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--blocks', type=int, default=1000, help='minimal number of blocks')
+    parser.add_argument('--merge-chain', type=int, default=3, help='blocks merged into one assignment (>= 3)')
+    parser.add_argument('--depth', type=int, default=2, help='nesting depth of lines')
+    parser.add_argument('--elifs', type=int, default=1, help='Elif blocks after every If block')
+    parser.add_argument('--seed', type=int, default=0)
+
+
+def main(argv=None) -> int:
+    import save_diagram
+
+    parser = argparse.ArgumentParser(description='Generate a synthetic block diagram')
+    parser.add_argument('output', help='.sqlite or .bdgm file')
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    diagram = generate_diagram(args.blocks, args.merge_chain, args.depth, args.elifs, args.seed)
+    if os.path.exists(args.output):
+        os.remove(args.output)
+    if args.output.endswith('.bdgm'):
+        import binary_diagram
+        binary_diagram.write_binary(args.output, diagram)
+    else:
+        save_diagram.fill_data_base(args.output, diagram)
+    print(f'{len(diagram)} blocks written to {args.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""время до первого окна редактора. каждый запуск - новый процесс python с платформой Qt offscreen,
+ время считается от момента перед запуском процесса в родителе до первой отрисовки главного окна, поэтому в него
+ входят старт интерпретатора и все импорты
+
+пример: python benchmarks/startup.py -n 10 --scene -o startup.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD_CODE = '''
+import os, sys, time
+start = time.perf_counter()
+spawn_time = float(os.environ['BENCHMARK_SPAWN_TIME'])
+sys.path.insert(0, {root!r})
+from PyQt5 import QtCore, QtWidgets
+import main
+
+app = QtWidgets.QApplication(sys.argv)
+window = main.create_window(sys.argv)
+
+
+class FirstPaint(QtCore.QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QtCore.QEvent.Paint:
+            print(time.time() - spawn_time, time.perf_counter() - start, len(sys.modules), flush=True)
+            app.quit()
+        return False
+
+
+first_paint = FirstPaint()
+window.installEventFilter(first_paint)
+window.show()
+app.exec()
+window.close()
+'''
+
+
+def run_once(argv: list) -> dict:
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get('QT_QPA_PLATFORM', 'offscreen'))
+    # время ребенка сравнивается с часами родителя, perf_counter у разных процессов не сравним
+    env['BENCHMARK_SPAWN_TIME'] = repr(time.time())
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, '-c', CHILD_CODE.format(root=ROOT), *argv], env=env, cwd=ROOT,
+                            capture_output=True, text=True, check=True).stdout
+    total = time.perf_counter() - start
+    first_paint, in_process, modules = output.split()[:3]
+    return {'first_paint': float(first_paint), 'after_interpreter_start': float(in_process),
+            'process_wall': total, 'modules': int(modules)}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Measure time to the first editor window')
+    parser.add_argument('-n', '--runs', type=int, default=5)
+    parser.add_argument('--scene', action='store_true', help='measure the QGraphicsScene editor')
+    parser.add_argument('-o', '--output', help='write JSON results to this file instead of stdout')
+    args = parser.parse_args(argv)
+
+    child_argv = ['--scene'] if args.scene else []
+    run_once(child_argv)  # прогрев файлового кэша и __pycache__
+    runs = [run_once(child_argv) for _ in range(args.runs)]
+    result = {
+        'benchmark': 'startup',
+        'editor': 'scene' if args.scene else 'widgets',
+        'python': sys.version.split()[0],
+        'runs': runs,
+        'first_paint_median': statistics.median(i['first_paint'] for i in runs),
+        'first_paint_min': min(i['first_paint'] for i in runs),
+        'process_wall_median': statistics.median(i['process_wall'] for i in runs),
+    }
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, mode='w', encoding='utf-8') as file:
+            file.write(text)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""набор бенчмарков на синтетических схемах из generator.py: генерация кода, сохранение и загрузка,
+ раскладка блоков, пересчет стрелок и удаление. каждый повтор - новый процесс python с платформой Qt offscreen,
+ чтобы кэши одного повтора не ускоряли следующий
+
+пример: python benchmarks/suite.py --blocks 5000 --depth 3 --elifs 2 -n 5 -o suite.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import generator  # noqa: E402
+
+OPERATIONS = ('generate', 'convert_to_py_cold', 'convert_to_py_warm', 'fill_data_base', 'read_diagram',
+              'load_data_base', 'layout', 'recalculate_position', 'delete')
+
+
+def measure(timings: dict, name: str, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    timings[name] = time.perf_counter() - start
+    return result
+
+
+def is_root(block) -> bool:
+    node = block.node
+    return node.general_block is None and node.layer_up_block is None and node.layer_up_additional_block is None
+
+
+def run_child(args) -> dict:
+    """один повтор всех операций, выполняется в дочернем процессе"""
+    from PyQt5 import QtWidgets
+    import interpreter
+    import program
+    import save_diagram
+
+    app = QtWidgets.QApplication(sys.argv[:1])
+    timings = {}
+    diagram = measure(timings, 'generate', generator.generate_diagram, args.blocks, args.merge_chain, args.depth,
+                      args.elifs, args.seed)
+    nodes = list(diagram)
+    converter = interpreter.Interpreter()
+    code = measure(timings, 'convert_to_py_cold', converter.convert_to_py, nodes, False)
+    measure(timings, 'convert_to_py_warm', converter.convert_to_py, nodes, False)
+    compile(code, '<generated>', 'exec')
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_name = os.path.join(directory, 'diagram.sqlite')
+        measure(timings, 'fill_data_base', save_diagram.fill_data_base, db_name, nodes)
+        measure(timings, 'read_diagram', save_diagram.read_diagram, db_name)
+
+        window = program.Program()
+        app.processEvents()  # фоновые сервисы окна запускаются до замеров
+        window.clear_blocks()
+        window.blocks.extend(measure(timings, 'load_data_base', save_diagram.load_data_base, db_name, window))
+
+    def layout():
+        for block in window.blocks:
+            block.request_layout()
+        window.layout_engine.flush()
+
+    def delete_all():
+        window.delete_blocks([i for i in window.blocks if is_root(i)])
+        app.processEvents()
+
+    measure(timings, 'layout', layout)
+    measure(timings, 'recalculate_position', window.recalculate_position)
+    measure(timings, 'delete', delete_all)
+    window.close()
+    return {'nodes': len(nodes), 'lines_of_code': code.count('\n') + 1, 'timings': timings}
+
+
+def run_once(args) -> dict:
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get('QT_QPA_PLATFORM', 'offscreen'))
+    argv = ['--child', '--blocks', str(args.blocks), '--merge-chain', str(args.merge_chain), '--depth',
+            str(args.depth), '--elifs', str(args.elifs), '--seed', str(args.seed)]
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), *argv], env=env, cwd=ROOT,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().split('\n')[-1])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the editor on synthetic diagrams')
+    generator.add_arguments(parser)
+    parser.add_argument('-n', '--repeat', type=int, default=3, help='number of runs')
+    parser.add_argument('-o', '--output', help='write JSON results to this file instead of stdout')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_child(args)), flush=True)
+        return 0
+
+    runs = [run_once(args) for _ in range(args.repeat)]
+    operations = {}
+    for name in OPERATIONS:
+        values = [i['timings'][name] for i in runs]
+        operations[name] = {'seconds': values, 'median': statistics.median(values), 'min': min(values)}
+    result = {
+        'benchmark': 'suite',
+        'parameters': {'blocks': args.blocks, 'merge_chain': args.merge_chain, 'depth': args.depth,
+                       'elifs': args.elifs, 'seed': args.seed, 'repeat': args.repeat},
+        'nodes': runs[0]['nodes'],
+        'lines_of_code': runs[0]['lines_of_code'],
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'operations': operations,
+    }
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, mode='w', encoding='utf-8') as file:
+            file.write(text)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
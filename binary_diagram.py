@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""компактный двоичный формат блок-схем (.bdgm) для архивов и поставки большого числа схем
+
+файл состоит из заголовка, таблицы узлов по колонкам (каждая колонка - массив чисел фиксированной ширины),
+массива строк многострочных конструкций и таблицы строк для arg и data_type. файл открывается через mmap,
+колонки читаются как memoryview без разбора по строкам
+
+пример: python binary_diagram.py diagram.sqlite diagram.bdgm
+"""
+import array
+import mmap
+import struct
+import sys
+
+import diagram_model
+import save_diagram
+
+MAGIC = b'BDGM'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIII')  # magic, версия, резерв, число узлов, число строк конструкций, число строк
+ALIGNMENT = 8
+NONE = -1
+
+# колонки таблицы узлов в порядке записи: (имя, typecode array)
+COLUMNS = (('id', 'q'), ('type', 'B'), ('x', 'i'), ('y', 'i'), ('arg', 'i'), ('data_type', 'i'), ('child', 'i'),
+           ('layer_up_block', 'i'), ('layer_down_block', 'i'), ('general_block', 'i'),
+           ('layer_up_additional_block', 'i'), ('layer_down_additional_block', 'i'), ('lines_start', 'I'))
+TYPE_INDEXES = {name: index for index, name in enumerate(diagram_model.BLOCK_TYPES)}
+
+
+def _padding(size: int) -> int:
+    return -size % ALIGNMENT
+
+
+def _to_bytes(values: array.array) -> bytes:
+    if sys.byteorder == 'big':
+        values = array.array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class DiagramTable:
+    """открытый .bdgm файл. колонки узлов доступны как последовательности чисел, строки читаются по требованию"""
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self.node_count, lines_count, string_count = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC:
+            raise ValueError(f'{path} is not a diagram file')
+        if version != VERSION:
+            raise ValueError(f'unsupported diagram file version {version}')
+        view = memoryview(self.buffer)
+        self._views = [view]
+        offset = HEADER.size + _padding(HEADER.size)
+        self.columns = {}
+        for name, typecode in COLUMNS:
+            count = self.node_count + 1 if name == 'lines_start' else self.node_count
+            self.columns[name], offset = self._read_array(view, offset, typecode, count)
+        self.lines, offset = self._read_array(view, offset, 'i', lines_count)
+        self.string_offsets, offset = self._read_array(view, offset, 'I', string_count + 1)
+        self.strings_blob = view[offset:offset + (self.string_offsets[-1] if string_count else 0)]
+        self._views.append(self.strings_blob)
+
+    def _read_array(self, view: memoryview, offset: int, typecode: str, count: int):
+        size = array.array(typecode).itemsize * count
+        data = view[offset:offset + size]
+        self._views.append(data)
+        if sys.byteorder == 'big':
+            values = array.array(typecode, data.tobytes())
+            values.byteswap()
+        else:
+            values = data.cast(typecode)
+            self._views.append(values)
+        return values, offset + size + _padding(size)
+
+    def __len__(self):
+        return self.node_count
+
+    def get_string(self, index: int):
+        if index == NONE:
+            return None
+        return str(self.strings_blob[self.string_offsets[index]:self.string_offsets[index + 1]], 'utf-8')
+
+    @diagram_model.untracked()
+    def to_diagram(self) -> diagram_model.Diagram:
+        """создает узлы модели для всей таблицы"""
+        columns = self.columns
+        strings = [self.get_string(i) for i in range(len(self.string_offsets) - 1)]
+        nodes = []
+        for index in range(self.node_count):
+            data_type = columns['data_type'][index]
+            node = diagram_model.Node(diagram_model.BLOCK_TYPES[columns['type'][index]], columns['x'][index],
+                                      columns['y'][index], strings[columns['arg'][index]],
+                                      strings[data_type] if data_type != NONE else None)
+            node.id = columns['id'][index]
+            nodes.append(node)
+        for attr_name in save_diagram.LINK_ATTRIBUTES:
+            for node, link in zip(nodes, columns[attr_name]):
+                if link != NONE:
+                    setattr(node, attr_name, nodes[link])
+        lines_start = columns['lines_start']
+        for index, node in enumerate(nodes):
+            start, end = lines_start[index], lines_start[index + 1]
+            if start != end:
+                node.set_lines(nodes[i] for i in self.lines[start:end])
+        return diagram_model.Diagram(nodes)
+
+    def close(self):
+        for view in reversed(self._views):
+            view.release()
+        self.buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def write_binary(path: str, blocks_to_write):
+    """сохраняет блоки схемы (виджеты или узлы модели) в .bdgm файл"""
+    nodes = [diagram_model.as_node(i) for i in blocks_to_write]
+    diagram_model.assign_ids(nodes)
+    indexes = {node: index for index, node in enumerate(nodes)}
+    string_indexes = {}
+
+    def get_string_index(value: str) -> int:
+        if value is None:
+            return NONE
+        return string_indexes.setdefault(value, len(string_indexes))
+
+    columns = {name: array.array(typecode) for name, typecode in COLUMNS}
+    lines = array.array('i')
+    for node in nodes:
+        columns['id'].append(node.id)
+        columns['type'].append(TYPE_INDEXES[node.type_name])
+        columns['x'].append(node.x or 0)
+        columns['y'].append(node.y or 0)
+        columns['arg'].append(get_string_index(node.arg or ''))
+        columns['data_type'].append(get_string_index(node.data_type))
+        for attr_name in save_diagram.LINK_ATTRIBUTES:
+            link = getattr(node, attr_name)
+            columns[attr_name].append(indexes.get(link, NONE) if link is not None else NONE)
+        columns['lines_start'].append(len(lines))
+        if node.is_general_block:
+            lines.extend(indexes[i] for i in node.lines if i in indexes)
+    columns['lines_start'].append(len(lines))
+
+    encoded = [i.encode('utf-8') for i in string_indexes]
+    string_offsets = array.array('I', [0])
+    for value in encoded:
+        string_offsets.append(string_offsets[-1] + len(value))
+
+    with open(path, 'wb') as file:
+        header = HEADER.pack(MAGIC, VERSION, 0, len(nodes), len(lines), len(encoded))
+        file.write(header + bytes(_padding(len(header))))
+        for values in [*(columns[name] for name, _ in COLUMNS), lines, string_offsets]:
+            data = _to_bytes(values)
+            file.write(data + bytes(_padding(len(data))))
+        file.write(b''.join(encoded))
+
+
+def read_binary(path: str) -> diagram_model.Diagram:
+    """читает схему из .bdgm файла в модель"""
+    with DiagramTable(path) as table:
+        return table.to_diagram()
+
+
+def sqlite_to_binary(db_name: str, path: str):
+    write_binary(path, save_diagram.read_diagram(db_name))
+
+
+def binary_to_sqlite(path: str, db_name: str):
+    save_diagram.fill_data_base(db_name, read_binary(path))
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        print('usage: python binary_diagram.py SOURCE DESTINATION (.sqlite -> .bdgm or .bdgm -> .sqlite)',
+              file=sys.stderr)
+        return 1
+    source, destination = argv
+    if source.endswith('.bdgm'):
+        binary_to_sqlite(source, destination)
+    else:
+        sqlite_to_binary(source, destination)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
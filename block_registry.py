@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+import collections
+
+import diagram_model
+
+
+class BlockRegistry:
+    """блоки окна по постоянному id узла с индексом по типу блока. обход идет в порядке добавления, как у
+     списка, а поиск, проверка принадлежности и удаление стоят O(1). входящие связи child хранятся в самих
+     узлах (Node.incoming), поэтому их чистка при удалении стоит O(числа связей)"""
+
+    def __init__(self, blocks=()):
+        self._by_id = {}
+        self._by_type = collections.defaultdict(dict)  # тип блока -> {id: блок}, dict как упорядоченное множество
+        self.next_id = 1
+        self.extend(blocks)
+
+    def add(self, block):
+        """добавляет блок. узлу без id выдается новый, id удаленных блоков повторно не выдаются"""
+        node = block.node
+        if node.id is None:
+            node.id = self.next_id
+        elif node.id in self._by_id and self._by_id[node.id] is not block:
+            raise ValueError(f'block id {node.id} is already registered')
+        self.next_id = max(self.next_id, node.id + 1)
+        self._by_id[node.id] = block
+        self._by_type[node.type_name][node.id] = block
+
+    def extend(self, blocks):
+        for block in blocks:
+            self.add(block)
+
+    def remove(self, block) -> bool:
+        """убирает блок, возвращает False, если его не было"""
+        node = block.node
+        if node.id is None or self._by_id.get(node.id) is not block:
+            return False
+        del self._by_id[node.id]
+        del self._by_type[node.type_name][node.id]
+        return True
+
+    def reserve(self, ids):
+        """не выдает новым блокам эти id, например id блоков файла, которые еще загружаются"""
+        self.next_id = max([self.next_id, *(i + 1 for i in ids if i is not None)])
+
+    def remove_many(self, blocks) -> list:
+        """убирает блоки одним проходом, возвращает те, что были в реестре"""
+        return [block for block in blocks if self.remove(block)]
+
+    def clear(self):
+        self._by_id.clear()
+        self._by_type.clear()
+
+    def get(self, block_id: int):
+        return self._by_id.get(block_id)
+
+    def of_type(self, type_name: str) -> list:
+        return list(self._by_type.get(type_name, {}).values())
+
+    def incoming(self, block) -> list:
+        """блоки, у которых child - этот блок"""
+        return [node.view for node in block.node.incoming if node.view is not None]
+
+    @property
+    def nodes(self) -> list:
+        return [block.node for block in self._by_id.values()]
+
+    def copy(self) -> list:
+        return list(self._by_id.values())
+
+    def __contains__(self, block) -> bool:
+        node = getattr(block, 'node', None)
+        return isinstance(node, diagram_model.Node) and node.id is not None and self._by_id.get(node.id) is block
+
+    def __iter__(self):
+        return iter(list(self._by_id.values()))
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __repr__(self):
+        return f'BlockRegistry({len(self)} blocks)'
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+import diagram_model
+from profiler import profiled
+
+
+class BlockTransaction:
+    """пакетное удаление блоков окна. delete и clear только собирают узлы, а commit применяет все сразу: один раз
+     отвязывает удаляемые узлы от оставшихся, одним вызовом обновляет реестр и один раз раскладывает затронутые
+     конструкции. при исключении внутри with ничего не меняется
+
+    with program.transaction() as transaction:
+        transaction.delete(block)
+    """
+
+    def __init__(self, program):
+        self.program = program
+        self.nodes = {}  # удаляемые узлы, dict как упорядоченное множество
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.nodes.clear()
+        return False
+
+    def delete(self, block):
+        """добавляет в удаление блок вместе со смердженными блоками, строками и, если блок - первая конструкция
+         цепочки if/elif/else, со всеми дополнительными конструкциями цепочки"""
+        stack = [block.node]
+        while stack:
+            node = stack.pop()
+            if node in self.nodes:
+                continue
+            self.nodes[node] = None
+            if node.layer_down_block is not None:
+                stack.append(node.layer_down_block)
+            if node.is_general_block:
+                stack.extend(node.lines)
+            if node.layer_up_additional_block is None:
+                current_node = node.layer_down_additional_block
+                while current_node is not None:
+                    stack.append(current_node)
+                    current_node = current_node.layer_down_additional_block
+
+    def clear(self):
+        """добавляет в удаление все блоки окна"""
+        self.nodes.update((block.node, None) for block in self.program.blocks)
+
+    def detach(self, node: diagram_model.Node, affected: dict):
+        """отвязывает удаляемый узел от оставшихся, конструкции оставшихся узлов попадают в affected"""
+        nodes = self.nodes
+        up_node = node.layer_up_block
+        if up_node is not None and up_node not in nodes:
+            up_node.layer_down_block = None
+            affected[up_node] = None
+        general_node = node.general_block
+        if general_node is not None and general_node not in nodes:
+            general_node.remove_line(node)
+            affected[general_node] = None
+        up_node = node.layer_up_additional_block
+        if up_node is not None and up_node not in nodes:
+            # удаляемые конструкции из середины цепочки if/elif/else вырезаются, остаток цепочки сшивается
+            down_node = node.layer_down_additional_block
+            while down_node is not None and down_node in nodes:
+                down_node = down_node.layer_down_additional_block
+            up_node.layer_down_additional_block = down_node
+            if down_node is not None:
+                down_node.layer_up_additional_block = up_node
+            affected[up_node] = None
+        for source in list(node.incoming):
+            if source not in nodes:
+                source.child = None
+                self.program.set_arrow(source)
+        node.child = None
+
+    @profiled()
+    def commit(self):
+        program = self.program
+        nodes, self.nodes = self.nodes, {}
+        if not nodes:
+            return
+        affected = {}
+        program.setUpdatesEnabled(False)
+        try:
+            for node in nodes:
+                program.layout_engine.cancel(node)
+                self.detach(node, affected)
+            removed = program.blocks.remove_many(node.view for node in nodes)
+            if not program.blocks:
+                program.arrows = {}
+            for block in removed:
+                if program.autosaver is not None:
+                    program.autosaver.mark_deleted(block.node)
+                if program.blocks:
+                    program.set_arrow(block.node)
+                block.removeEventFilter(program)
+                block.hide()
+                block.deleteLater()
+            for node in affected:
+                program.layout_engine.schedule(node)
+            program.layout_engine.flush()
+            program.schedule_validation()
+        finally:
+            program.setUpdatesEnabled(True)
@@ -1,80 +1,58 @@
-import builtins
-import inspect
-
-
 from PyQt5 import QtCore, QtGui, QtWidgets
+import render_cache
 from base_block import BaseBlock, BaseGeneralBlock, BaseGeneralBlockWithAdditionalBlocks
+from symbol_catalog import SymbolKind
+from symbol_dialog import SymbolDialog
 
 class StartBlock(BaseBlock):
     """стартовый блок, обязательно должен быть в программе"""
 
     def __init__(self, parent):
-        super(StartBlock, self).__init__(parent, QtGui.QPixmap('./pictures/start.png'))
+        super(StartBlock, self).__init__(parent, render_cache.get_pixmap('pictures/start.png'))
 
     def actions_menu(self) -> None:
         menu = QtWidgets.QMenu(self)
         menu.addActions([self.set_connection_action])
         menu.exec_(QtGui.QCursor.pos())
 
-    def get_func(self) -> str:
-        return ''
-
 
 class EndBlock(BaseBlock):
     """конечный блок, обязательно должен быть в программе"""
 
     def __init__(self, parent):
-        super(EndBlock, self).__init__(parent, QtGui.QPixmap('./pictures/end.png'))
+        super(EndBlock, self).__init__(parent, render_cache.get_pixmap('pictures/end.png'))
 
     def actions_menu(self) -> None:
         pass
 
-    def get_func(self) -> str:
-        return ''
-
 
 class MethodBlock(BaseBlock):
     """блок для проведения операций над переменными"""
 
     def __init__(self, parent):
-        super(MethodBlock, self).__init__(parent, QtGui.QPixmap('pictures/method.png'))
+        super(MethodBlock, self).__init__(parent, render_cache.get_pixmap('pictures/method.png'))
         self.is_python_function = True
 
-    def get_self_func(self) -> str:
-        return self.arg
-
     def set_argument(self):
-        data_to_dialog = {'str': tuple(dir(str)), 'list': tuple(dir(list)),
-                          'dict': tuple(dir(dict)), 'set': tuple(dir(set))}
-        method_type, ok = QtWidgets.QInputDialog.getItem(self, 'Choose method', 'method type:',
-                                                         data_to_dialog.keys())
-        if ok:
-            try:
-                new_arg, ok2 = QtWidgets.QInputDialog.getItem(self, 'Choose method', 'method name:',
-                                                              reversed(data_to_dialog[method_type]))
-                self.arg = "." + new_arg + "()"
-                self.arg_label.setText(self.arg)
-                self.resize_block()
-                self.move_related_blocks()
-            except KeyError:
-                self.parent.status_bar.showMessage('Incorrect Block type')
+        symbol = SymbolDialog.get_symbol(self, 'Choose method', SymbolKind.METHOD)
+        if symbol is not None:
+            self.arg = "." + symbol.name + "()"
+            self.arg_label.setText(self.arg)
+            self.request_layout()
 
 
 class VariableBlock(BaseBlock):
     """блок, который обозначает переменную"""
 
     def __init__(self, parent):
-        super(VariableBlock, self).__init__(parent, QtGui.QPixmap('./pictures/variable.png'))
-
-    def get_self_func(self) -> str:
-        return self.arg + ' '
+        super(VariableBlock, self).__init__(parent, render_cache.get_pixmap('pictures/variable.png'))
 
 
 class OperatorBlock(BaseBlock):
     """блок, который обозначает действия над данными"""
 
     def __init__(self, parent):
-        super(OperatorBlock, self).__init__(parent, QtGui.QPixmap('./pictures/operator.png'))
+        super(OperatorBlock, self).__init__(parent, render_cache.get_pixmap('pictures/operator.png'))
 
     def set_argument(self):
         data_to_dialog = ['+', '-', '*', '/', '//', '%', '**']
@@ -83,19 +61,22 @@ class OperatorBlock(BaseBlock):
         if ok:
             self.arg = new_arg
             self.arg_label.setText(self.arg)
-            self.resize_block()
-            self.move_related_blocks()
-
-    def get_self_func(self) -> str:
-        return ' ' + self.arg + ' '
+            self.request_layout()
 
 
 class DataBlock(BaseBlock):
     """блок, который обозначает просто кусок данных, не присвоенных переменной"""
 
     def __init__(self, parent):
-        super(DataBlock, self).__init__(parent, QtGui.QPixmap('./pictures/data.png'))
-        self.data_type = None
+        super(DataBlock, self).__init__(parent, render_cache.get_pixmap('pictures/data.png'))
+
+    @property
+    def data_type(self) -> str:
+        return self.node.data_type
+
+    @data_type.setter
+    def data_type(self, value: str):
+        self.node.data_type = value
 
     def set_argument(self):
         data_to_dialog = ['str', 'int', 'float', 'bool', 'lict', 'tuple', 'dict', 'set']
@@ -109,61 +90,38 @@ class DataBlock(BaseBlock):
                 self.data_type = data_type
                 self.arg = new_arg
                 self.arg_label.setText(self.arg)
-                self.resize_block()
-                self.move_related_blocks()
-
-    def get_self_func(self) -> str:
-        if self.data_type is not None:
-            return self.data_type + '("' + self.arg + '")'
-        return ''
+                self.request_layout()
 
 
 class FunctionBlock(BaseBlock):
     def __init__(self, parent):
-        super(FunctionBlock, self).__init__(parent, QtGui.QPixmap('pictures/function.png'))
+        super(FunctionBlock, self).__init__(parent, render_cache.get_pixmap('pictures/function.png'))
         self.is_python_function = True
 
     def set_argument(self):
-        data_to_dialog = [name for name, func in sorted(vars(builtins).items())
-                          if ('attr' not in name and 'is' not in name and '__' not in name) and
-                          inspect.isbuiltin(func) or inspect.isfunction(func)]
-        new_arg, ok = QtWidgets.QInputDialog.getItem(self, 'Choose function', 'function:', data_to_dialog)
-        if ok:
-            if new_arg not in data_to_dialog:
-                self.parent.status_bar.showMessage('Incorrect Block type')
-                return
-            self.arg = new_arg + '()'
+        symbol = SymbolDialog.get_symbol(self, 'Choose function', SymbolKind.FUNCTION)
+        if symbol is not None:
+            self.arg = symbol.full_name + '()'
             self.arg_label.setText(self.arg)
-            self.resize_block()
-            self.move_related_blocks()
-
-    def get_self_func(self) -> str:
-        return self.arg
+            self.request_layout()
 
 
 class DataTypeBlock(BaseBlock):
     def __init__(self, parent):
-        super(DataTypeBlock, self).__init__(parent, QtGui.QPixmap('./pictures/output.png'))
+        super(DataTypeBlock, self).__init__(parent, render_cache.get_pixmap('pictures/output.png'))
         self.is_python_function = True
 
     def set_argument(self):
-        data_to_dialog = ['bool', 'bytearray', 'bytes', 'classmethod', 'complex', 'dict', 'enumerate', 'float',
-                          'frozenset', 'int', 'list', 'memoryview', 'object', 'property', 'range', 'reversed',
-                          'set', 'slice', 'staticmethod', 'str', 'super', 'tuple', 'type']
-        new_arg, ok = QtWidgets.QInputDialog.getItem(self, 'Choose data type', 'data type:', data_to_dialog)
-        if ok:
-            self.arg = new_arg + '()'
+        symbol = SymbolDialog.get_symbol(self, 'Choose data type', SymbolKind.TYPE)
+        if symbol is not None:
+            self.arg = symbol.name + '()'
             self.arg_label.setText(self.arg)
-            self.resize_block()
-            self.move_related_blocks()
-
-    def get_self_func(self) -> str:
-        return self.arg
+            self.request_layout()
 
 
 class LogicalBlock(BaseBlock):
     def __init__(self, parent):
-        super(LogicalBlock, self).__init__(parent, QtGui.QPixmap('./pictures/operator.png'))
+        super(LogicalBlock, self).__init__(parent, render_cache.get_pixmap('pictures/operator.png'))
 
     def set_argument(self):
         data_to_dialog = ['==', '!=', '>', '<', '>=', '<=', 'not', 'in']
@@ -171,11 +129,7 @@ class LogicalBlock(BaseBlock):
         if ok:
             self.arg = new_arg + ' '
             self.arg_label.setText(self.arg)
-            self.resize_block()
-            self.move_related_blocks()
-
-    def get_self_func(self) -> str:
-        return self.arg
+            self.request_layout()
 
 
 class BaseLoopBlock(BaseGeneralBlock):
@@ -185,7 +139,7 @@ class BaseLoopBlock(BaseGeneralBlock):
 
 class ForLoopBlock(BaseLoopBlock):
     def __init__(self, parent):
-        super(ForLoopBlock, self).__init__(parent, QtGui.QPixmap('./pictures/for.png'), minimum_width=53)
+        super(ForLoopBlock, self).__init__(parent, render_cache.get_pixmap('pictures/for.png'), minimum_width=53)
         self.arg = 'for _ ' + 'in '
         self.arg_label.setText(self.arg)
 
@@ -195,16 +149,12 @@ class ForLoopBlock(BaseLoopBlock):
             return
         self.arg = 'for ' + new_arg + ' in '
         self.arg_label.setText(self.arg)
-        self.resize_block()
-        self.move_related_blocks()
-
-    def get_self_func(self) -> str:
-        return self.arg
+        self.request_layout()
 
 
 class WhileLoopBlock(BaseLoopBlock):
     def __init__(self, parent):
-        super(WhileLoopBlock, self).__init__(parent, QtGui.QPixmap('./pictures/while.png'))
+        super(WhileLoopBlock, self).__init__(parent, render_cache.get_pixmap('pictures/while.png'))
         self.arg = 'while '
         self.arg_label.setText(self.arg)
 
@@ -214,13 +164,10 @@ class WhileLoopBlock(BaseLoopBlock):
         menu.addActions([self.delete_action, self.set_connection_action, self.merge_block_action, self.add_line_action])
         menu.exec_(QtGui.QCursor.pos())
 
-    def get_self_func(self) -> str:
-        return self.arg
-
 
 class IfBlock(BaseGeneralBlockWithAdditionalBlocks):
     def __init__(self, parent):
-        super(IfBlock, self).__init__(parent, QtGui.QPixmap('./pictures/if.png'))
+        super(IfBlock, self).__init__(parent, render_cache.get_pixmap('pictures/if.png'))
         self.arg = 'if '
         self.arg_label.setText(self.arg)
 
@@ -230,13 +177,10 @@ class IfBlock(BaseGeneralBlockWithAdditionalBlocks):
             self.layer_down_additional_block.delete()
             self.parent.status_bar.showMessage("Can't add another one Else")
 
-    def get_self_func(self) -> str:
-        return self.arg
-
 
 class ElifBlock(BaseGeneralBlockWithAdditionalBlocks):
     def __init__(self, parent):
-        super(ElifBlock, self).__init__(parent, QtGui.QPixmap('./pictures/if.png'))
+        super(ElifBlock, self).__init__(parent, render_cache.get_pixmap('pictures/if.png'))
         self.arg = 'elif '
         self.arg_label.setText(self.arg)
 
@@ -246,13 +190,10 @@ class ElifBlock(BaseGeneralBlockWithAdditionalBlocks):
             self.layer_down_additional_block.delete()
             self.parent.status_bar.showMessage("Can't add another one Else")
 
-    def get_self_func(self) -> str:
-        return self.arg
-
 
 class ElseBlock(BaseGeneralBlockWithAdditionalBlocks):
     def __init__(self, parent):
-        super(ElseBlock, self).__init__(parent, QtGui.QPixmap('./pictures/if.png'))
+        super(ElseBlock, self).__init__(parent, render_cache.get_pixmap('pictures/if.png'))
         self.arg = 'else '
         self.arg_label.setText(self.arg)
 
@@ -261,6 +202,3 @@ class ElseBlock(BaseGeneralBlockWithAdditionalBlocks):
         menu = QtWidgets.QMenu(self)
         menu.addActions([self.delete_action, self.set_connection_action, self.add_line_action])
         menu.exec_(QtGui.QCursor.pos())
-
-    def get_self_func(self) -> str:
-        return self.arg
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""пакетная компиляция .sqlite и .bdgm блок-схем в .py файлы без запуска Qt
+
+пример: python compiler.py diagrams/ other/*.sqlite -o build/ -j 8
+"""
+import argparse
+import collections
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import binary_diagram
+import interpreter
+import save_diagram
+
+DIAGRAM_EXTENSIONS = ('.sqlite', '.bdgm')
+
+
+def find_diagrams(patterns) -> list:
+    """раскрывает директории и glob-шаблоны в список файлов блок-схем"""
+    result = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for extension in DIAGRAM_EXTENSIONS:
+                result.extend(sorted(glob.glob(os.path.join(pattern, '**', '*' + extension), recursive=True)))
+        else:
+            result.extend(sorted(glob.glob(pattern, recursive=True)))
+    return list(dict.fromkeys(result))
+
+
+def get_output_path(diagram_path: str, output_dir: str = None) -> str:
+    name = os.path.splitext(os.path.basename(diagram_path))[0] + '.py'
+    return os.path.join(output_dir or os.path.dirname(diagram_path), name)
+
+
+def find_collisions(diagram_paths, output_paths) -> dict:
+    """{схема: ошибка} для схем, которые записались бы в один и тот же .py файл, например x.sqlite и x.bdgm
+     или a/x.sqlite и b/x.sqlite при общем -o"""
+    owners = collections.defaultdict(list)
+    for diagram_path, output_path in zip(diagram_paths, output_paths):
+        owners[os.path.normcase(os.path.abspath(output_path))].append(diagram_path)
+    result = {}
+    for output_path, paths in owners.items():
+        if len(paths) > 1:
+            for path in paths:
+                others = ', '.join(i for i in paths if i != path)
+                result[path] = f'output file {output_path} is also produced by {others}'
+    return result
+
+
+def read_any(diagram_path: str):
+    if diagram_path.endswith('.bdgm'):
+        return binary_diagram.read_binary(diagram_path)
+    return save_diagram.read_diagram(diagram_path)
+
+
+def compile_diagram(diagram_path: str, output_path: str) -> tuple:
+    """компилирует одну схему, возвращает (путь, время в секундах, ошибка или None)"""
+    start = time.perf_counter()
+    try:
+        program = interpreter.Interpreter().convert_to_py(read_any(diagram_path), console=False)
+        if not program:
+            raise ValueError('diagram has no StartBlock or EndBlock')
+        with open(output_path, mode='w', encoding='utf-8') as file:
+            file.write(program)
+    except Exception as error:
+        message = f'{error.__class__.__name__}: {error}' if str(error) else error.__class__.__name__
+        return diagram_path, time.perf_counter() - start, message
+    return diagram_path, time.perf_counter() - start, None
+
+
+def compile_all(diagram_paths, output_dir: str = None, workers: int = None):
+    """компилирует схемы в пуле процессов, отдает результаты в порядке входных файлов"""
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    output_paths = [get_output_path(path, output_dir) for path in diagram_paths]
+    collisions = find_collisions(diagram_paths, output_paths)
+    tasks = [(path, output_path) for path, output_path in zip(diagram_paths, output_paths) if path not in collisions]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(compile_diagram, [i[0] for i in tasks], [i[1] for i in tasks], chunksize=4)
+        for path in diagram_paths:
+            if path in collisions:
+                yield path, 0.0, collisions[path]
+            else:
+                yield next(results)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Compile .sqlite block diagrams into python files')
+    parser.add_argument('paths', nargs='+', help='diagram files, directories or glob patterns')
+    parser.add_argument('-o', '--output-dir', help='directory for generated files (default: next to diagram)')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='number of worker processes (default: all cores)')
+    args = parser.parse_args(argv)
+
+    diagram_paths = find_diagrams(args.paths)
+    if not diagram_paths:
+        print('no diagrams found', file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    failed = 0
+    for path, elapsed, error in compile_all(diagram_paths, args.output_dir, args.jobs):
+        if error is None:
+            print(f'ok     {elapsed * 1000:8.1f} ms  {path}')
+        else:
+            failed += 1
+            print(f'failed {elapsed * 1000:8.1f} ms  {path}  {error}')
+    print(f'{len(diagram_paths) - failed} compiled, {failed} failed in {time.perf_counter() - start:.2f} s')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
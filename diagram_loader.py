@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""постепенная загрузка больших блок-схем: сначала создаются блоки видимой области, остальные - порциями между
+ итерациями цикла событий, поэтому окно отвечает, пока загружается файл"""
+import collections
+
+from PyQt5 import QtCore
+
+import blocks
+import diagram_model
+import save_diagram
+
+
+def get_root(node: diagram_model.Node) -> diagram_model.Node:
+    return node.root
+
+
+def get_depth(node: diagram_model.Node) -> int:
+    depth = 0
+    while node.parent_node is not None:
+        node = node.parent_node
+        depth += 1
+    return depth
+
+
+def group_constructs(nodes) -> dict:
+    """разбивает узлы на конструкции: виджеты одной конструкции размещаются относительно друг друга, поэтому
+     создаются вместе. в каждой конструкции узлы упорядочены от корня вглубь"""
+    groups = collections.defaultdict(list)
+    for node in nodes:
+        groups[get_root(node)].append(node)
+    for group in groups.values():
+        group.sort(key=get_depth)
+    return groups
+
+
+class DiagramLoader(QtCore.QObject):
+    """создает виджеты для схемы из файла: сначала конструкции, попадающие в visible_rect, потом остальные"""
+    chunk_loaded = QtCore.pyqtSignal(list)
+    progress = QtCore.pyqtSignal(int, int)
+    finished = QtCore.pyqtSignal()
+    CHUNK_SIZE = 200  # сколько блоков создается за одну итерацию цикла событий
+
+    def __init__(self, db_name: str, blocks_parent, visible_rect: QtCore.QRect, parent=None):
+        super(DiagramLoader, self).__init__(parent)
+        self.db_name = db_name
+        self.blocks_parent = blocks_parent
+        self.visible_rect = visible_rect
+        self.groups = collections.deque()
+        self.total = 0
+        self.loaded = 0
+
+    def start(self):
+        diagram = save_diagram.read_diagram(self.db_name)
+        rect = self.visible_rect
+        visible_ids = set(save_diagram.query_region(self.db_name, rect.left(), rect.top(), rect.right(),
+                                                    rect.bottom()))
+        # блоки, добавленные во время загрузки, не должны занять id еще не созданных блоков файла
+        self.blocks_parent.blocks.reserve(node.id for node in diagram)
+        groups = group_constructs(diagram)
+        visible_roots = {get_root(node) for node in diagram if node.id in visible_ids}
+        self.groups.extend(group for root, group in groups.items() if root in visible_roots)
+        self.groups.extend(group for root, group in groups.items() if root not in visible_roots)
+        self.total = len(diagram)
+        self.loaded = 0
+        self.load_chunk()
+
+    def load_chunk(self):
+        """создает очередную порцию конструкций и планирует следующую"""
+        result_blocks = []
+        while self.groups and len(result_blocks) < self.CHUNK_SIZE:
+            result_blocks.extend(self.create_construct(self.groups.popleft()))
+        self.loaded += len(result_blocks)
+        self.chunk_loaded.emit(result_blocks)
+        self.progress.emit(self.loaded, self.total)
+        if self.groups:
+            QtCore.QTimer.singleShot(0, self.load_chunk)
+        else:
+            self.finished.emit()
+
+    def create_construct(self, group: list) -> list:
+        result_blocks = []
+        # виджет создается со своим временным узлом, который сразу заменяется узлом из файла. автосохранение
+        # не должно записать временные узлы в файл как новые блоки
+        with diagram_model.untracked():
+            for node in group:
+                new_block = getattr(blocks, node.type_name)(self.blocks_parent)
+                new_block.attach_node(node)
+                result_blocks.append(new_block)
+        self.blocks_parent.layout_engine.layout(group[0])
+        return result_blocks
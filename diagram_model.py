@@ -0,0 +1,591 @@
+# -*- coding: utf-8 -*-
+"""модель блок-схемы, не зависящая от Qt: узлы и типизированные связи между ними"""
+import ast
+import contextlib
+from enum import Enum
+
+from exceptions import BlockSyntaxError
+
+
+# порядок совпадает с Id в таблице BlockTypes уже сохраненных файлов
+BLOCK_TYPES = ('BaseBlock', 'BaseGeneralBlock', 'BaseGeneralBlockWithAdditionalBlocks', 'BaseLoopBlock', 'DataBlock',
+               'DataTypeBlock', 'ElifBlock', 'ElseBlock', 'EndBlock', 'ForLoopBlock', 'FunctionBlock', 'IfBlock',
+               'LogicalBlock', 'MethodBlock', 'OperatorBlock', 'StartBlock', 'VariableBlock', 'WhileLoopBlock')
+
+ADDITIONAL_BLOCK_TYPES = frozenset(('BaseGeneralBlockWithAdditionalBlocks', 'IfBlock', 'ElifBlock', 'ElseBlock'))
+GENERAL_BLOCK_TYPES = frozenset(('BaseGeneralBlock', 'BaseLoopBlock', 'ForLoopBlock', 'WhileLoopBlock')) | \
+    ADDITIONAL_BLOCK_TYPES
+PYTHON_FUNCTION_TYPES = frozenset(('MethodBlock', 'FunctionBlock', 'DataTypeBlock'))
+
+DEFAULT_ARGS = {'ForLoopBlock': 'for _ in ', 'WhileLoopBlock': 'while ', 'IfBlock': 'if ', 'ElifBlock': 'elif ',
+                'ElseBlock': 'else '}
+
+
+def _data_func(node) -> str:
+    if node.data_type is not None:
+        return node.data_type + '("' + node.arg + '")'
+    return ''
+
+
+SELF_FUNCS = {
+    'MethodBlock': lambda node: node.arg,
+    'VariableBlock': lambda node: node.arg + ' ',
+    'OperatorBlock': lambda node: ' ' + node.arg + ' ',
+    'DataBlock': _data_func,
+    'FunctionBlock': lambda node: node.arg,
+    'DataTypeBlock': lambda node: node.arg,
+    'LogicalBlock': lambda node: node.arg,
+    'ForLoopBlock': lambda node: node.arg,
+    'WhileLoopBlock': lambda node: node.arg,
+    'IfBlock': lambda node: node.arg,
+    'ElifBlock': lambda node: node.arg,
+    'ElseBlock': lambda node: node.arg,
+}
+
+
+class EdgeType(Enum):
+    """типы связей между узлами"""
+    CHILD = 1  # следующий блок программы
+    MERGE = 2  # смердженный блок (layer_down_block)
+    LINE = 3  # строка многострочной конструкции
+    ADDITIONAL = 4  # дополнительная конструкция (layer_down_additional_block)
+
+
+@contextlib.contextmanager
+def untracked():
+    """отключает Node.on_change внутри with: узлы, созданные при чтении файла или как временные узлы виджетов,
+     не должны попасть в автосохранение как измененные"""
+    on_change, Node.on_change = Node.on_change, None
+    try:
+        yield
+    finally:
+        Node.on_change = on_change
+
+
+class Node:
+    """узел блок-схемы. хранит аргумент, координаты и связи блока, а также закэшированные ast-инструкции блока
+     и результаты запросов к структуре схемы"""
+    __slots__ = ('type_name', '_x', '_y', '_arg', '_data_type', '_child', 'incoming', '_layer_up_block',
+                 '_layer_down_block', '_general_block', '_lines', '_layer_up_additional_block',
+                 '_layer_down_additional_block', 'view', 'id', '_statements', '_source', '_names', '_dirty',
+                 '_topology_version', '_topology_cache', '_links')
+    # увеличивается при любом изменении связей между узлами, делая недействительными кэши запросов к структуре
+    topology_version = 0
+    # вызывается с узлом при каждом изменении его сохраняемых данных, см. save_diagram.IncrementalSaver
+    on_change = None
+
+    def __init__(self, type_name: str, x: int = 0, y: int = 0, arg: str = None, data_type: str = None):
+        self._statements: list = None
+        self._source: str = None
+        self._names: tuple = None
+        self._links: tuple = None
+        self._dirty = True
+        self._topology_version = -1
+        self._topology_cache = {}
+        self.type_name = type_name
+        self._x, self._y = x, y
+        self._arg = DEFAULT_ARGS.get(type_name, '') if arg is None else arg
+        self._data_type = data_type
+        self._child: Node = None
+        self.incoming = set()  # узлы, у которых child - этот узел
+        self._layer_up_block: Node = None
+        self._layer_down_block: Node = None
+        self._general_block: Node = None
+        self._lines = []
+        self._layer_up_additional_block: Node = None
+        self._layer_down_additional_block: Node = None
+        self.view = None
+        self.id: int = None  # постоянный номер узла в файле схемы, назначается при первом сохранении
+        self.changed()
+
+    def __repr__(self):
+        return f'Node({self.type_name!r}, {self.arg!r})'
+
+    def invalidate(self):
+        """сбрасывает закэшированные инструкции, код и имена узла и всех узлов, в код которых он входит"""
+        node = self
+        while node is not None and not node._dirty:
+            node._dirty = True
+            node._statements = None
+            node._source = None
+            node._names = None
+            node = node.parent_node
+
+    @property
+    def parent_node(self):
+        """узел, в код которого входит код этого узла"""
+        if self._layer_up_block is not None:
+            return self._layer_up_block
+        if self._layer_up_additional_block is not None:
+            return self._layer_up_additional_block
+        return self._general_block
+
+    def changed(self):
+        self._links = None
+        if Node.on_change is not None:
+            Node.on_change(self)
+
+    @staticmethod
+    def topology_changed():
+        Node.topology_version += 1
+
+    def _topology(self) -> dict:
+        """кэш запросов к структуре, действительный для текущей версии связей"""
+        if self._topology_version != Node.topology_version:
+            self._topology_version = Node.topology_version
+            self._topology_cache = {}
+        return self._topology_cache
+
+    def _find_chain_end(self, key: str, next_attr: str):
+        """последний узел цепочки по связи next_attr, результат запоминается для всех пройденных узлов"""
+        path = []
+        node = self
+        while True:
+            cache = node._topology()
+            if key in cache:
+                result = cache[key]
+                break
+            path.append(node)
+            next_node = getattr(node, next_attr)
+            if next_node is None:
+                result = node
+                break
+            node = next_node
+        for node in path:
+            node._topology_cache[key] = result
+        return result
+
+    def _count_chain(self, key: str, next_attr: str) -> int:
+        """число узлов цепочки по связи next_attr после этого узла, результат запоминается для всех пройденных"""
+        path = []
+        node = self
+        depth = -1
+        while node is not None:
+            cache = node._topology()
+            if key in cache:
+                depth = cache[key]
+                break
+            path.append(node)
+            node = getattr(node, next_attr)
+        for node in reversed(path):
+            depth += 1
+            node._topology_cache[key] = depth
+        return depth
+
+    @property
+    def x(self) -> int:
+        return self._x
+
+    @x.setter
+    def x(self, value: int):
+        if value != self._x:
+            self._x = value
+            self.changed()
+
+    @property
+    def y(self) -> int:
+        return self._y
+
+    @y.setter
+    def y(self, value: int):
+        if value != self._y:
+            self._y = value
+            self.changed()
+
+    @property
+    def arg(self) -> str:
+        return self._arg
+
+    @arg.setter
+    def arg(self, value: str):
+        self._arg = value
+        self.invalidate()
+        self.changed()
+
+    @property
+    def data_type(self) -> str:
+        return self._data_type
+
+    @data_type.setter
+    def data_type(self, value: str):
+        self._data_type = value
+        self.invalidate()
+        self.changed()
+
+    @property
+    def child(self):
+        return self._child
+
+    @child.setter
+    def child(self, value):
+        if self._child is not None:
+            self._child.incoming.discard(self)
+        self._child = value
+        if value is not None:
+            value.incoming.add(self)
+        self.changed()
+
+    @property
+    def layer_up_block(self):
+        return self._layer_up_block
+
+    @layer_up_block.setter
+    def layer_up_block(self, value):
+        self._layer_up_block = value
+        Node.topology_changed()
+        self.changed()
+
+    @property
+    def layer_down_block(self):
+        return self._layer_down_block
+
+    @layer_down_block.setter
+    def layer_down_block(self, value):
+        self._layer_down_block = value
+        Node.topology_changed()
+        self.invalidate()
+        self.changed()
+
+    @property
+    def general_block(self):
+        return self._general_block
+
+    @general_block.setter
+    def general_block(self, value):
+        if self._general_block is not None:
+            self._general_block.invalidate()
+            self._general_block.changed()
+        self._general_block = value
+        Node.topology_changed()
+        if value is not None:
+            value.invalidate()
+            value.changed()
+        self.changed()
+
+    @property
+    def layer_up_additional_block(self):
+        return self._layer_up_additional_block
+
+    @layer_up_additional_block.setter
+    def layer_up_additional_block(self, value):
+        self._layer_up_additional_block = value
+        Node.topology_changed()
+        self._additional_chain_changed()
+
+    @property
+    def layer_down_additional_block(self):
+        return self._layer_down_additional_block
+
+    @layer_down_additional_block.setter
+    def layer_down_additional_block(self, value):
+        self._layer_down_additional_block = value
+        Node.topology_changed()
+        self.invalidate()
+        self._additional_chain_changed()
+
+    def _additional_chain_changed(self):
+        # сохраняемые строки general_block включают всю цепочку дополнительных блоков
+        self.changed()
+        if self._general_block is not None:
+            self._general_block.changed()
+
+    @property
+    def is_general_block(self) -> bool:
+        return self.type_name in GENERAL_BLOCK_TYPES
+
+    @property
+    def is_python_function(self) -> bool:
+        return self.type_name in PYTHON_FUNCTION_TYPES
+
+    @property
+    def has_additional_blocks(self) -> bool:
+        return self.type_name in ADDITIONAL_BLOCK_TYPES
+
+    def append_line(self, node):
+        """добавляет строку в многострочную конструкцию"""
+        self._lines.append(node)
+        node.general_block = self
+        self.invalidate()
+        self.changed()
+
+    def remove_line(self, node):
+        try:
+            self._lines.remove(node)
+        except ValueError:
+            return
+        Node.topology_changed()
+        self.invalidate()
+        self.changed()
+
+    def set_lines(self, nodes):
+        """заменяет строки конструкции, не меняя general_block строк"""
+        self._lines = list(nodes)
+        Node.topology_changed()
+        self.invalidate()
+        self.changed()
+
+    @property
+    def lines(self) -> list:
+        """строки конструкции вместе с дополнительными конструкциями строк"""
+        cache = self._topology()
+        if 'lines' in cache:
+            return cache['lines']
+        result = []
+        seen = set()
+        for node in self._lines:
+            current_node = node
+            while current_node is not None:
+                if current_node not in seen:
+                    seen.add(current_node)
+                    result.append(current_node)
+                if not node.has_additional_blocks:
+                    break
+                current_node = current_node._layer_down_additional_block
+        cache['lines'] = result
+        return result
+
+    @property
+    def layer_depth(self) -> int:
+        return self._count_chain('layer_depth', '_layer_down_block')
+
+    @property
+    def highest_layer(self):
+        return self._find_chain_end('highest_layer', '_layer_up_block')
+
+    @property
+    def highest_general_block(self):
+        return self._find_chain_end('highest_general_block', '_general_block')
+
+    @property
+    def highest_additional_block(self):
+        return self._find_chain_end('highest_additional_block', '_layer_up_additional_block')
+
+    @property
+    def additional_blocks_depth(self) -> int:
+        return self._count_chain('additional_blocks_depth', '_layer_down_additional_block')
+
+    @property
+    def root(self):
+        """корень конструкции: узел, положение которого не задается другими узлами"""
+        node = self
+        while node.parent_node is not None:
+            node = node.parent_node
+        return node
+
+    def structural_children(self):
+        """узлы, положение которых задается этим узлом: смердженный блок, строки (без их дополнительных
+         конструкций) и следующая дополнительная конструкция"""
+        if self.layer_down_block is not None:
+            yield self.layer_down_block
+        if self.is_general_block:
+            for line in self.lines:
+                if line.layer_up_additional_block is None:
+                    yield line
+        if self.layer_down_additional_block is not None:
+            yield self.layer_down_additional_block
+
+    def get_links(self) -> tuple:
+        """(узел, child, layer_down_block, строки, layer_down_additional_block, layer_up_block, general_block,
+         layer_up_additional_block). кортеж кэшируется до следующего изменения узла, поэтому снимок связей схемы
+         после правки собирается из готовых кортежей"""
+        if self._links is None:
+            self._links = (self, self._child, self._layer_down_block, tuple(self._lines),
+                           self._layer_down_additional_block, self._layer_up_block, self._general_block,
+                           self._layer_up_additional_block)
+        return self._links
+
+    def edges(self):
+        """исходящие связи узла в виде (тип связи, узел)"""
+        if self.child is not None:
+            yield EdgeType.CHILD, self.child
+        if self.layer_down_block is not None:
+            yield EdgeType.MERGE, self.layer_down_block
+        for node in self._lines:
+            yield EdgeType.LINE, node
+        if self.layer_down_additional_block is not None:
+            yield EdgeType.ADDITIONAL, self.layer_down_additional_block
+
+    def get_self_func(self) -> str:
+        func = SELF_FUNCS.get(self.type_name)
+        return func(self) if func is not None else ''
+
+    def get_full_self_func(self) -> str:
+        """код смердженной цепочки, начинающейся с этого узла. код блоков после функции становится аргументами
+         ее вызова"""
+        if self.layer_down_block is None:
+            return self.get_self_func()
+        chain = []
+        current_node = self
+        while current_node is not None:
+            current_node._dirty = False
+            chain.append(current_node)
+            current_node = current_node.layer_down_block
+        result = ''
+        for current_node in reversed(chain):
+            func = current_node.get_self_func()
+            if current_node.is_python_function and result:
+                result = _add_call_arguments(func, result, current_node)
+            else:
+                result = func + result
+        return result
+
+    def get_statements(self) -> list:
+        """ast-инструкции блока. пересчитываются только после изменения самого блока или входящих в него блоков"""
+        if self._statements is None:
+            self._statements = self.generate_statements()
+            self._dirty = False
+        return self._statements
+
+    def generate_statements(self) -> list:
+        if self.type_name in ('StartBlock', 'EndBlock'):
+            return []
+        if not self.is_general_block:
+            return _parse(self.get_full_self_func(), self)
+        body = self.get_body()
+        if self.type_name == 'ElseBlock':
+            return body
+        header = self.get_full_self_func()
+        if self.type_name == 'ElifBlock' and header.startswith('elif'):
+            header = header[len('el'):]
+        statements = _parse(header + ':\n    pass', self)
+        statement = statements[0]
+        statement.body = body
+        if self.layer_down_additional_block is not None:
+            statement.orelse = self.layer_down_additional_block.get_statements()
+        return statements
+
+    def get_body(self) -> list:
+        """ast-инструкции строк многострочной конструкции"""
+        body = []
+        for node in self.lines:
+            if node.layer_up_additional_block is not None:
+                continue
+            body.extend(node.get_statements())
+        return body or [ast.Pass()]
+
+    def get_func(self) -> str:
+        """код блока. текст кэшируется вместе с ast-инструкциями и сбрасывается при той же инвалидации"""
+        if self._source is None:
+            self._source = ast.unparse(ast.Module(body=self.get_statements(), type_ignores=[]))
+        return self._source
+
+    def get_names(self) -> tuple:
+        """(имена, к атрибутам которых обращается код блока, имена, которым код блока что-то присваивает).
+         имена строк и дополнительных конструкций берутся из их собственного кэша, поэтому после правки
+         пересчитываются только узлы на пути от измененного блока к корню"""
+        if self._names is None:
+            statements = self.get_statements()
+            if not self.is_general_block:
+                self._names = collect_names(statements)
+            else:
+                trees = []
+                if self.type_name != 'ElseBlock':
+                    for statement in statements:
+                        for field in statement._fields:
+                            if field in ('body', 'orelse'):
+                                continue
+                            value = getattr(statement, field)
+                            trees.extend(value if isinstance(value, list) else [value])
+                used, assigned = collect_names(i for i in trees if isinstance(i, ast.AST))
+                parts = [node for node in self.lines if node.layer_up_additional_block is None]
+                if self.layer_down_additional_block is not None:
+                    parts.append(self.layer_down_additional_block)
+                for node in parts:
+                    node_used, node_assigned = node.get_names()
+                    used |= node_used
+                    assigned |= node_assigned
+                self._names = frozenset(used), frozenset(assigned)
+        return self._names
+
+
+def collect_names(trees) -> tuple:
+    """(имена, к атрибутам которых обращается код, имена, которым код что-то присваивает) для ast-деревьев"""
+    used_names = set()
+    assigned_names = set()
+    for tree in trees:
+        for i in ast.walk(tree):
+            if isinstance(i, ast.Attribute) and isinstance(i.value, ast.Name):
+                used_names.add(i.value.id)
+            elif isinstance(i, ast.Name) and isinstance(i.ctx, (ast.Store, ast.Del)):
+                assigned_names.add(i.id)
+            elif isinstance(i, ast.arg):
+                assigned_names.add(i.arg)
+            elif isinstance(i, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                assigned_names.add(i.name)
+            elif isinstance(i, ast.ExceptHandler) and i.name:
+                assigned_names.add(i.name)
+            elif isinstance(i, ast.alias):
+                assigned_names.add((i.asname or i.name).split('.')[0])
+    return used_names, assigned_names
+
+
+def _add_call_arguments(func: str, arguments: str, node: Node) -> str:
+    """дописывает arguments в вызов func. вызов метода ('.append()') разбирается с временным объектом"""
+    is_method = func.lstrip().startswith('.')
+    try:
+        call = ast.parse(('_' if is_method else '') + func.strip(), mode='eval').body
+        extra = ast.parse(f'_({arguments})', mode='eval').body
+    except SyntaxError as error:
+        raise BlockSyntaxError(f'{node.type_name} "{node.arg.strip()}": {error.msg}') from None
+    if not isinstance(call, ast.Call):
+        raise BlockSyntaxError(f'{node.type_name} "{node.arg.strip()}": merged blocks need a function call')
+    call.args.extend(extra.args)
+    call.keywords.extend(extra.keywords)
+    source = ast.unparse(call)
+    return source[1:] if is_method else source
+
+
+def _parse(source: str, node: Node) -> list:
+    try:
+        return ast.parse(source).body
+    except SyntaxError as error:
+        raise BlockSyntaxError(f'{node.type_name} "{node.arg.strip()}": {error.msg}') from None
+
+
+class Diagram:
+    """набор узлов одной блок-схемы"""
+    __slots__ = ('nodes',)
+
+    def __init__(self, nodes=()):
+        self.nodes = list(nodes)
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def add(self, node: Node) -> Node:
+        self.nodes.append(node)
+        return node
+
+    def get_links(self) -> tuple:
+        """(узел, child, layer_down_block, строки, layer_down_additional_block, layer_up_block, general_block,
+         layer_up_additional_block). кортеж кэшируется до следующего изменения узла, поэтому снимок связей схемы
+         после правки собирается из готовых кортежей"""
+        if self._links is None:
+            self._links = (self, self._child, self._layer_down_block, tuple(self._lines),
+                           self._layer_down_additional_block, self._layer_up_block, self._general_block,
+                           self._layer_up_additional_block)
+        return self._links
+
+    def edges(self):
+        """все связи схемы в виде (узел, тип связи, узел)"""
+        for node in self.nodes:
+            for edge_type, target in node.edges():
+                yield node, edge_type, target
+
+
+def assign_ids(nodes) -> None:
+    """назначает номера узлам, у которых их еще нет, не меняя уже назначенных"""
+    nodes = list(nodes)
+    next_id = max((i.id for i in nodes if i.id is not None), default=0) + 1
+    for node in nodes:
+        if node.id is None:
+            node.id = next_id
+            next_id += 1
+
+
+def as_node(block) -> Node:
+    """возвращает узел модели для блока-виджета или сам узел"""
+    return getattr(block, 'node', block)
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""проверка структуры блок-схемы перед генерацией кода: наличие Start и End, циклы, висячие связи и блоки,
+ не связанные со Start. проверка линейна по числу узлов и связей и не зависит от Qt: связи снимаются с узлов
+ одним проходом в DiagramGraph, а проверяются отдельно, поэтому проверку можно выполнять в фоновом потоке"""
+from enum import Enum
+
+import diagram_model
+
+
+class Problem(Enum):
+    """виды найденных проблем"""
+    NO_START = 1
+    NO_END = 2
+    MULTIPLE_STARTS = 3
+    END_NOT_REACHED = 4  # по связям child от Start нельзя дойти до End
+    CYCLE = 5
+    DANGLING_LINK = 6  # связь с блоком, которого нет в схеме
+    UNREACHABLE = 7  # конструкция не связана со Start, ее код не попадет в программу
+
+
+WARNINGS = frozenset((Problem.UNREACHABLE,))
+
+# обратные связи узла, которые тоже не должны вести за пределы схемы
+PARENT_LINKS = ('layer_up_block', 'general_block', 'layer_up_additional_block')
+
+
+class Diagnostic:
+    """одна найденная проблема. block_id - id узла, к которому она относится, None - проблема всей схемы"""
+    __slots__ = ('problem', 'block_id', 'message')
+
+    def __init__(self, problem: Problem, block_id: int = None, message: str = ''):
+        self.problem = problem
+        self.block_id = block_id
+        self.message = message
+
+    @property
+    def is_error(self) -> bool:
+        return self.problem not in WARNINGS
+
+    def __repr__(self):
+        return f'Diagnostic({self.problem.name}, block_id={self.block_id}, {self.message!r})'
+
+
+def snapshot(nodes) -> list:
+    """связи блоков схемы (виджетов или узлов модели) на текущий момент. связи каждого узла закэшированы в нем
+     самом (Node.get_links), поэтому снимок стоит одного обращения к узлу и его можно снимать в потоке
+     интерфейса, а DiagramGraph строить в фоновом"""
+    return [diagram_model.as_node(i).get_links() for i in nodes]
+
+
+class DiagramGraph:
+    """снимок связей схемы: узлы пронумерованы в порядке обхода, связи хранятся номерами узлов"""
+    __slots__ = ('ids', 'types', 'args', 'child', 'structure', 'dangling')
+
+    def __init__(self, links: list):
+        index = {node_links[0]: number for number, node_links in enumerate(links)}
+        self.ids = []
+        self.types = []
+        self.args = []
+        self.child = []  # номер child узла или None
+        self.structure = []  # номера смердженных блоков, строк и дополнительных конструкций узла
+        self.dangling = []  # (номер узла, название связи)
+        for number, (node, child, down_node, lines, down_additional_node, *parents) in enumerate(links):
+            self.ids.append(node.id)
+            self.types.append(node.type_name)
+            self.args.append(node.arg)
+            child_number = None
+            if child is not None:
+                child_number = index.get(child)
+                if child_number is None:
+                    self.dangling.append((number, 'child'))
+            structure = []
+            targets = [('merge', down_node), *(('line', i) for i in lines), ('additional', down_additional_node)]
+            for name, target in targets:
+                if target is None:
+                    continue
+                if target in index:
+                    structure.append(index[target])
+                else:
+                    self.dangling.append((number, name))
+            for name, target in zip(PARENT_LINKS, parents):
+                if target is not None and target not in index:
+                    self.dangling.append((number, name))
+            self.child.append(child_number)
+            self.structure.append(structure)
+
+    def __len__(self):
+        return len(self.types)
+
+    def label(self, number: int) -> str:
+        arg = self.args[number].strip()
+        return f'{self.types[number]} "{arg}"' if arg else self.types[number]
+
+
+def find_child_cycles(graph: DiagramGraph) -> list:
+    """первые узлы циклов по связям child. у узла не больше одного child, поэтому каждый узел проходится один раз"""
+    state = [0] * len(graph)  # 0 - не пройден, 1 - на текущем пути, 2 - пройден
+    result = []
+    for number in range(len(graph)):
+        path = []
+        current = number
+        while current is not None and not state[current]:
+            state[current] = 1
+            path.append(current)
+            current = graph.child[current]
+        if current is not None and state[current] == 1:
+            result.append(current)
+        for i in path:
+            state[i] = 2
+    return result
+
+
+def find_structure_cycles(graph: DiagramGraph) -> list:
+    """узлы, которые через смердженные блоки, строки или дополнительные конструкции входят сами в себя"""
+    state = [0] * len(graph)
+    result = []
+    for number in range(len(graph)):
+        if state[number]:
+            continue
+        state[number] = 1
+        stack = [(number, iter(graph.structure[number]))]
+        while stack:
+            current, targets = stack[-1]
+            for target in targets:
+                if state[target] == 1:
+                    result.append(target)
+                elif not state[target]:
+                    state[target] = 1
+                    stack.append((target, iter(graph.structure[target])))
+                    break
+            else:
+                state[current] = 2
+                stack.pop()
+    return result
+
+
+def check(graph: DiagramGraph) -> list:
+    """проверяет снимок схемы, возвращает список Diagnostic"""
+    diagnostics = []
+
+    def report(problem: Problem, number: int, message: str):
+        block_id = graph.ids[number] if number is not None else None
+        diagnostics.append(Diagnostic(problem, block_id, message))
+
+    starts = [i for i, type_name in enumerate(graph.types) if type_name == 'StartBlock']
+    ends = [i for i, type_name in enumerate(graph.types) if type_name == 'EndBlock']
+    if not starts:
+        report(Problem.NO_START, None, 'There is no Start block')
+    for number in starts[1:]:
+        report(Problem.MULTIPLE_STARTS, number, 'There is more than one Start block')
+    if not ends:
+        report(Problem.NO_END, None, 'There is no End block')
+    for number, name in graph.dangling:
+        report(Problem.DANGLING_LINK, number, f'{graph.label(number)}: {name} link points outside the diagram')
+    for number in find_child_cycles(graph):
+        report(Problem.CYCLE, number, f'{graph.label(number)}: connections form a cycle')
+    for number in find_structure_cycles(graph):
+        report(Problem.CYCLE, number, f'{graph.label(number)}: block contains itself')
+    if not starts:
+        return diagnostics
+
+    reached = [False] * len(graph)
+    chain = []
+    current = starts[0]
+    while current is not None and not reached[current]:
+        reached[current] = True
+        chain.append(current)
+        current = graph.child[current]
+    if ends and not any(graph.types[i] == 'EndBlock' for i in chain):
+        report(Problem.END_NOT_REACHED, starts[0], 'End block is not connected to Start')
+
+    stack = chain
+    while stack:
+        for target in graph.structure[stack.pop()]:
+            if not reached[target]:
+                reached[target] = True
+                stack.append(target)
+    has_parent = [False] * len(graph)
+    for targets in graph.structure:
+        for target in targets:
+            has_parent[target] = True
+    for number in range(len(graph)):
+        if not reached[number] and not has_parent[number]:
+            report(Problem.UNREACHABLE, number, f'{graph.label(number)}: block is not connected to Start')
+    return diagnostics
+
+
+def check_snapshot(links: list) -> list:
+    """строит граф по снимку связей и проверяет его, выполняется в фоновом потоке"""
+    return check(DiagramGraph(links))
+
+
+def validate(nodes) -> list:
+    """проверяет блоки схемы (виджеты или узлы модели), возвращает список Diagnostic"""
+    return check_snapshot(snapshot(nodes))
@@ -1,3 +1,11 @@
 # -*- coding: utf-8 -*-
 class SequenceError(Exception):
+    """ошибки структуры схемы, diagnostics - список diagram_validation.Diagnostic"""
+
+    def __init__(self, *args, diagnostics=()):
+        super(SequenceError, self).__init__(*args)
+        self.diagnostics = list(diagnostics)
+
+
+class BlockSyntaxError(Exception):
     pass
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""выполнение сгенерированных программ в заранее запущенных процессах-воркерах"""
+import builtins
+import io
+import multiprocessing
+import queue
+import sys
+import time
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
+
+
+class Isolation(Enum):
+    """насколько запуски программ изолированы друг от друга"""
+    NAMESPACE = 1  # новое пространство имен, воркер переиспользуется
+    MODULES = 2  # дополнительно выгружаются модули, импортированные программой
+    PROCESS = 3  # после каждого запуска воркер заменяется новым
+
+
+class RunResult:
+    """результат одного запуска программы"""
+    __slots__ = ('stdout', 'stderr', 'error', 'duration', 'timed_out')
+
+    def __init__(self, stdout: str = '', stderr: str = '', error: str = None, duration: float = 0.0,
+                 timed_out: bool = False):
+        self.stdout = stdout
+        self.stderr = stderr
+        self.error = error
+        self.duration = duration
+        self.timed_out = timed_out
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.timed_out
+
+    def __repr__(self):
+        return f'RunResult(ok={self.ok}, duration={self.duration:.4f})'
+
+
+class _PipeWriter(io.TextIOBase):
+    """stdout или stderr программы в потоковом режиме: вывод отправляется в backend построчно"""
+    BUFFER_SIZE = 8192
+
+    def __init__(self, connection, name: str):
+        self.connection = connection
+        self.name = name
+        self.buffer = []
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self.buffer.append(text)
+        self.size += len(text)
+        if '\n' in text or self.size >= self.BUFFER_SIZE:
+            self.flush()
+        return len(text)
+
+    def flush(self):
+        if self.buffer:
+            self.connection.send((self.name, ''.join(self.buffer)))
+            self.buffer = []
+            self.size = 0
+
+
+class _PipeReader(io.TextIOBase):
+    """stdin программы в потоковом режиме: ждет строки, которые backend передает по мере ввода. перед
+     ожиданием ввода выводится все, что программа уже напечатала, например приглашение input()"""
+
+    def __init__(self, connection, writers):
+        self.connection = connection
+        self.writers = writers
+        self.buffer = ''
+        self.eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def _fill(self):
+        for writer in self.writers:
+            writer.flush()
+        message = self.connection.recv()
+        if message[0] == 'stdin':
+            self.buffer += message[1]
+        else:
+            self.eof = True
+
+    def readline(self, size: int = -1) -> str:
+        while '\n' not in self.buffer and not self.eof and (size < 0 or len(self.buffer) < size):
+            self._fill()
+        end = self.buffer.find('\n') + 1 or len(self.buffer)
+        if size >= 0:
+            end = min(end, size)
+        line, self.buffer = self.buffer[:end], self.buffer[end:]
+        return line
+
+    def read(self, size: int = -1) -> str:
+        while not self.eof and (size < 0 or len(self.buffer) < size):
+            self._fill()
+        end = len(self.buffer) if size < 0 else size
+        text, self.buffer = self.buffer[:end], self.buffer[end:]
+        return text
+
+
+def _worker_main(connection):
+    """цикл воркера: получает исходный код по pipe и выполняет его в новом пространстве имен. в потоковом режиме
+     вывод отправляется по мере появления, а ввод читается из pipe, иначе вывод копится и отправляется
+     вместе с результатом"""
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+        if message[0] != 'run':
+            continue  # ввод, который пришел уже после завершения программы
+        _, source, stdin, isolation, stream = message
+        loaded_modules = set(sys.modules) if isolation == Isolation.MODULES.value else None
+        if stream:
+            stdout, stderr = _PipeWriter(connection, 'stdout'), _PipeWriter(connection, 'stderr')
+            new_stdin = _PipeReader(connection, (stdout, stderr))
+        else:
+            stdout, stderr = io.StringIO(), io.StringIO()
+            new_stdin = io.StringIO(stdin)
+        error = None
+        old_streams = sys.stdin, sys.stdout, sys.stderr
+        sys.stdin, sys.stdout, sys.stderr = new_stdin, stdout, stderr
+        start = time.perf_counter()
+        try:
+            code = compile(source, '<diagram>', 'exec')
+            exec(code, {'__name__': '__main__', '__builtins__': builtins})
+        except SystemExit as exit_error:
+            if exit_error.code not in (None, 0):
+                error = f'SystemExit: {exit_error.code}\n'
+        except BaseException:
+            error = traceback.format_exc()
+        finally:
+            sys.stdin, sys.stdout, sys.stderr = old_streams
+        duration = time.perf_counter() - start
+        if loaded_modules is not None:
+            for name in set(sys.modules) - loaded_modules:
+                del sys.modules[name]
+        if stream:
+            stdout.flush()
+            stderr.flush()
+            connection.send(('done', '', '', error, duration))
+        else:
+            connection.send(('done', stdout.getvalue(), stderr.getvalue(), error, duration))
+
+
+class _Worker:
+    """запущенный интерпретатор python, связанный с backend через pipe"""
+
+    def __init__(self, context):
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_connection,), daemon=True)
+        self.process.start()
+        child_connection.close()
+        self.broken = False  # pipe оборвался, воркер нельзя переиспользовать, даже если процесс еще не завершился
+
+    def send(self, message) -> bool:
+        try:
+            self.connection.send(message)
+        except (EOFError, OSError):
+            self.broken = True
+            return False
+        return True
+
+    def run(self, source: str, stdin: str, isolation: Isolation, timeout: float = None) -> RunResult:
+        if not self.send(('run', source, stdin, isolation.value, False)):
+            return RunResult(error='worker process exited unexpectedly')
+        try:
+            if not self.connection.poll(timeout):
+                return RunResult(timed_out=True, duration=timeout)
+            _, stdout, stderr, error, duration = self.connection.recv()
+        except (EOFError, OSError):
+            self.broken = True
+            return RunResult(error='worker process exited unexpectedly')
+        return RunResult(stdout, stderr, error, duration)
+
+    @property
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def close(self):
+        if self.is_alive:
+            try:
+                self.connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self.process.join(0.5)
+        self.terminate()
+
+    def terminate(self):
+        """останавливает воркер, не дожидаясь конца выполняемой программы"""
+        if self.is_alive:
+            self.process.terminate()
+            self.process.join(1)
+        self.connection.close()
+
+
+class StreamingRun:
+    """программа, которая выполняется в воркере с передачей вывода и ввода по мере выполнения. read не блокирует
+     и вызывается периодически из потока интерфейса, после завершения программы result - ее RunResult"""
+
+    def __init__(self, backend, worker: _Worker, source: str):
+        self.backend = backend
+        self.worker = worker
+        self.result: RunResult = None
+        self.stopped = False
+        if not worker.send(('run', source, '', backend.isolation.value, True)):
+            self.finish(RunResult(error='worker process exited unexpectedly'))
+
+    @property
+    def is_running(self) -> bool:
+        return self.result is None
+
+    def read(self, budget: float = 0.02) -> list:
+        """(stdout или stderr, текст) для вывода, пришедшего с прошлого вызова. чтение занимает не дольше budget
+         секунд, остаток вывода программы, которая печатает без остановки, забирается следующим вызовом"""
+        messages = []
+        deadline = time.perf_counter() + budget
+        try:
+            while self.result is None and self.worker.connection.poll() and time.perf_counter() < deadline:
+                message = self.worker.connection.recv()
+                if message[0] == 'done':
+                    self.finish(RunResult(*message[1:]))
+                else:
+                    messages.append(message)
+        except (EOFError, OSError):
+            self.worker.broken = True
+            self.finish(RunResult(error='worker process exited unexpectedly'))
+        return messages
+
+    def write(self, text: str):
+        if self.result is None:
+            self.worker.send(('stdin', text))
+
+    def close_input(self):
+        if self.result is None:
+            self.worker.send(('eof',))
+
+    def stop(self):
+        """прерывает программу: воркер останавливается и заменяется новым"""
+        if self.result is None:
+            self.stopped = True
+            self.finish(RunResult(error='program stopped'), terminate=True)
+
+    def finish(self, result: RunResult, terminate: bool = False):
+        self.result = result
+        worker, self.worker = self.worker, None
+        self.backend.release(worker, terminate)
+
+
+class ExecutionBackend:
+    """пул заранее запущенных воркеров, выполняющих программы без запуска нового процесса. программа, которая
+     выполняется дольше timeout секунд, прерывается вместе с воркером"""
+    DEFAULT_TIMEOUT = 30.0
+
+    def __init__(self, workers: int = 1, isolation: Isolation = Isolation.NAMESPACE,
+                 timeout: float = DEFAULT_TIMEOUT):
+        self.isolation = isolation
+        self.timeout = timeout
+        self._context = multiprocessing.get_context('spawn')
+        self._idle = queue.Queue()
+        self._busy = set()  # воркеры, которые выполняют программы из run
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        for _ in range(workers):
+            self._idle.put(_Worker(self._context))
+
+    def run(self, source: str, stdin: str = '') -> RunResult:
+        """выполняет программу в свободном воркере и ждет результата"""
+        worker = self._idle.get()
+        self._busy.add(worker)
+        result = RunResult(error='worker process exited unexpectedly')
+        try:
+            result = worker.run(source, stdin, self.isolation, self.timeout)
+        finally:
+            self._busy.discard(worker)
+            self.release(worker, terminate=result.timed_out)
+        return result
+
+    def cancel(self):
+        """прерывает все программы, выполняемые через run и submit. их воркеры заменяются новыми, а результатом
+         становится ошибка"""
+        for worker in list(self._busy):
+            worker.process.terminate()
+
+    def submit(self, source: str, stdin: str = '') -> Future:
+        """выполняет программу в фоновом потоке, результат - Future[RunResult]"""
+        return self._executor.submit(self.run, source, stdin)
+
+    def start(self, source: str) -> StreamingRun:
+        """запускает программу в свободном воркере без ожидания результата, без ограничения по времени:
+         потоковый запуск останавливается через StreamingRun.stop"""
+        return StreamingRun(self, self._idle.get(), source)
+
+    def release(self, worker: _Worker, terminate: bool = False):
+        """возвращает воркер в пул. воркер, который нельзя переиспользовать, заменяется новым"""
+        if terminate:
+            worker.terminate()
+        elif self.isolation == Isolation.PROCESS or worker.broken or not worker.is_alive:
+            worker.close()
+        else:
+            self._idle.put(worker)
+            return
+        self._idle.put(_Worker(self._context))
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
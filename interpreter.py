@@ -1,65 +1,101 @@
 # -*- coding: utf-8 -*-
-import subprocess
-from blocks import BaseBlock, StartBlock, EndBlock
+import ast
+
+import diagram_validation
+from diagram_model import Node, as_node
 from exceptions import SequenceError
+from execution_backend import ExecutionBackend, Isolation
+from symbol_catalog import STDLIB_MODULES
+
+STANDART_CODE = '''
+import traceback
+try:
+    pass
+except BaseException:
+    print(traceback.format_exc())
+    input("press ENTER to close")
+input("press ENTER to close")
+'''
 
 
 class Interpreter:
-    def __init__(self):
-        self.__program: str = ''
+    def __init__(self, workers: int = 1, isolation: Isolation = Isolation.NAMESPACE):
+        self.workers = workers
+        self.isolation = isolation
+        self._backend: ExecutionBackend = None
+
+    @property
+    def backend(self) -> ExecutionBackend:
+        """воркеры запускаются при первом выполнении программы"""
+        if self._backend is None:
+            self._backend = ExecutionBackend(self.workers, self.isolation)
+        return self._backend
 
-    def convert_to_py(self, blocks) -> str:
-        if StartBlock not in [i.__class__ for i in blocks] or EndBlock not in [i.__class__ for i in blocks]:
+    def start_workers(self):
+        """заранее запускает воркеры, чтобы первый запуск программы не ждал старта python"""
+        return self.backend
+
+    def convert_to_py(self, blocks, console: bool = True) -> str:
+        """переводит блоки схемы (виджеты или узлы модели) в код на python. если console=False, программа
+         не оборачивается в код для запуска в отдельной консоли"""
+        nodes = [as_node(i) for i in blocks]
+        diagnostics = diagram_validation.validate(nodes)
+        problems = {i.problem for i in diagnostics}
+        if diagram_validation.Problem.NO_START in problems or diagram_validation.Problem.NO_END in problems:
             return ''
-        result = []
+        self.handle_errors(diagnostics)
+        sources = []
+        used_names = set()
+        assigned_names = set()
 
-        blocks = self.get_blocks_in_right_order(next(i for i in blocks if i.__class__ == StartBlock))
-        self.handle_errors(blocks)
-        blocks_result = []
-        for block in blocks:
-            if block.layer_up_block is not None:
+        # код и имена каждой корневой конструкции кэшируются в узле, после правки пересчитывается только
+        # измененная конструкция, а программа собирается склейкой строк
+        nodes = self.get_blocks_in_right_order(next(i for i in nodes if i.type_name == 'StartBlock'))
+        for node in nodes:
+            if node.layer_up_block is not None:
                 continue
-            if block.general_block is not None:
+            if node.general_block is not None:
                 continue
-            if hasattr(block, 'layer_up_additional_block') and block.layer_up_additional_block is not None:
+            if node.layer_up_additional_block is not None:
                 continue
-            blocks_result.extend(block.get_func().split('\n'))
+            source = node.get_func()
+            if source:
+                sources.append(source)
+            node_used, node_assigned = node.get_names()
+            used_names |= node_used
+            assigned_names |= node_assigned
+        code = '\n'.join([f'import {i}' for i in self.get_imported_modules(used_names, assigned_names)] + sources)
+        if not console:
+            return code
+        return ast.unparse(self.add_standart_code(ast.parse(code).body))
 
-        result.extend(map(lambda x: '\t' + x, blocks_result))
-        result = self.add_standart_code(result)
-        return '\n'.join(result)
+    def get_imported_modules(self, used_names: set, assigned_names: set) -> list:
+        """модули стандартной библиотеки, к атрибутам которых обращается программа. имя, которому программа
+         сама что-то присваивает, считается переменной, а не модулем"""
+        return sorted({i.split('.')[0] for i in STDLIB_MODULES} & (used_names - assigned_names))
 
-    def add_standart_code(self, program):
-        program.insert(0, 'try:')
-        program.insert(0, 'import traceback')
-        program.append('')
-        program.append('')
-        program.append('\tpass')
-        program.append('except BaseException:')
-        program.append('\tprint(traceback.format_exc())')
-        program.append('\tinput("press ENTER to close")')
-        program.append('input("press ENTER to close")')
-        return program
+    def add_standart_code(self, program: list) -> ast.Module:
+        module = ast.parse(STANDART_CODE)
+        module.body[1].body = program + [ast.Pass()]
+        return module
 
-    def handle_errors(self, blocks):
-        current_block: BaseBlock = next(i for i in blocks if i.__class__ == StartBlock)
-        connected_blocks_classes = []
-        while current_block is not None:
-            connected_blocks_classes.append(current_block.__class__)
-            current_block = current_block.child
-        if EndBlock not in connected_blocks_classes:
-            raise SequenceError
+    def handle_errors(self, diagnostics: list):
+        """поднимает SequenceError, если среди результатов проверки схемы есть ошибки"""
+        errors = [i for i in diagnostics if i.is_error]
+        if errors:
+            raise SequenceError('; '.join(i.message for i in errors), diagnostics=errors)
 
-    def get_blocks_in_right_order(self, start_block: StartBlock):
+    def get_blocks_in_right_order(self, start_block: Node):
         result = []
+        visited = set()
         current_block = start_block
-        while current_block is not None:
+        while current_block is not None and current_block not in visited:
+            visited.add(current_block)
             result.append(current_block)
             current_block = current_block.child
         return result
 
-    def execute(self, blocks):
-        self.__program = self.convert_to_py(blocks)
-        with open('./execute.py', mode='w', encoding='utf-8') as file:
-            file.write(self.__program)
-        proc = subprocess.Popen(['python', 'execute.py'], creationflags=subprocess.CREATE_NEW_CONSOLE)
+    def close(self):
+        if self._backend is not None:
+            self._backend.close()
+            self._backend = None
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+from PyQt5 import QtCore, sip
+
+import diagram_model
+from profiler import profiled
+
+
+def has_view(node: diagram_model.Node) -> bool:
+    """у узла есть виджет, и он еще не удален"""
+    return node.view is not None and not sip.isdeleted(node.view)
+
+
+def compound_height(node: diagram_model.Node) -> int:
+    """высота блока вместе с его дополнительными конструкциями"""
+    height = node.view.height()
+    current_node = node.layer_down_additional_block
+    while current_node is not None:
+        height += 1 + current_node.view.height()
+        current_node = current_node.layer_down_additional_block
+    return height
+
+
+def compound_size(node: diagram_model.Node) -> tuple:
+    """ширина и высота конструкции вместе с ее дополнительными конструкциями"""
+    width = node.view.width()
+    current_node = node.layer_down_additional_block
+    while current_node is not None:
+        width = max(width, current_node.view.width())
+        current_node = current_node.layer_down_additional_block
+    return width, compound_height(node)
+
+
+def header_height(node: diagram_model.Node) -> int:
+    """высота заголовка многострочной конструкции, строки начинаются под ним"""
+    if node.layer_down_block is not None:
+        return node.layer_down_block.view.height() + 8
+    return node.view.minimum_height
+
+
+class LayoutEngine(QtCore.QObject):
+    """раскладка блоков-виджетов. после правки блок только помечает свою конструкцию, а движок в следующей итерации
+     цикла событий раскладывает каждую помеченную конструкцию один раз: проход снизу вверх считает размеры, проход
+     сверху вниз - положения. корень конструкции остается на месте, остальные блоки ставятся относительно него"""
+
+    def __init__(self, parent=None):
+        super(LayoutEngine, self).__init__(parent)
+        self.dirty = {}  # корни конструкций, которые нужно разложить, dict как упорядоченное множество
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.flush)
+
+    def schedule(self, node: diagram_model.Node):
+        """помечает конструкцию узла, она будет разложена в следующей итерации цикла событий"""
+        self.dirty[node.root] = None
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def cancel(self, node: diagram_model.Node):
+        """снимает пометку с конструкции удаляемого корня"""
+        self.dirty.pop(node, None)
+
+    @profiled()
+    def flush(self):
+        """раскладывает все помеченные конструкции сразу, не дожидаясь цикла событий"""
+        self.timer.stop()
+        while self.dirty:
+            root = next(iter(self.dirty))
+            del self.dirty[root]
+            # пока конструкция ждала раскладки, ее корень мог стать частью другой конструкции или быть удален
+            if root.parent_node is None and has_view(root):
+                self.layout(root)
+
+    @profiled()
+    def layout(self, node: diagram_model.Node):
+        """раскладывает конструкцию узла сразу"""
+        root = node.root
+        self.dirty.pop(root, None)
+        order = []
+        stack = [root]
+        while stack:
+            current_node = stack.pop()
+            if not has_view(current_node):
+                continue
+            order.append(current_node)
+            stack.extend(current_node.structural_children())
+        for current_node in reversed(order):
+            self.measure(current_node)
+        for current_node in order:
+            self.place(current_node)
+
+    def measure(self, node: diagram_model.Node):
+        """считает размер блока по размерам уже измеренных вложенных блоков"""
+        block = node.view
+        text_width, text_height = block.text_width, block.text_height
+        width = max(text_width, block.minimum_width)
+        height = block.minimum_height if node.is_general_block else max(text_height, block.minimum_height)
+        if node.layer_down_block is not None:
+            down_block = node.layer_down_block.view
+            width, height = down_block.width() + 18 + text_width, down_block.height() + 8
+        if node.is_general_block:
+            for line in node.structural_children():
+                if line is node.layer_down_block or line is node.layer_down_additional_block:
+                    continue
+                height += 3 + compound_height(line)
+                width = max(width, line.view.width() + 15)
+        if block.width() != width or block.height() != height:
+            block.setFixedSize(width, height)
+
+    def place(self, node: diagram_model.Node):
+        """ставит вложенные блоки относительно блока"""
+        block = node.view
+        x, y = block.x(), block.y()
+        if node.layer_down_block is not None:
+            down_block = node.layer_down_block.view
+            down_block.move(x + block.width() - down_block.width() - 3, y + 4)
+        if node.layer_down_additional_block is not None:
+            node.layer_down_additional_block.view.move(x, y + block.height() + 1)
+        if node.is_general_block:
+            line_y = y + header_height(node)
+            for line in node.structural_children():
+                if line is node.layer_down_block or line is node.layer_down_additional_block:
+                    continue
+                line.view.move(x + 12, line_y)
+                line_y += 3 + compound_height(line)
@@ -1,10 +1,19 @@
 import sys
 from PyQt5 import QtWidgets
-from program import Program
+
+
+def create_window(argv):
+    """главное окно; модули выполнения и сохранения схем загружаются позже, при первом использовании"""
+    if '--scene' in argv[1:]:
+        from scene_canvas import SceneWindow as Program
+    else:
+        from program import Program
+    return Program()
+
 
 if __name__ == '__main__':
     app = QtWidgets.QApplication(sys.argv)
-    program = Program()
+    program = create_window(sys.argv)
 
     program.show()
     sys.exit(app.exec())
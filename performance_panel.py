@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+import collections
+import time
+
+from PyQt5 import QtCore, QtWidgets
+
+from profiler import PROFILER
+
+
+class LatencySampler(QtCore.QObject):
+    """измеряет задержку цикла событий: насколько позже назначенного срабатывает таймер. большая задержка значит,
+     что главный поток был занят и редактор не отвечал"""
+    INTERVAL = 50  # мс
+    COUNTER_NAME = 'event_loop_latency_ms'
+
+    def __init__(self, parent=None, history: int = 200):
+        super(LatencySampler, self).__init__(parent)
+        self.samples = collections.deque(maxlen=history)
+        self.expected = None
+        self.timer = QtCore.QTimer(self)
+        self.timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self.timer.setInterval(self.INTERVAL)
+        self.timer.timeout.connect(self.sample)
+
+    def start(self):
+        self.expected = time.perf_counter() + self.INTERVAL / 1000
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+    def sample(self):
+        now = time.perf_counter()
+        latency = max(now - self.expected, 0.0) * 1000
+        self.expected = now + self.INTERVAL / 1000
+        self.samples.append(latency)
+        PROFILER.record(self.COUNTER_NAME, latency)
+
+    @property
+    def last(self) -> float:
+        return self.samples[-1] if self.samples else 0.0
+
+    @property
+    def worst(self) -> float:
+        return max(self.samples, default=0.0)
+
+    @property
+    def p95(self) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+
+
+class PerformancePanel(QtWidgets.QDockWidget):
+    """панель с числом вызовов и временем горячих функций и задержкой цикла событий. пока панель открыта, идет
+     запись, таблица обновляется раз в REFRESH_INTERVAL"""
+    REFRESH_INTERVAL = 500  # мс
+    COLUMNS = ('function', 'calls', 'total ms', 'own ms', 'mean ms', 'max ms')
+
+    def __init__(self, parent=None):
+        super(PerformancePanel, self).__init__('Performance', parent)
+        self.setObjectName('performance_panel')
+        self.sampler = LatencySampler(self)
+
+        content = QtWidgets.QWidget(self)
+        self.record_check_box = QtWidgets.QCheckBox('Record', content)
+        self.record_check_box.setChecked(True)
+        self.latency_label = QtWidgets.QLabel(content)
+        self.table = QtWidgets.QTableWidget(0, len(self.COLUMNS), content)
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().hide()
+        self.table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.Stretch)
+        reset_button = QtWidgets.QPushButton('Reset', content)
+        export_json_button = QtWidgets.QPushButton('Export JSON', content)
+        export_trace_button = QtWidgets.QPushButton('Export trace', content)
+
+        buttons = QtWidgets.QHBoxLayout()
+        buttons.addWidget(self.record_check_box)
+        buttons.addStretch()
+        buttons.addWidget(reset_button)
+        buttons.addWidget(export_json_button)
+        buttons.addWidget(export_trace_button)
+        layout = QtWidgets.QVBoxLayout(content)
+        layout.addLayout(buttons)
+        layout.addWidget(self.latency_label)
+        layout.addWidget(self.table)
+        self.setWidget(content)
+
+        self.refresh_timer = QtCore.QTimer(self)
+        self.refresh_timer.setInterval(self.REFRESH_INTERVAL)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.record_check_box.toggled.connect(self.set_recording)
+        reset_button.clicked.connect(self.reset)
+        export_json_button.clicked.connect(lambda: self.export(PROFILER.save_json, 'JSON (*.json)'))
+        export_trace_button.clicked.connect(lambda: self.export(PROFILER.save_chrome_trace, 'Chrome trace (*.json)'))
+        self.visibilityChanged.connect(self.on_visibility_changed)
+
+    def on_visibility_changed(self, visible: bool):
+        self.set_recording(visible and self.record_check_box.isChecked())
+        if visible:
+            self.refresh_timer.start()
+            self.refresh()
+        else:
+            self.refresh_timer.stop()
+
+    def set_recording(self, recording: bool):
+        if recording:
+            PROFILER.enable()
+            self.sampler.start()
+        else:
+            PROFILER.disable()
+            self.sampler.stop()
+
+    def reset(self):
+        PROFILER.reset()
+        self.sampler.samples.clear()
+        self.refresh()
+
+    def refresh(self):
+        self.latency_label.setText(f'event loop latency: last {self.sampler.last:.1f} ms, '
+                                   f'p95 {self.sampler.p95:.1f} ms, max {self.sampler.worst:.1f} ms')
+        stats = sorted(PROFILER.stats.items(), key=lambda i: i[1].total, reverse=True)
+        self.table.setRowCount(len(stats))
+        for row, (name, stat) in enumerate(stats):
+            values = stat.to_json()
+            cells = (name, str(stat.count), f"{values['total_ms']:.1f}", f"{values['own_ms']:.1f}",
+                     f"{values['mean_ms']:.3f}", f"{values['max_ms']:.1f}")
+            for column, text in enumerate(cells):
+                item = QtWidgets.QTableWidgetItem(text)
+                if column:
+                    item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(row, column, item)
+
+    def export(self, save, file_filter: str):
+        file_name = QtWidgets.QFileDialog.getSaveFileName(self, 'Export', '.', filter=file_filter)[0]
+        if file_name:
+            save(file_name)
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""счетчики вызовов и времени горячих мест редактора (раскладка блоков, стрелки, сохранение). пока профилирование
+ выключено, обернутая функция стоит одну проверку флага. результаты выгружаются в json или в формат Chrome trace
+ (chrome://tracing, Perfetto)
+
+включить с запуска: BLOCK_DIAGRAMS_PROFILE=1 python main.py
+"""
+import collections
+import functools
+import json
+import os
+import threading
+import time
+
+MAX_EVENTS = 200000  # последние вызовы для трассы, старые вытесняются
+
+
+class Stat:
+    """накопленные данные одной функции. total включает время вложенных вызовов, own - без них"""
+    __slots__ = ('count', 'total', 'own', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.own = 0.0
+        self.max = 0.0
+
+    def to_json(self) -> dict:
+        return {'count': self.count, 'total_ms': self.total * 1000, 'own_ms': self.own * 1000,
+                'mean_ms': self.total * 1000 / self.count if self.count else 0.0, 'max_ms': self.max * 1000}
+
+
+class Profiler:
+    def __init__(self, enabled: bool = False, max_events: int = MAX_EVENTS):
+        self.enabled = enabled
+        self.stats = collections.defaultdict(Stat)
+        # (имя, начало, длительность, поток) для трассы и (имя, время, значение) для счетчиков
+        self.events = collections.deque(maxlen=max_events)
+        self.counters = collections.deque(maxlen=max_events)
+        self.origin = time.perf_counter()
+        self._local = threading.local()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        self.stats.clear()
+        self.events.clear()
+        self.counters.clear()
+        self.origin = time.perf_counter()
+
+    def call(self, name: str, func, *args, **kwargs):
+        """вызывает func и записывает его время под именем name"""
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            duration = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += duration
+            stat = self.stats[name]
+            stat.count += 1
+            stat.total += duration
+            stat.own += duration - children
+            if duration > stat.max:
+                stat.max = duration
+            self.events.append((name, start, duration, threading.get_ident()))
+
+    def record(self, name: str, value: float):
+        """записывает значение счетчика, например задержку цикла событий"""
+        if self.enabled:
+            self.counters.append((name, time.perf_counter(), value))
+
+    def to_json(self) -> dict:
+        return {'stats': {name: stat.to_json() for name, stat in sorted(self.stats.items())},
+                'counters': [{'name': name, 'time_ms': (at - self.origin) * 1000, 'value': value}
+                             for name, at, value in self.counters]}
+
+    def to_chrome_trace(self) -> dict:
+        """события в формате Trace Event: вызовы - полные события 'X', счетчики - 'C', время в микросекундах"""
+        pid = os.getpid()
+        events = [{'name': name, 'cat': 'call', 'ph': 'X', 'ts': (start - self.origin) * 1e6, 'dur': duration * 1e6,
+                   'pid': pid, 'tid': tid} for name, start, duration, tid in self.events]
+        events.extend({'name': name, 'cat': 'counter', 'ph': 'C', 'ts': (at - self.origin) * 1e6, 'pid': pid,
+                       'args': {name: value}} for name, at, value in self.counters)
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def save_json(self, path: str):
+        with open(path, mode='w', encoding='utf-8') as file:
+            json.dump(self.to_json(), file, indent=2)
+
+    def save_chrome_trace(self, path: str):
+        with open(path, mode='w', encoding='utf-8') as file:
+            json.dump(self.to_chrome_trace(), file)
+
+
+PROFILER = Profiler(enabled=bool(os.environ.get('BLOCK_DIAGRAMS_PROFILE')))
+
+
+def profiled(name: str = None):
+    """декоратор: считает вызовы и время функции, пока PROFILER включен. имя по умолчанию - Class.method"""
+
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+            return PROFILER.call(label, func, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,18 +1,20 @@
 # -*- coding: utf-8 -*-
-import sys
-import traceback
 from enum import Enum
 from PyQt5 import QtWidgets, QtGui, QtCore
+import block_registry
+import block_transaction
 import blocks
-import interpreter
+import layout_engine
+import run_console
 import visual_elements
 from exceptions import SequenceError
+from profiler import profiled
 from window_layout import MainWindow
-import save_diagram
 import os
 
 
 def excepthook(exc_type, exc_value, exc_tb):
+    import traceback
     tb = ''.join(traceback.format_exception(exc_type, exc_value, exc_tb))
     print(tb)
 
@@ -23,34 +25,59 @@ class ProgramState(Enum):
     CONNECTING = 2
 
 
-class Program(QtWidgets.QMainWindow, MainWindow, visual_elements.Drawer):
+class Program(QtWidgets.QMainWindow, MainWindow, visual_elements.Drawer, run_console.RunConsoleWindow):
     """основное окно"""
+    arrange_finished = QtCore.pyqtSignal(object)
+    validation_finished = QtCore.pyqtSignal(object, int)
+    AUTOSAVE_INTERVAL = 3000  # мс между записями изменений в открытый файл
+    VALIDATION_DELAY = 300  # мс после последней правки до фоновой проверки схемы
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.state: ProgramState = ProgramState.PLACING
-        self.arrows = self.arrows
         self.connecting_parent = None
         self.connecting_child = None
         self.current_file = None
-        self.interpreter = interpreter.Interpreter()
-
-        self.blocks = []
+        QtCore.QTimer.singleShot(0, self.start_background_services)
+        self.autosaver = None
+        self.autosave_timer = QtCore.QTimer(self)
+        self.autosave_timer.setInterval(self.AUTOSAVE_INTERVAL)
+        self.autosave_timer.timeout.connect(self.autosave)
+        self.loader = None
+        self.performance_panel = None
+        self.layout_engine = layout_engine.LayoutEngine(self)
+        self.arrange_executor = None
+        self.arranging = False
+        self.arrange_finished.connect(self.apply_arrangement)
+        self.validation_timer = QtCore.QTimer(self)
+        self.validation_timer.setSingleShot(True)
+        self.validation_timer.setInterval(self.VALIDATION_DELAY)
+        self.validation_timer.timeout.connect(self.start_validation)
+        self.validation_executor = None
+        self.validation_generation = 0  # номер последней правки, результаты более ранних проверок отбрасываются
+        self.problem_blocks = []
+        self.validation_finished.connect(self.apply_validation)
+
+        self.blocks = block_registry.BlockRegistry()
 
         self.setAcceptDrops(True)
         self.setup(self)
+        self.loading_progress = QtWidgets.QProgressBar(self)
+        self.loading_progress.setMaximumWidth(200)
+        self.loading_progress.hide()
+        self.status_bar.addPermanentWidget(self.loading_progress)
         self.initUI()
 
     def initUI(self) -> None:
         start = blocks.StartBlock(self)
         start.move(self.rect().center().x() - start.rect().width() // 2,
                    0 + self.block_toolbar.rect().height() + self.menu_bar.rect().height() + 30)
-        self.blocks.append(start)
+        self.blocks.add(start)
 
         end = blocks.EndBlock(self)
         end.move(self.rect().center().x() - start.rect().width() // 2,
                  self.rect().height() - self.block_toolbar.rect().height() - self.menu_bar.rect().height())
-        self.blocks.append(end)
+        self.blocks.add(end)
 
         self.add_function_block_action.triggered.connect(lambda: self.add_block(blocks.FunctionBlock))
         self.add_variable_block_action.triggered.connect(lambda: self.add_block(blocks.VariableBlock))
@@ -61,6 +88,15 @@ class Program(QtWidgets.QMainWindow, MainWindow, visual_elements.Drawer):
         self.save_file_action.triggered.connect(self.save_file)
         self.save_as_file_action.triggered.connect(self.save_as_file)
         self.open_file_action.triggered.connect(self.open_file)
+        self.arrange_action.triggered.connect(self.arrange_blocks)
+        self.performance_panel_action.toggled.connect(self.toggle_performance_panel)
+        self.run_console_action.toggled.connect(self.toggle_run_console)
+
+    def start_background_services(self):
+        """запускает построение каталога имен и воркеры выполнения программ, когда окно уже показано"""
+        import symbol_catalog
+        symbol_catalog.start_building()
+        self.interpreter.start_workers()
 
     def add_block(self, block_type: blocks.BaseBlock.__class__) -> blocks.BaseBlock:
         """добавляет block_type в окно программы, block_type обязательно должен быть наследником BaseBlock"""
@@ -70,7 +106,8 @@ class Program(QtWidgets.QMainWindow, MainWindow, visual_elements.Drawer):
             return
         new_block = block_type(self)
         new_block.move(15, self.menu_bar.height() + self.block_toolbar.height() + 15)
-        self.blocks.append(new_block)
+        self.blocks.add(new_block)
+        self.schedule_validation()
         return new_block
 
     def dragEnterEvent(self, event: QtGui.QDragEnterEvent) -> None:
@@ -90,32 +127,89 @@ class Program(QtWidgets.QMainWindow, MainWindow, visual_elements.Drawer):
         if issubclass(current_block.__class__, blocks.BaseGeneralBlockWithAdditionalBlocks):
             current_block = current_block.highest_additional_block
         current_block.move(mouse_pos.x() - current_block.width() // 2, mouse_pos.y() - current_block.height() // 2)
-        current_block.move_related_blocks()
+        self.layout_engine.layout(current_block.node)
 
+    @profiled()
     def recalculate_position(self) -> None:
-        """пересчитывает позицию Arrow между блоками, между которыми установлена связь"""
-        arrows = []
+        """пересчитывает позицию всех Arrow между блоками, между которыми установлена связь"""
+        arrows = {}
         for previous_block in self.blocks:
-            if not previous_block.child:
-                continue
-            next_block = previous_block.child
-            try:
-                line = QtCore.QLine(previous_block.pos() + previous_block.rect().center(),
-                                    next_block.pos() + next_block.rect().center())
-                intersect_point = visual_elements.get_line_rect_intersection(line, next_block)
-                new_arrow = visual_elements.Arrow(previous_block.pos() + previous_block.rect().center(),
-                                                  intersect_point)
-                arrows.append(new_arrow)
-            except RuntimeError:
-                previous_block.child = None
-                continue
-
-            # arrows.append(arrowhead2)
+            arrow = self.get_arrow(previous_block)
+            if arrow is not None:
+                arrows[previous_block.node] = arrow
         self.arrows = arrows
 
-    def eventFilter(self, a0: QtCore.QObject, a1: QtCore.QEvent) -> bool:
-        if a1.type() == QtCore.QEvent.Move and a0 in self.blocks:
+    def arrange_blocks(self):
+        """раскладывает схему по слоям графа связей child. раскладка считается в фоновом потоке по снимку размеров
+         конструкций, а применяется одним проходом в apply_arrangement"""
+        if self.arranging or not self.check_loaded():
+            return
+        import auto_layout
+        from concurrent.futures import ThreadPoolExecutor
+        self.layout_engine.flush()
+        sizes = {}
+        edges = []
+        for block in self.blocks:
+            root = block.node.root
+            if root not in sizes:
+                sizes[root] = layout_engine.compound_size(root)
+            if block.node.child is not None:
+                edges.append((root, block.node.child.root))
+        if self.arrange_executor is None:
+            self.arrange_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='arrange')
+        self.arranging = True
+        self.status_bar.showMessage('Arranging...')
+        future = self.arrange_executor.submit(auto_layout.arrange, sizes, edges)
+        future.add_done_callback(lambda done: self.arrange_finished.emit(done))
+
+    def apply_arrangement(self, future):
+        """переносит корни конструкций в рассчитанные положения и раскладывает конструкции за один проход"""
+        self.arranging = False
+        try:
+            positions = future.result()
+        except Exception as error:
+            self.status_bar.showMessage(f'Arrange failed: {error!r}')
+            return
+        left = 15
+        top = self.menu_bar.height() + self.block_toolbar.height() + 15
+        self.setUpdatesEnabled(False)
+        try:
+            for root, (x, y) in positions.items():
+                # пока раскладка считалась, конструкцию могли удалить или вложить в другую
+                if root.parent_node is None and layout_engine.has_view(root):
+                    root.view.move(left + x, top + y)
+                    self.layout_engine.schedule(root)
+            self.layout_engine.flush()
             self.recalculate_position()
+        finally:
+            self.setUpdatesEnabled(True)
+        self.status_bar.showMessage(f'Arranged {len(positions)} constructions')
+
+    def recalculate_block_arrows(self, block: blocks.BaseBlock) -> None:
+        """пересчитывает только Arrow, которые выходят из блока или входят в него"""
+        node = block.node
+        for source in [node, *node.incoming]:
+            self.set_arrow(source, self.get_arrow(source.view))
+
+    def get_arrow(self, previous_block: blocks.BaseBlock):
+        """строит Arrow от блока к его child, если связь установлена"""
+        if previous_block is None or not previous_block.child:
+            return None
+        next_block = previous_block.child
+        try:
+            line = QtCore.QLine(previous_block.pos() + previous_block.rect().center(),
+                                next_block.pos() + next_block.rect().center())
+            intersect_point = visual_elements.get_line_rect_intersection(line, next_block)
+            return visual_elements.Arrow(previous_block.pos() + previous_block.rect().center(), intersect_point)
+        except RuntimeError:
+            previous_block.child = None
+            return None
+
+    @profiled()
+    def eventFilter(self, a0: QtCore.QObject, a1: QtCore.QEvent) -> bool:
+        """фильтр установлен только на блоки, поэтому достаточно проверить тип события"""
+        if a1.type() == QtCore.QEvent.Move:
+            self.recalculate_block_arrows(a0)
         return super(Program, self).eventFilter(a0, a1)
 
     def change_state(self, new_state: ProgramState) -> None:
@@ -139,43 +233,94 @@ class Program(QtWidgets.QMainWindow, MainWindow, visual_elements.Drawer):
         if issubclass(self.sender().highest_layer.highest_general_block.__class__,
                       blocks.BaseGeneralBlockWithAdditionalBlocks):
             self.connecting_parent.child = self.sender().highest_layer.highest_general_block.highest_additional_block
+        self.recalculate_block_arrows(self.connecting_parent)
+        self.schedule_validation()
         self.connecting_parent = None
         self.change_state(ProgramState.PLACING)
-        self.recalculate_position()
 
-    def execute_program(self):
-        """запускает выполнение составленной программы в консоли"""
+    def schedule_validation(self):
+        """проверяет схему в фоне, когда правки прекратятся на VALIDATION_DELAY мс"""
+        self.validation_generation += 1
+        self.validation_timer.start()
+
+    def start_validation(self):
+        """снимает связи блоков в окне и проверяет их в фоновом потоке. в потоке интерфейса собираются только
+         закэшированные в узлах кортежи связей, граф строится в фоне"""
+        import diagram_validation
+        from concurrent.futures import ThreadPoolExecutor
+        links = diagram_validation.snapshot(self.blocks.nodes)
+        if self.validation_executor is None:
+            self.validation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='validation')
+        generation = self.validation_generation
+        future = self.validation_executor.submit(diagram_validation.check_snapshot, links)
+        future.add_done_callback(lambda done: self.validation_finished.emit(done, generation))
+
+    def apply_validation(self, future, generation: int):
+        if generation != self.validation_generation:
+            return  # схему уже изменили, ждем следующую проверку
         try:
-            self.interpreter.execute(self.blocks)
-        except ValueError as error:
-            self.status_bar.showMessage(repr(error))
-        except SequenceError as error:
-            self.status_bar.showMessage(repr(error))
-        self.change_state(ProgramState.PLACING)
-
-    def delete_block(self):
-        """подчищает зависимости блка, который вызвал этот метод"""
-        sender_block: blocks.BaseBlock = self.sender()
-        self.delete_from_blocks(sender_block)
-        if sender_block.layer_down_block is not None:
-            current_block = sender_block.layer_down_block
-            for i in range(sender_block.layer_depth):
-                self.delete_from_blocks(current_block)
-                current_block = current_block.layer_down_block
-        if sender_block.layer_up_block is not None:
-            sender_block.layer_up_block.layer_down_block = None
-        self.recalculate_position()
+            diagnostics = future.result()
+        except Exception as error:
+            self.status_bar.showMessage(f'Validation failed: {error!r}')
+            return
+        self.show_diagnostics(diagnostics)
+
+    def show_diagnostics(self, diagnostics: list):
+        """отмечает блоки с проблемами и выводит первую ошибку в строку состояния"""
+        messages = {}
+        for diagnostic in diagnostics:
+            if diagnostic.block_id is not None:
+                messages.setdefault(diagnostic.block_id, []).append(diagnostic.message)
+        for block in self.problem_blocks:
+            if block in self.blocks and block.node.id not in messages:
+                block.set_problem(None)
+        self.problem_blocks = []
+        for block_id, block_messages in messages.items():
+            block = self.blocks.get(block_id)
+            if block is not None:
+                block.set_problem('\n'.join(block_messages))
+                self.problem_blocks.append(block)
+        errors = [i for i in diagnostics if i.is_error]
+        if errors:
+            self.status_bar.showMessage(f'{len(errors)} problems: {errors[0].message}')
+        elif diagnostics:
+            self.status_bar.showMessage(f'{len(diagnostics)} warnings: {diagnostics[0].message}')
+        else:
+            self.status_bar.clearMessage()
 
-    def delete_from_blocks(self, block_to_delete: blocks.BaseBlock):
-        """удаляет блок из списка блоков"""
-        try:
-            index = self.blocks.index(block_to_delete)
-        except ValueError:
+    def execute_program(self):
+        """запускает составленную программу в консоли запуска"""
+        if not self.check_loaded():
             return
-        for block in self.blocks:
-            if block.child == self.blocks[index]:
-                block.child = None
-        del self.blocks[index]
+        self.run_program(self.blocks)
+        self.change_state(ProgramState.PLACING)
+
+    def show_sequence_error(self, error: SequenceError):
+        self.show_diagnostics(error.diagnostics)
+
+    def closeEvent(self, a0: QtGui.QCloseEvent) -> None:
+        self.stop_program()
+        self.stop_autosave()
+        if self.arrange_executor is not None:
+            self.arrange_executor.shutdown(wait=False)
+        if self.validation_executor is not None:
+            self.validation_executor.shutdown(wait=False)
+        super(Program, self).closeEvent(a0)
+
+    def transaction(self) -> block_transaction.BlockTransaction:
+        """пакетное удаление блоков: изменения применяются одним проходом при выходе из with"""
+        return block_transaction.BlockTransaction(self)
+
+    def delete_blocks(self, blocks_to_delete):
+        """удаляет блоки вместе с зависимыми от них блоками и связями, которые в них входят и из них выходят"""
+        with self.transaction() as transaction:
+            for block in blocks_to_delete:
+                transaction.delete(block)
+
+    def clear_blocks(self):
+        """удаляет все блоки окна"""
+        with self.transaction() as transaction:
+            transaction.clear()
 
     def merge_block(self):
         """обеспечивает интерфейс для выбора блока для мержда, устанавливает зависимости"""
@@ -204,8 +349,7 @@ class Program(QtWidgets.QMainWindow, MainWindow, visual_elements.Drawer):
         if ok:
             try:
                 new_block = self.add_block(items_data[block_type])
-                parent_block._lines.append(new_block)
-                new_block.general_block = parent_block
+                parent_block.append_line(new_block)
             except KeyError:
                 self.status_bar.showMessage('Incorrect Block type')
 
@@ -235,30 +379,108 @@ class Program(QtWidgets.QMainWindow, MainWindow, visual_elements.Drawer):
     def save_file(self):
         """обеспечивает интерфейс для выбора директории для сохранения файла и его имени в случае, если никакой файл
          открыт не был"""
-        if self.current_file and os.path.exists(self.current_file):
+        import save_diagram
+        if not self.check_loaded():
+            return
+        if self.autosaver is not None and self.autosaver.db_name == self.current_file:
+            self.autosave()
+        elif self.current_file and os.path.exists(self.current_file):
             save_diagram.fill_data_base(self.current_file, self.blocks)
+            self.start_autosave(self.current_file)
         else:
             self.save_as_file()
 
     def save_as_file(self):
         """обеспечивает интерфейс для выбора директории для сохранения файла"""
+        import save_diagram
+        if not self.check_loaded():
+            return
         file_name = QtWidgets.QFileDialog.getSaveFileName(self, 'Save File', '.', filter='*.sqlite')[0]
         if file_name:
+            self.stop_autosave()
             save_diagram.fill_data_base(file_name, self.blocks)
             self.current_file = file_name
             self.setWindowTitle(self.current_file)
+            self.start_autosave(file_name)
 
     def open_file(self):
         """обеспечивает интерфейс для выбора загружаемого файла"""
-        clone_blocks = self.blocks.copy()
-        for block in clone_blocks:
-            block.delete()
+        if self.loader is not None:
+            return
+        self.stop_autosave()
+        self.clear_blocks()
         file_name = QtWidgets.QFileDialog.getOpenFileName(self, 'Save File', '.', filter='*.sqlite')[0]
         if file_name:
-            opened_blocks = save_diagram.load_data_base(file_name, self)
-            self.blocks = opened_blocks.copy()
-            for block in self.blocks:
-                block.resize_block()
-                block.move_related_blocks()
+            import diagram_loader
             self.current_file = file_name
             self.setWindowTitle(self.current_file)
+            visible_rect = self.rect().adjusted(-100, -100, 0, 0)
+            self.loader = diagram_loader.DiagramLoader(file_name, self, visible_rect, self)
+            self.loader.chunk_loaded.connect(self.blocks.extend)
+            self.loader.progress.connect(self.show_loading_progress)
+            self.loader.finished.connect(self.finish_loading)
+            self.loading_progress.show()
+            self.set_whole_diagram_actions_enabled(False)
+            # изменения отслеживаются с первой порции, правки во время загрузки тоже попадут в файл
+            try:
+                self.start_autosave(file_name)
+                self.loader.start()
+            except Exception as error:
+                # окно не должно остаться в режиме загрузки: команды всей схемы снова доступны
+                self.loader = None
+                self.loading_progress.hide()
+                self.set_whole_diagram_actions_enabled(True)
+                self.stop_autosave()
+                self.clear_blocks()
+                self.current_file = None
+                self.setWindowTitle('Untitled')
+                self.status_bar.showMessage(f'Open failed: {error!r}')
+
+    def check_loaded(self) -> bool:
+        """команды, которым нужна вся схема, недоступны, пока файл загружается"""
+        if self.loader is None:
+            return True
+        self.status_bar.showMessage('Wait until the file is loaded')
+        return False
+
+    def set_whole_diagram_actions_enabled(self, enabled: bool):
+        for action in (self.save_file_action, self.save_as_file_action, self.arrange_action,
+                       self.execute_program_action):
+            action.setEnabled(enabled)
+
+    def show_loading_progress(self, loaded: int, total: int):
+        self.loading_progress.setMaximum(total)
+        self.loading_progress.setValue(loaded)
+
+    def finish_loading(self):
+        """вызывается, когда созданы виджеты для всех блоков открытого файла"""
+        self.loader = None
+        self.loading_progress.hide()
+        self.set_whole_diagram_actions_enabled(True)
+        self.recalculate_position()
+        self.schedule_validation()
+
+    def start_autosave(self, file_name: str):
+        """начинает периодически записывать в файл изменения, сделанные после его сохранения или открытия"""
+        import save_diagram
+        self.stop_autosave()
+        self.autosaver = save_diagram.IncrementalSaver(file_name, self.blocks.nodes)
+        self.autosaver.start()
+        self.autosave_timer.start()
+
+    def stop_autosave(self):
+        """записывает оставшиеся изменения и перестает отслеживать их"""
+        self.autosave_timer.stop()
+        if self.autosaver is not None:
+            self.autosaver.close()
+            self.autosaver = None
+
+    def autosave(self):
+        import sqlite3
+        try:
+            written = self.autosaver.flush()
+        except sqlite3.Error as error:
+            self.status_bar.showMessage(f'Autosave failed: {error}')
+            return
+        if written:
+            self.status_bar.showMessage(f'Saved {written} changed blocks', 2000)
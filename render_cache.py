@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""общий для процесса кэш ресурсов отрисовки: декодированные картинки, картинки под размер блока и размеры текста.
+ все кэши вытесняют давно не использованные записи"""
+import collections
+import os
+
+from PyQt5 import QtCore, QtGui
+
+import resources_rc  # noqa: F401 регистрирует картинки из pictures.qrc
+
+
+class LRUCache:
+    """словарь ограниченного размера, при переполнении удаляет давно не использованную запись"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.data = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, factory):
+        """значение по ключу. если его нет, оно создается вызовом factory() и запоминается"""
+        try:
+            value = self.data[key]
+        except KeyError:
+            self.misses += 1
+            value = self.data[key] = factory()
+            if len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+            return value
+        self.hits += 1
+        self.data.move_to_end(key)
+        return value
+
+    def clear(self):
+        self.data.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self.data)
+
+
+PIXMAPS = LRUCache(64)
+SCALED_PIXMAPS = LRUCache(1024)
+TEXT_RECTS = LRUCache(8192)
+
+
+def get_pixmap(path: str) -> QtGui.QPixmap:
+    """картинка, декодируется один раз. относительные пути берутся из скомпилированных ресурсов (pictures.qrc),
+     а не с диска относительно текущей директории"""
+    if not os.path.isabs(path) and not path.startswith(':'):
+        path = ':/' + os.path.normpath(path).replace(os.sep, '/')
+    return PIXMAPS.get(path, lambda: QtGui.QPixmap(path))
+
+
+def get_scaled_pixmap(pixmap: QtGui.QPixmap, width: int, height: int) -> QtGui.QPixmap:
+    """картинка, растянутая под размер блока, растягивается один раз для каждого размера"""
+    if pixmap.width() == width and pixmap.height() == height:
+        return pixmap
+    return SCALED_PIXMAPS.get((pixmap.cacheKey(), width, height), lambda: pixmap.scaled(
+        width, height, QtCore.Qt.AspectRatioMode.IgnoreAspectRatio, QtCore.Qt.TransformationMode.FastTransformation))
+
+
+def get_text_rect(font: QtGui.QFont, text: str) -> QtCore.QRect:
+    """прямоугольник, который занимает текст, написанный шрифтом font"""
+    return TEXT_RECTS.get((font.key(), text), lambda: QtGui.QFontMetrics(font).boundingRect(text))
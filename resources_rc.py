@@ -0,0 +1,676 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x01\x6f\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x96\x00\x00\x00\x51\x08\x06\x00\x00\x00\x30\xec\x5f\xee\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
+\x0e\x1b\x00\x00\x01\x04\x49\x44\x41\x54\x78\x5e\xed\xd4\xc1\x0d\
+\x02\x31\x0c\x00\xc1\x84\x02\x68\xe7\xfa\x7f\xd2\x0e\x0d\x84\xe3\
+\x40\x34\x40\xf6\x37\x23\x59\x76\x01\x2b\xcf\x31\xc6\x3a\x07\xb6\
+\xba\x7d\x37\x6c\xf5\xfb\x58\xeb\x71\x7f\x2f\xf8\xcb\x3c\x9e\xd7\
+\xf6\xb1\x48\x08\x8b\x84\xb0\x48\x08\x8b\x84\xb0\x48\x08\x8b\x84\
+\xb0\x48\x08\x8b\x84\xb0\x48\x08\x8b\x84\xb0\x48\x08\x8b\x84\xb0\
+\x48\x08\x8b\x84\xb0\x48\x08\x8b\x84\xb0\x48\x08\x8b\x84\xb0\x48\
+\x08\x8b\x84\xb0\x48\x08\x8b\x84\xb0\x48\x08\x8b\x84\xb0\x48\x08\
+\x8b\x84\xb0\x48\x08\x8b\x84\xb0\x48\x08\x8b\x84\xb0\x48\x08\x8b\
+\x84\xb0\x48\x08\x8b\x84\xb0\x48\x08\x8b\x84\xb0\x48\x08\x8b\x84\
+\xb0\x48\x08\x8b\x84\xb0\x48\x08\x8b\x84\xb0\x48\x08\x8b\x84\xb0\
+\x48\x08\x8b\x84\xb0\x48\x08\x8b\x84\xb0\x48\x08\x8b\x84\xb0\x48\
+\x08\x8b\x84\xb0\x48\x08\x8b\x84\xb0\x48\x08\x8b\x84\xb0\x48\x08\
+\x8b\x84\xb0\x48\x08\x8b\x84\xb0\x48\x08\x8b\x84\xb0\x48\x08\x8b\
+\x84\xb0\x48\x08\x8b\x84\xb0\x48\x08\x8b\x84\xb0\x48\x08\x8b\x84\
+\xb0\x48\x08\x8b\x84\xb0\x48\x08\x8b\x84\xb0\x48\x08\x8b\xc4\x3c\
+\x67\x7d\x4e\xd8\xc7\xc7\x22\x30\xc6\x0b\xce\x03\x06\x9d\x0f\xb8\
+\x01\xa6\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x71\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x96\x00\x00\x00\x51\x08\x06\x00\x00\x00\x30\xec\x5f\xee\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0e\xc2\x00\x00\x0e\xc2\x01\x15\x28\
+\x4a\x80\x00\x00\x01\x06\x49\x44\x41\x54\x78\x5e\xed\xd4\x5b\x0d\
+\x02\x51\x0c\x40\xc1\x2e\x22\xb0\x80\x34\x34\x21\x0d\x0b\x98\x58\
+\x96\x47\x30\xc0\x3d\x7f\x33\x49\xd3\x0a\x38\xe9\x36\x33\xfb\x31\
+\xb0\xd4\xe9\xbb\x61\xa9\xdf\xc7\xba\xdd\x1f\xaf\x05\x7f\xb9\x5e\
+\xce\xef\xed\x63\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\
+\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\
+\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\
+\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\
+\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\
+\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\
+\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\
+\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\
+\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\
+\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\
+\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\
+\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\
+\x89\xed\x98\xfd\x73\xc2\x3a\x3e\x16\x81\x99\x27\xff\xc2\x06\x9d\
+\xf8\xbd\xf5\xfb\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x01\xce\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x96\x00\x00\x00\x51\x08\x06\x00\x00\x00\x30\xec\x5f\xee\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
+\x0e\x1b\x00\x00\x01\x63\x49\x44\x41\x54\x78\x5e\xed\xda\x51\x6a\
+\xdb\x40\x14\x40\x51\xc9\x4e\x43\xd6\x91\xf5\x14\xba\xd6\x40\xd7\
+\x93\x7d\xa4\xb5\xad\xa6\x89\xf0\x67\x9c\xc4\xbe\xa0\x81\x73\x40\
+\xcc\x5b\xc0\x65\x66\x90\x34\x4f\xd3\xb4\xbc\x3e\x70\x53\xbb\x75\
+\x85\x9b\x3a\xef\x58\x8f\x4f\x3f\xff\x2f\x70\x95\xe7\x5f\xbf\xdf\
+\x56\x3b\x16\x09\x61\x91\xb8\x18\xd6\xc3\xfe\x7e\x9d\xe0\xf3\x2e\
+\x86\xf5\x72\xfc\xbb\x4e\xf0\x79\x17\xc3\x5a\xbc\x8d\xe0\x1b\xdc\
+\xb1\x48\x7c\x18\xd6\xfc\xf6\x36\x02\xbe\xee\xc3\xb0\xb6\x7a\x0c\
+\xde\xed\xee\xd6\x89\xad\x1a\xf2\x28\x3c\x9c\x0e\xeb\xc4\x56\xb9\
+\x63\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\
+\x91\x10\x16\x89\x21\xc2\xda\xcd\x3e\x2d\x8d\x66\x88\xb0\x4e\x8b\
+\x3f\x2c\x46\x73\x0e\x6b\x3f\xef\xd7\x09\xae\x77\x0e\xeb\xb8\x1c\
+\xd7\x09\xae\xb7\xf9\xa3\xf0\x7e\xf7\x63\x9d\x18\xc9\xe6\xc3\xfa\
+\x73\xf2\x6b\xf4\x88\x86\xb8\xbc\x33\x1e\x61\x91\x10\x16\x09\x61\
+\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\
+\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\
+\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\
+\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\
+\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\
+\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\
+\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\
+\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x89\xf9\xf5\x59\xde\
+\x47\xb8\x1d\x3b\x16\x81\x69\xfa\x07\xe1\xc2\x19\x9d\xbd\xff\x03\
+\x87\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x70\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x96\x00\x00\x00\x51\x08\x06\x00\x00\x00\x30\xec\x5f\xee\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0e\xc2\x00\x00\x0e\xc2\x01\x15\x28\
+\x4a\x80\x00\x00\x01\x05\x49\x44\x41\x54\x78\x5e\xed\xd4\x5b\x0d\
+\x02\x51\x0c\x40\xc1\x2e\xd2\x10\x44\x90\x42\x10\x84\xb5\x65\x79\
+\x04\x03\xdc\xf3\x37\x93\x34\xad\x80\x93\x6e\x33\xb3\x1f\x03\x4b\
+\x9d\xbe\x1b\x96\xfa\x7d\xac\xeb\xfd\xf1\x5a\xf0\x97\xdb\xe5\xfc\
+\xde\x3e\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\
+\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\
+\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\
+\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\
+\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\
+\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\
+\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\
+\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\
+\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\
+\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\
+\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\
+\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\xd8\
+\x8e\xd9\x3f\x27\xac\xe3\x63\x11\x98\x79\x02\x9b\xd3\x06\x9d\x9f\
+\xb8\x70\x2e\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x6f\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x96\x00\x00\x00\x51\x08\x06\x00\x00\x00\x30\xec\x5f\xee\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
+\x0e\x1b\x00\x00\x01\x04\x49\x44\x41\x54\x78\x5e\xed\xd4\x5b\x0d\
+\x02\x51\x0c\x40\xc1\x2e\xee\xf0\x00\xea\xc0\x03\xf2\x96\xe5\x11\
+\x0c\x70\xcf\xdf\x4c\xd2\xb4\x02\x4e\xba\xcd\xcc\x7e\x0c\x2c\x75\
+\xfa\x6e\x58\xea\xf7\xb1\x6e\xe7\xfb\x6b\xc1\x5f\xae\x8f\xcb\x7b\
+\xfb\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\
+\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\
+\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\
+\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\
+\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\
+\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\
+\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\
+\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\
+\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\
+\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\
+\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\
+\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x62\x3b\
+\x66\xff\x9c\xb0\x8e\x8f\x45\x60\xe6\x09\x2e\x53\x06\x9d\x7b\xd5\
+\x8c\xb7\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x6e\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x96\x00\x00\x00\x51\x08\x06\x00\x00\x00\x30\xec\x5f\xee\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
+\x0e\x1b\x00\x00\x01\x03\x49\x44\x41\x54\x78\x5e\xed\xd4\xc1\x0d\
+\x02\x31\x0c\x00\xc1\x84\x9e\x28\xe3\xaa\xa5\x0c\x8a\x0a\xc7\x81\
+\x68\x80\xec\x6f\x46\xb2\xec\x02\x56\x9e\x63\x8c\x75\x0e\x6c\x75\
+\xfb\x6e\xd8\xea\xf7\xb1\xd6\xfd\x78\x2f\xf8\xcb\x7c\x3e\xae\xed\
+\x63\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\
+\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\
+\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\
+\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\
+\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\
+\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\
+\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\
+\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\
+\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\
+\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\
+\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\
+\x91\x10\x16\x09\x61\x91\x10\x16\x09\x61\x91\x10\x16\x89\x79\xce\
+\xfa\x9c\xb0\x8f\x8f\x45\x60\x8c\x17\x0c\x1b\x06\x9d\xab\xab\x7b\
+\xf4\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x0a\x61\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x96\x00\x00\x00\x51\x08\x06\x00\x00\x00\x30\xec\x5f\xee\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
+\x0e\x1b\x00\x00\x09\xf6\x49\x44\x41\x54\x78\x5e\xed\x9d\x7b\x8c\
+\x1d\x55\x1d\xc7\xbb\xb4\x50\xa9\x8a\xf8\x68\x25\x56\xac\x14\xb5\
+\x20\x92\x20\xd2\x80\x35\x46\x25\x81\xf8\x00\x0b\x01\x4b\x08\x96\
+\x62\x08\x88\x09\xf1\xf1\x0f\x86\x18\x8b\x80\x44\x49\xd4\x28\xf2\
+\x48\x40\x42\x8c\x0f\x2a\x3e\x08\x88\xa8\xf5\x41\x88\x51\xab\xa8\
+\x01\x8a\x36\x85\x50\x1e\xad\xb5\xa5\x3c\x6c\x0b\x94\x02\x6d\xfd\
+\x7c\x86\x33\xeb\xec\xec\xdd\xfb\xda\x99\xdd\x7b\xef\xfe\x3e\xc9\
+\x37\xbf\x7b\x67\xef\xe3\xcc\x9c\xef\xfe\xce\x99\x73\x67\xce\x99\
+\x36\x88\xec\xd9\xb3\x67\xa8\xa4\xe9\x68\x16\x9a\x99\x74\x10\xfa\
+\x1e\xda\xe1\xcb\xeb\x10\x3c\x89\x2e\x47\x47\xa2\xfd\x51\xfe\xdd\
+\xfb\xa0\xbd\x0a\x1a\xe2\xf5\x03\x47\xdf\xef\x54\xaa\x18\x35\x1d\
+\x1d\x80\xe6\xa3\x57\xa2\x99\x43\x43\x43\xc6\x83\xd0\xfb\xd1\x3b\
+\xd0\x3e\x68\xef\x14\x27\x6a\xdf\x77\x23\x0d\xbc\x0b\x59\xc6\xe7\
+\xd0\xdd\x68\x15\x65\x7f\x91\xa8\x11\xd7\xa0\x3b\xd1\x7f\x91\xaf\
+\xdb\x45\xd9\xdd\xde\xb7\xf4\x9d\xb1\xfc\x2f\x27\xbc\x0a\xbd\x11\
+\xbd\x0d\x1d\x45\x25\x2c\x22\xbe\x0b\xbd\x1c\x75\xc4\xfc\x5b\x4e\
+\x48\x8f\xaa\x65\xdd\xe2\xdb\xd2\xa3\xb6\x78\x1e\x3d\x8c\x1e\x43\
+\xdb\xd9\xc7\x7b\x89\xd7\xa0\x47\xfb\xd5\x60\x3d\x6f\x2c\x0e\xb2\
+\xff\xe5\xaf\x46\xf3\xd0\xe1\xe8\x23\x1c\xec\x63\xd3\xb6\x96\xe5\
+\xaf\xcb\x38\xe3\xa5\x85\xf1\x5e\x40\xab\xd1\x4d\xc8\x26\xf5\xdf\
+\xc4\x87\xd0\x13\xc8\xec\xb7\x83\x63\xf0\x22\xdb\xb3\xfd\xef\x45\
+\xf3\xf5\x9c\xb1\x38\x58\x2f\x23\x98\x91\x0e\x46\x47\xa2\x85\x1c\
+\x38\xa3\xcf\xfd\x5b\xc3\x32\xf7\xaa\x81\x3a\xa5\x89\xe1\x34\x8f\
+\x4d\xe7\x16\x8e\xd1\xd5\xc4\x2b\xd0\x33\x6e\x0f\x63\x8d\x41\xfa\
+\xcf\xdb\x17\xbd\x07\x9d\xcd\x81\x3a\x9e\xb8\x3f\x1a\x68\x13\xb5\
+\x4b\x03\xb3\x3d\x85\x56\xa2\xbf\xa3\xb5\x1c\xbf\x07\x88\x1b\xd1\
+\x76\x8e\x9d\x7d\xba\x49\x67\xd2\x8c\x95\xcc\x64\x27\xda\x4c\x74\
+\x0a\x07\xe4\x63\xc4\x43\x90\x9d\xeb\x11\x4c\x35\x23\xb5\xa2\x64\
+\x34\xb3\xd8\x66\x64\xd3\xe9\x09\xc1\xed\x44\x4f\x06\x9e\x99\xcc\
+\x4c\x36\xe1\xc6\x4a\x86\xb2\x7f\x74\x2a\x3a\x87\x9d\x3f\x8c\x38\
+\xaa\x89\x0b\x33\xb5\x4f\xc1\x68\x1a\x69\x1b\xba\x8b\xe3\x7c\x03\
+\x71\x15\xda\x82\x9e\x9e\x68\x93\x4d\x98\xb1\xd8\x51\x33\x91\xd9\
+\xe9\x04\x76\x72\x29\xf1\x50\x34\x22\x3b\x85\x99\xc6\x4f\xc1\x64\
+\x0e\x5b\x68\xb2\x0d\x1c\xfb\xeb\x88\x3f\x45\x0e\x67\xd8\xf1\xaf\
+\xdd\x64\xb5\x1b\xab\x90\xa1\x2e\x63\x87\x4e\x27\xee\x87\x86\xbf\
+\x37\xcc\x54\x0f\xa5\xe6\x52\x93\x69\xb0\x5b\x89\x1a\xec\x2f\xd4\
+\x85\xe3\x69\xb5\x51\x8b\xb1\x92\x99\xe6\x20\xe3\x02\x76\xe2\x12\
+\xe2\x31\xc8\x3e\x55\x98\x69\x82\x29\x98\xcc\xfe\xd8\x7a\xea\xe7\
+\x17\xc4\xeb\xd1\x6a\xea\x46\xd3\x55\x4e\xe5\xc6\xa2\xd0\xaf\x21\
+\x9c\x8b\x96\x51\x68\x3b\x95\x47\x20\x87\x0f\xc2\x50\x93\x4c\xc9\
+\x60\x66\x30\xc7\xc9\xbe\x8b\x1c\x88\x7d\xda\x3f\x54\x45\x65\xc6\
+\xa2\x90\x33\x08\x27\xa3\x2f\x51\xc8\x05\x44\x07\x36\x33\xc2\x50\
+\xbd\x45\xc1\x60\x0e\x4d\x6c\xa5\xee\xee\x27\x2e\x47\xbf\xa5\xee\
+\x2a\x19\xae\xa8\xc4\x58\x14\x6c\x2e\xe1\x5b\x14\x6a\x31\x51\x83\
+\x65\x84\xa1\x7a\x9b\x52\x3f\x6c\x1b\xf5\x78\x39\xd1\x7a\x74\xe0\
+\x75\x5c\x8c\xcb\x58\x14\xc4\xdf\xed\x4e\x43\x5f\xa5\x30\x6f\xca\
+\x36\x42\x18\xaa\xbf\x28\x18\x6c\x27\x75\xba\x82\x78\x11\xda\x40\
+\x9d\x76\xdd\xff\xea\xda\x58\x14\xe0\xb5\x84\xeb\xf9\xf2\x0f\x13\
+\xb3\x61\x83\x30\x54\x7f\x93\x0c\xe6\xd9\xe2\x7d\xd4\xef\x8d\xc4\
+\x2b\xa8\x5f\xfb\x63\x1d\xd3\xb1\xb1\x52\x96\xd2\x4c\xdf\xe1\x4b\
+\xf3\x33\xbf\x30\xd5\x80\x50\xc8\x5e\xcf\x53\xd7\x3f\x22\x3a\x88\
+\xbd\xf3\xa5\x4d\xed\xd3\x91\xb1\xf8\x22\x87\x0b\x96\xf3\x45\x9f\
+\x25\x66\x97\xa8\x84\xa1\x06\x93\x64\x30\x3b\xf2\x77\x52\xef\x27\
+\x53\xe7\x5b\xdd\xd0\x2e\x6d\x1b\x8b\x0f\xf7\x2c\xef\x2a\xbe\xe0\
+\x2c\xe2\x4c\xb7\x85\xa9\x06\x9b\x82\xb9\xfe\x4a\xfd\x2f\x21\xda\
+\xef\x6a\x6b\xd4\xde\x66\xad\x25\x7c\xa8\xaf\x73\x18\xe1\x13\xc4\
+\x30\xd5\x14\x21\xd5\xb1\x75\x7f\x34\x75\xef\x15\xae\x67\xe1\x85\
+\x39\xa8\x65\x42\x6a\xf9\x82\xf4\x21\x0e\x76\x5e\x4b\x8c\x4e\xfa\
+\x14\xa4\x74\xd6\xf8\x2b\xe2\x39\xe8\xf1\x66\xd9\xab\xa9\xb1\x92\
+\xa9\xbc\xf4\xd7\x9f\x00\x66\x87\xa1\xa6\x36\xc9\x60\x2f\xe0\x0b\
+\x7f\x73\x3c\x03\x5f\x8c\xd9\xa9\x1f\xb3\x29\xe4\xcd\xf6\xa9\x8e\
+\xe3\xcd\x57\x11\xc3\x54\x41\xde\x52\xed\x8d\x27\x4e\x24\x7e\x1b\
+\x8f\x0c\x0f\x86\x97\x69\x98\xb1\x78\x83\xbf\xf7\x5d\xc8\x07\x7c\
+\x88\x78\x58\x98\x2a\x28\x92\x32\xd7\x2e\x7c\xf2\x29\xa2\xc3\x4e\
+\xa3\x9a\xc4\x51\x19\x8b\x17\xbf\x82\xf0\x33\x5e\x7c\x3e\xd1\x8b\
+\xf0\x82\xa0\x11\xd3\xf1\x88\xbf\x2f\x7a\x8d\xdd\x28\x46\x18\x0b\
+\x53\x99\xc1\x2e\xe0\x0d\x5e\x7b\xee\x55\x9d\xd1\x51\x0f\x46\x51\
+\xf0\xc4\x5c\xbc\xf2\x03\x7c\xe3\xaf\x30\x23\x28\x67\x2c\xdd\x77\
+\x26\xca\xda\xce\x30\x55\x30\x16\xc9\x1b\x26\xa2\x85\x68\x05\xe6\
+\x1a\xbe\x9a\x45\x86\x8d\xc5\x1f\x34\x93\x63\x55\xd9\x8f\xc9\x61\
+\xaa\xa0\x15\xb9\xb9\xe0\x7d\xc4\x53\x7c\x92\x53\xcc\x58\x9e\x3e\
+\x7a\xa7\x4c\xd3\x21\x88\x20\x68\x80\x67\x8a\x5f\x27\x39\x79\x0b\
+\x5f\x46\x66\x2c\x36\xbc\x8e\x70\x19\x8a\x4b\x87\x83\x8e\x28\x78\
+\xc5\x29\x0f\xbc\xf3\x2a\x23\x9f\xed\xc4\x9b\x44\x9d\x50\x23\x08\
+\xba\x06\x0f\x2d\x4b\x5d\xaa\x2c\x63\xbd\x1e\x7d\x12\x65\x9d\xaf\
+\xc8\x56\x41\xa7\x14\x3c\xe3\xcc\x3e\xde\xc1\x9e\x19\xcb\xdb\xb2\
+\xdc\x10\x04\xe3\x65\x36\x5e\x7a\xa7\x0f\x9c\x94\xcc\x49\x25\xb2\
+\xad\x91\xad\x82\xf1\xb0\x6e\xf1\x6d\x5e\x62\xf3\x73\x74\x52\xf1\
+\xac\x30\x08\xc6\x8b\x7e\x3a\x96\x5c\x75\x60\x18\x2b\xa8\x1a\x67\
+\x51\x3c\xd7\x36\x30\xfb\x01\x31\x9a\xc1\xa0\x0a\xd2\x0f\xd4\x6b\
+\x23\x63\x05\x75\x70\x70\x18\x2b\xa8\x83\x19\x61\xac\xa0\x16\xc2\
+\x58\x41\x2d\x84\xb1\x82\x5a\x08\x63\x05\xb5\x10\xc6\x0a\x6a\x21\
+\x8c\x15\xd4\x82\x97\xcd\x64\x0f\x0a\x37\x25\x06\x41\x57\xe4\x1e\
+\xf2\xf7\x67\x33\xd6\xb3\xd9\xb3\x20\xa8\x06\x33\xd5\x7a\x8d\xe5\
+\x3c\x94\x2e\x12\x14\x04\x55\xe0\xba\x3f\x9f\xd7\x58\x57\xa2\x7f\
+\xb9\x25\x9a\xc3\xa0\x5b\x92\x77\x4c\x50\xce\xed\x70\x93\xc6\x5a\
+\x47\x93\xf8\x1b\x62\x57\x33\xb7\x05\x41\x81\xcd\x78\x69\xc5\xd0\
+\xd0\xd0\x6e\x8d\xb5\x1d\x39\x25\xf3\x3f\xfd\x4b\x64\xad\xa0\x53\
+\x0a\x9e\x79\x04\xb9\xc8\x67\x36\xdc\xe0\x04\xa6\x6b\x70\xda\xd7\
+\x88\x63\x4e\x4b\x13\x04\xad\xc0\x43\x4e\xeb\xed\xca\x64\x2f\x8d\
+\x63\x99\xba\x08\x77\xa0\x27\x7d\x1e\x59\x2b\x68\x97\x82\x57\xfe\
+\x83\xae\x49\x5e\x9a\xb6\x17\x0f\xf2\x2c\x65\xfb\x78\x73\x7a\x1c\
+\x04\x9d\xf0\x04\xde\x39\x13\x2f\xfd\x2d\x3d\xff\xff\xc8\x3b\x1b\
+\xed\xbc\xdf\xc8\x0b\xb2\xb9\xbd\x23\x6b\x05\xad\x48\x1e\x71\x76\
+\xe5\xaf\x10\x7f\xe7\x93\x9c\x61\x63\x25\xee\x43\x7f\x40\xd9\x4c\
+\x6d\x61\xae\x60\x2c\x92\x37\x4c\x42\x3e\xb8\xb2\xd0\xf2\x65\x94\
+\x8d\xe5\xa2\x89\x4b\x70\xa0\x53\x43\x46\x47\x3e\x68\xc5\x03\x78\
+\xe5\x7c\x4c\x35\x6a\xca\xc8\x11\xc6\xd2\x75\x48\x73\x9d\xc7\x1b\
+\xee\x71\x5b\x64\xad\xa0\x0c\x9e\x70\x95\x7d\x57\xaf\x38\x8f\xb8\
+\x29\xdb\x58\x62\xcc\x99\x65\x78\xd3\x5b\x08\xbf\xc7\x68\x07\xfa\
+\x3c\xee\xe2\x09\x24\x25\x9a\x3f\xe1\x8f\xb3\x89\xf7\xe3\x8f\xec\
+\x2c\xb0\x4c\xd3\x29\x8b\x78\xf3\x51\x84\x95\xbc\xd9\x15\x52\xc3\
+\x5c\x53\x1c\x4c\x65\xf7\xe8\x6e\x7c\x71\x12\x71\xbd\x2d\x5c\xf6\
+\x87\x06\x34\x35\x96\xf0\x21\xc7\x13\x1c\xa6\x77\xb2\x87\xec\xf5\
+\x61\xb0\xa9\x45\xa1\xa3\x7e\x0f\x7e\x38\x11\x2f\x6c\x74\x43\x33\
+\xca\x9d\xf7\x51\xf0\x21\x2b\x09\x8b\xf8\xc0\x7b\x89\x99\x43\xa3\
+\xdf\x35\x75\x48\x59\xca\xce\xf9\x2a\x3c\xf0\xf1\x76\x4c\x25\x2d\
+\x33\x56\x0e\x1f\x3a\x9b\x70\x33\x1f\xec\xda\xce\x31\xe5\xd1\x14\
+\x20\x25\x90\x47\xd1\x97\xa9\x7f\x9f\x6c\xa2\xfe\xdb\x1a\x2d\x68\
+\xdb\x58\xc2\x87\xbb\xe2\xd7\x37\xf9\xf0\x33\x88\xd9\xb4\x80\x61\
+\xae\xc1\x04\x53\x65\x4d\x1f\x5a\x4a\xbd\xaf\x69\xd7\x50\x39\x1d\
+\x19\x4b\xf8\x12\x17\x69\xba\x18\x39\x7e\x91\x2d\x2d\x27\x61\xb0\
+\xc1\x20\x65\xa9\x6d\xe8\xfb\xd4\xf5\xa5\xd4\x71\xc3\xe1\x84\x56\
+\x74\x6c\x2c\x49\xe6\x5a\x86\x96\xf0\xc5\x5e\xcb\xa5\xab\x16\x62\
+\xae\x6c\x65\xb0\xa0\x3f\x49\x59\xea\x21\x74\x31\x75\xfc\x13\xea\
+\xd6\xd5\x56\xbb\xa2\x2b\x63\x09\x5f\x6c\xc7\x5f\x23\xd9\xb1\x9b\
+\x43\x21\xcc\x62\x4b\xd1\xbe\x91\xbd\xfa\x8b\x94\xa5\xac\xc7\x3b\
+\xa8\xd7\x0b\x89\xab\xa9\xcf\xec\x37\xe3\x6e\xe9\xda\x58\x45\x28\
+\x8c\x9f\x33\x8b\xc2\x5c\x4a\x74\x7d\x95\x58\xd5\xa2\x0f\x48\x86\
+\x12\x33\x93\x4d\xdf\x17\x88\x5b\xa8\xc7\x8e\xfa\x53\x8d\xa8\xc4\
+\x58\x39\x14\xcc\xf5\x0c\xbf\x48\xc1\x3e\x47\x74\x4d\x9e\x8c\x30\
+\x58\x6f\x51\x30\x94\x78\xc9\xcb\x25\xc4\x6b\xa9\xb7\xae\x9b\xbe\
+\x32\x95\x1a\x4b\x28\xa4\xd3\x31\x1f\x87\x3e\x43\x41\xdf\x4b\x9c\
+\xe5\x76\x09\x83\x4d\x2e\x25\x43\xb9\x7a\x97\x97\x12\x9f\x8e\xee\
+\xaa\x22\x4b\x15\xa9\xdc\x58\x39\x29\x7b\xbd\x15\x39\x2b\xb3\xcb\
+\xd3\x0d\x77\xec\xc3\x60\x13\x4b\xc9\x50\xd6\x8d\x97\x0f\x7b\x37\
+\xcd\xa7\xa9\x9b\xc7\xb3\x8d\x15\x53\x9b\xb1\x72\xd8\x09\x07\x53\
+\x3f\x80\xbe\xc1\x4e\xbc\x9d\x38\x62\x31\x9f\x30\x59\x3d\x94\xcc\
+\x64\xc7\x7c\x13\x75\x61\xfc\x35\x72\x71\xd3\x07\xa9\x8f\xda\xee\
+\xcc\xaa\xdd\x58\x39\xec\x94\x63\x5e\x2e\x89\x71\x2a\x3b\x74\x04\
+\xd1\x85\x0b\xb2\x35\xa6\x25\x0c\x56\x0d\x25\x43\xd9\x67\xfa\x07\
+\xc7\xfe\xc7\x44\xaf\xf0\x74\x4c\xaa\xe9\x5a\xce\x55\x31\x61\xc6\
+\xca\x61\x27\x1d\xb1\xf7\x52\x1c\xfb\x5f\xef\x66\x27\xbd\x82\xc2\
+\x4b\x74\xec\x8b\x65\xe5\x09\x93\x75\x46\xb9\xa9\x03\xfb\x4f\xeb\
+\x89\x37\x20\x6f\xed\xf3\x4a\x84\x86\x97\xb7\xd4\xc5\x84\x1b\x2b\
+\x87\x1d\xf7\xbb\x3d\x73\x74\x11\xc5\x03\xd8\x71\xd7\x19\x3e\x0d\
+\xbd\x19\x45\x73\xd9\x84\x06\x46\xca\xd9\xcd\x71\xf5\x16\xf7\xeb\
+\xd0\x0f\xd1\x23\x1c\xd7\x49\xb9\x11\x79\xd2\x8c\x55\x24\x99\xcc\
+\x01\x57\x7f\xe8\x5e\xc4\xc1\x38\x9a\x38\x1f\x99\xd9\xe6\xa5\xed\
+\xc3\x66\x9b\x6a\x46\x6b\x62\x24\xd9\xc9\xf1\x5b\x4b\xb4\xa9\x53\
+\x7f\x44\x5b\x39\x86\xb5\x37\x77\xcd\xe8\x09\x63\x15\x49\x26\xb3\
+\xef\xa5\x99\x34\xd5\x3c\x0e\x92\x8b\x73\x66\x8f\xd1\x02\x34\x17\
+\x79\x96\x39\x5c\xfe\x41\x31\x5b\x0b\x13\x65\x70\x8c\x9c\x23\xc1\
+\xb3\xb9\x07\xd1\x45\xe8\xcf\xc8\x6d\x5e\x5a\x3e\xa9\x86\xca\xe9\
+\x39\x63\x49\xc1\x5c\x36\x95\xf6\x0d\x4c\xe7\xf9\x78\xd8\x0c\x0e\
+\xde\x1c\xe2\x21\xe8\x83\xc8\xbe\x9a\x46\x73\xad\xc5\x51\xfb\xd3\
+\xab\x86\x6b\xc7\x40\x09\x9b\x37\xef\x43\xb8\x1d\xdd\x82\x9c\x0a\
+\x61\x33\xda\x81\x76\xf5\x8a\x91\xca\xf4\xa4\xb1\x72\x38\xa0\x9a\
+\x45\x73\x59\x4e\xe7\xf1\x7a\x2e\x3f\x90\xfc\xcd\xa6\x73\x3f\x74\
+\x0c\xdb\x1c\xc6\xc8\x9b\xcd\x43\x53\xf4\x67\xa5\x96\xfb\x57\x97\
+\xf1\x3a\x30\x4e\x11\xff\x89\xb6\xb2\x6f\xde\x86\xe7\x1c\x08\x1b\
+\x52\xf4\x46\xd0\xa7\x7a\xd5\x44\x8d\xe8\x69\x63\xb5\x22\x65\xb6\
+\xbc\xef\x65\x86\x73\x48\xc3\xd5\x62\x35\xda\x72\x2a\xe2\x70\x62\
+\x7e\x95\xac\x95\xe2\xe9\xb7\x97\x84\x68\x3a\xd7\x7c\x69\x79\x05\
+\x6d\x85\xd8\x54\xd9\xb1\x36\xfb\x58\xe6\x5f\x52\x7e\xc7\x94\xfc\
+\x87\xf1\x07\x5f\xef\x7c\x31\xfa\xdc\x01\xcc\x67\x29\xff\x84\x9e\
+\xc9\x55\x49\x5f\x1b\xab\x48\x32\x59\x8e\x8f\x1d\x27\x33\xdb\xd9\
+\x8c\x5a\x61\x79\x93\xea\x70\xc7\x47\xd1\x05\xe8\x0d\x54\x1e\xa1\
+\x72\x1e\xa3\x3c\x57\x13\x6f\x45\x0f\x23\x0d\x6d\x19\xf2\x7f\x04\
+\xcb\xb6\x91\xef\x76\xc0\x72\x00\x99\x36\xed\x7f\x1c\x3b\xe3\x76\
+\xdd\x75\xef\xab\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x01\x71\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x96\x00\x00\x00\x51\x08\x06\x00\x00\x00\x30\xec\x5f\xee\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0e\xc2\x00\x00\x0e\xc2\x01\x15\x28\
+\x4a\x80\x00\x00\x01\x06\x49\x44\x41\x54\x78\x5e\xed\xd4\xbb\x0d\
+\x02\x51\x0c\x00\x41\x1f\x5d\xd0\x09\x29\x95\x93\xd2\x09\x65\x1c\
+\xc7\x47\x34\xc0\xdb\x6c\x46\xb2\xec\x02\x56\xde\x66\x66\x3f\x06\
+\x96\x3a\x7d\x37\x2c\xf5\xfb\x58\xf7\xdb\xe3\xb5\xe0\x2f\x97\xeb\
+\xf9\xbd\x7d\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\
+\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\
+\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\
+\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\
+\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\
+\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\
+\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\
+\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\
+\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\
+\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\
+\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\
+\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\
+\xb1\x1d\xb3\x7f\x4e\x58\xc7\xc7\x22\x30\xf3\x04\x28\xe1\x06\x9d\
+\x1c\xb4\x53\x31\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x09\x32\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x96\x00\x00\x00\x51\x08\x06\x00\x00\x00\x30\xec\x5f\xee\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
+\x0e\x1b\x00\x00\x08\xc7\x49\x44\x41\x54\x78\x5e\xed\x9d\x7b\xc8\
+\x14\x55\x18\x87\xfd\x4c\xb3\x8b\xa6\x65\x65\x21\x5a\x42\x2a\x11\
+\x91\x15\xfe\x93\x95\x5d\x0d\x8d\x8a\x2e\x94\x10\x95\xd8\x15\x12\
+\x24\x82\xfa\x27\xb2\x28\xba\x58\x51\x11\x91\x89\xdd\x90\xb0\x28\
+\xb5\x9b\x11\x5d\x29\xb1\x0b\xd1\x0d\xe9\x8f\x2c\xb3\x34\xa5\xb4\
+\xbc\x64\x99\xf5\xe5\xb7\x3d\xbf\x33\x67\xb6\xd9\x71\xf6\x3e\xf3\
+\xed\xec\x7e\xef\x03\xaf\xef\x99\xb3\xeb\xec\x9c\x73\x9e\xef\xcc\
+\xec\xec\xec\x4e\xbf\x76\xa1\x50\x28\x74\x29\xfc\x62\x55\xc2\xe7\
+\x57\xfa\x3f\x3c\xd6\x5f\x29\x83\x58\xcb\xba\x87\x92\x1d\x7e\x3b\
+\xf6\x24\x06\xaa\xec\xab\x3b\x9a\xb6\x6a\x64\x38\x28\x5d\x5d\x1a\
+\xa7\x02\xa9\x4b\x83\x58\x24\x5a\x47\x79\x00\xe5\x6e\xf7\x40\x40\
+\x38\xe8\x5a\x47\x2e\xda\xcd\x36\x7e\x4d\x5a\x44\xac\x20\xd6\x12\
+\xbf\x10\x3b\xe2\xed\x6a\x47\xda\xf6\xaf\x27\x94\xc8\xe7\x3f\xa9\
+\xda\x8b\xf8\xdb\x3d\x18\x94\x6b\xa2\x30\xf1\x1c\x5f\x4a\x97\xae\
+\x4f\x5f\xf5\xa5\xfa\x51\xa3\x48\x1b\x89\x3b\x88\xf9\xb4\x2f\xfa\
+\x07\xd2\x16\xb4\x9d\x58\xf4\x79\x7f\x3a\x5a\x9d\x3e\x3c\xa8\xa9\
+\x4c\x56\xe2\x34\x4b\x1d\xe2\x6d\xa2\xcd\x7a\xf2\x73\xc4\x97\xc4\
+\x66\xda\xbf\x4b\x0f\xe4\x99\x5c\x8a\xe5\x67\xa1\x70\x97\x26\x91\
+\xaa\x76\x64\x5e\x05\xaa\x97\x1a\x84\xdb\x49\x9f\xac\x24\x2f\x24\
+\x16\xd1\x37\xbf\xba\xda\x9c\x91\x97\x63\x0d\xb7\x1d\x92\xc9\x4b\
+\xd5\xe3\x1e\xe0\x21\x9f\x4b\xb6\xb3\x53\x24\xaa\x95\x0a\xb2\x6d\
+\x26\x9e\xa1\xcf\xde\x24\xeb\x30\x40\xc2\x69\x46\x0b\xfb\xaf\x65\
+\xe4\x46\xac\x4a\x9d\xd1\xd7\x44\xaa\x46\x05\xd1\xf4\x87\xb9\x95\
+\xac\xdd\xe6\x43\xc4\x6a\xfa\xb5\xec\x6c\xef\xfb\x3d\x93\x37\x0a\
+\x2d\x15\xcb\x37\x4c\x0d\xff\x97\x18\xe8\x2a\x3d\x26\x53\xed\x24\
+\x89\x46\xdf\xaa\x4f\x97\x13\xb7\x13\x2b\xe8\x67\x2d\xf7\x1a\xbd\
+\x2e\x16\x0d\x1e\x47\x23\x3f\xa1\xf8\x07\xb1\x2f\xb1\xbf\xea\x85\
+\xc9\xd4\x3c\x09\x92\x6d\xa7\xcf\x5f\x20\x3f\x46\xac\xa4\xef\xc3\
+\x77\xce\x99\xd2\x2b\x62\xd1\x30\x9d\x88\x9c\x48\xa3\x66\x90\xa7\
+\x12\xa3\x09\xf7\xda\x26\x53\x36\x94\x99\xc5\xf4\xc7\x7c\x39\xf1\
+\x12\x63\x91\xe9\xb9\xb2\x4c\xc5\xa2\x21\x5a\xff\xe9\x34\xe2\x69\
+\xf2\x48\x57\x09\x26\x53\xef\x12\x93\x6c\x17\xe3\xb2\x8c\x7c\x3d\
+\xe3\xf2\x53\x50\x95\x3e\x99\x89\xc5\xc6\x8f\x62\xc3\xdf\xa2\x38\
+\x3e\xa8\x31\xa1\x5a\x4d\x4c\xb0\xdf\x18\xa3\x47\xc8\x8f\x13\x9b\
+\x18\xab\x54\xcf\x8d\xa5\x2e\x16\x1b\x7b\x10\x1b\xf9\x20\xc5\x4b\
+\x88\x01\xae\xce\x84\xca\x15\x31\xc1\x36\x30\x66\xda\xa3\xcc\x27\
+\xd6\x31\x76\xa9\x9c\xaa\x48\x4d\x2c\x36\xee\x14\x36\xea\x25\x8a\
+\xff\x7f\xf8\x6a\x42\xe5\x9a\x98\x60\x5b\x18\x43\x9d\x17\xbb\x86\
+\x71\x7c\x37\xa8\x6a\x9c\xa6\xc5\x62\x63\xf6\x23\xdd\xc6\xc6\xdc\
+\x10\xd4\x98\x50\xed\x46\x54\x30\xc6\x53\xa7\x25\x6e\x21\x1e\x60\
+\x4c\x1b\x3e\x45\xd1\xb0\x58\x6c\x80\xde\xe9\xcd\xe2\xc5\xe7\x90\
+\x0f\x70\x75\x26\x54\x5b\x13\x13\x4c\xa7\x84\x2e\x65\x7c\x57\x07\
+\x35\xf5\xd1\x90\x58\xbc\xa8\xce\x3d\x2d\xe4\x45\xcf\x20\x0f\x72\
+\x75\x26\x55\x47\x10\x93\x6b\x1b\x69\x26\xb1\x94\xb1\xae\xeb\xf4\
+\x44\x5d\x62\xf1\x42\x7a\xfe\x09\xbc\xc8\x62\xf2\x08\x57\x67\x42\
+\x75\x24\x11\xc1\xba\x19\x77\x9d\x60\xbd\x92\x71\xdf\x19\x54\x55\
+\xa7\x66\xb1\xbc\x54\xb3\x59\xb9\xde\xf1\x39\x4c\xaa\xce\x26\x36\
+\x7b\xe9\xe3\xa1\x69\x8c\xbf\x4e\xb2\x56\x45\xc7\x49\xb5\xa2\x03\
+\xf4\x7b\x7d\xd9\xa4\xea\x03\x44\xc7\x98\xb1\x3f\x89\xf4\x26\x82\
+\x0d\x0b\x6a\x2a\x53\xd3\x8c\xc5\xca\x4e\x63\xc5\xef\xf8\x45\x93\
+\xaa\x8f\x11\x9b\xb9\x56\x91\x2e\xc0\x07\x5d\x56\x5d\x96\xaa\x62\
+\xb1\xa2\x49\xac\xe4\x65\x8a\xc3\x4d\xa8\xbe\x4d\x28\x98\x97\x6b\
+\x3a\x5e\x7c\xe1\x2a\x12\xa8\x28\x16\x2b\x98\xc2\x7f\x7e\x9e\xe2\
+\x30\x93\xca\x10\x11\xb9\xf4\x2e\x71\x0c\x7e\xfc\xe8\x2a\x62\x94\
+\x3d\xc6\xe2\xff\x5d\xc8\x7f\x5a\x42\xd1\xa4\x32\x8a\x84\x2e\xe0\
+\x86\x26\xa5\x47\xf1\x24\x71\x72\x4a\x14\x8b\x27\xeb\xc4\x98\xde\
+\x62\xea\x7a\x29\xc3\x48\x04\x47\xce\x26\x5d\x1d\x2c\x95\xb2\x9b\
+\x6d\x48\xa5\xe9\xed\x3d\x8a\x87\xb9\x65\x9b\xad\x8c\x04\x22\x07\
+\xf4\x5b\x71\xe6\x18\x9c\xd1\xf7\x22\x8b\x94\xcc\x58\x7e\x5a\xd3\
+\xb5\xd2\x26\x95\x51\x91\x88\x1b\x3a\xfd\xf0\x31\xee\xb8\x2b\x59\
+\x42\xe2\xbb\xc2\x93\x31\x6f\x9a\x0a\x26\x95\x51\x8d\xc8\xf1\xd6\
+\xa1\xa4\x59\x7e\x62\x72\x14\xc5\xa2\x72\x08\x4f\xd0\x45\x5f\x25\
+\xe6\x19\x46\x2d\xe0\xce\x9d\xa4\x29\xc1\x52\xe9\x8c\xa5\x5d\xe0\
+\x11\x2a\xd8\x6c\x65\xd4\x4a\xc4\x15\xbd\xd1\x9b\x1d\x14\xbd\x58\
+\xcc\x56\x03\x31\x4e\x17\xd9\xef\xa1\x65\xc3\x68\x04\x1c\x1a\x89\
+\x4b\xce\xa1\x70\xc6\xd2\x17\x1d\xec\x32\x62\xa3\x21\x22\xce\x8c\
+\x21\xae\x52\xc1\x89\x85\x69\xa7\x2a\x1b\x46\x93\xe8\x38\x5d\x17\
+\x7e\xf6\x73\x3f\x4c\x06\x9f\x53\x9e\x60\xb3\x95\xd1\x0c\xfe\xdc\
+\x56\x0f\x4e\x0d\xd0\x8c\xb5\x27\x31\x41\x35\x86\x91\x02\x72\x6a\
+\xa0\xfe\x99\xe4\x16\x0d\x23\x3d\x2e\xd5\x09\xad\x35\xc4\xe1\xb6\
+\x1b\x34\xd2\xc0\xef\x0e\xbb\x35\x63\x1d\xae\x92\x61\xa4\x88\xdb\
+\x15\x1a\x46\xea\x98\x58\x46\x26\x98\x58\x46\x26\x98\x58\x46\x26\
+\x98\x58\x46\x26\x98\x58\x46\x26\x48\xac\x1f\x82\xa2\x61\xa4\x47\
+\xff\x42\xa1\xf0\x9a\x0a\x91\x6b\x98\x0d\xa3\x21\x22\x5f\x0d\xbb\
+\x5c\x33\x96\x6e\xa3\x61\x18\x69\xf2\xac\xc4\xfa\x2a\x28\x1b\x46\
+\x3a\x74\x75\x75\xf5\x48\xac\xe2\xd7\x76\x6c\x77\x68\x34\x4a\xc4\
+\x9d\xdf\xf5\x8f\xc4\xd2\x6f\x4f\x7e\xa4\x05\xc3\x68\x16\x5c\xd2\
+\xb7\xe7\x83\x2f\xac\xb2\x30\x92\xe9\x4b\x57\x39\xb8\xdb\x8e\xd8\
+\x95\x0e\x46\x3d\x44\x66\x2b\x54\x2a\x1c\x82\x4b\x1b\x35\x63\x69\
+\x9f\xb8\x9e\x8a\xb7\xdd\x43\x86\xd1\x20\x38\xb4\x81\xb4\x49\x65\
+\x27\x96\xe7\x0a\xe2\x2f\x15\xec\x58\xcb\xa8\x95\x98\x2b\x37\x31\
+\x49\xb9\xdf\x2a\x2d\x8a\x45\x85\xee\xe4\xf9\x94\x5f\x34\x8c\xba\
+\xc0\x9d\x75\xa4\x17\x83\xa5\xd2\x19\x4b\xcc\xe5\x09\xce\x38\x9b\
+\xb5\x8c\x6a\x84\x8e\xa0\x8c\x7e\x97\x74\x0e\x93\xd3\x3f\xae\x02\
+\xe2\x62\xe9\xd4\xc3\xc7\x41\xd1\xe4\x32\xca\xe3\xdd\xd0\xaf\x28\
+\x7f\x40\x4c\x27\x74\xdb\x94\x22\x25\x62\xf9\xfd\xe3\x39\x18\xe8\
+\x0e\xc0\x0c\xa3\x0a\xab\x70\xe5\x1a\xf2\xeb\xe1\xb1\x55\x88\x3e\
+\x2b\xdc\xdb\x97\x1d\x3c\xe1\x37\xd2\xf1\xd4\xbb\x9b\x58\xdb\xac\
+\x65\xc4\xf1\x4e\xe8\xf6\x74\xba\x80\x61\x4d\x5c\x2a\xa1\x19\x4b\
+\x77\x45\x2f\xf9\x01\x36\x9e\xa8\x03\xb1\xe3\xa8\xff\xd6\x2d\x9b\
+\x5c\x86\x27\x74\x01\x37\x96\x92\xae\xc5\x95\xe2\x71\x55\x94\xfe\
+\xb2\x2d\xc9\x38\x2f\x97\x66\xae\x37\xdc\xb2\xc9\xd5\xe7\x89\x48\
+\x75\x1f\xe9\x0a\x1c\xf9\xd9\x55\x24\x50\x32\x53\x25\xc1\x4a\xf4\
+\xf3\x34\xcb\x58\xc9\xe4\xa0\x86\x3a\x3b\x33\xdf\xa7\x88\x4e\x2a\
+\xf8\xf0\x21\x69\x32\x3e\x54\xbc\x33\x58\x55\xb1\x04\x2b\x1b\x45\
+\xfa\x82\x95\x0d\x0f\x6a\x4c\xae\xbe\x42\x4c\x2a\xed\xd9\xc6\xe3\
+\x81\x3b\x44\xaa\x44\xfc\x74\x43\x22\xac\x48\xbb\xc5\xe9\xac\x77\
+\x47\x50\x53\xfa\x82\x46\x67\x12\x93\x6a\x3d\xe9\xa2\x5a\xa4\x12\
+\x35\xcd\x58\x21\xac\x5c\xdf\x9a\x5e\xc2\xca\x8f\x0d\x6a\x6c\xe6\
+\xea\x54\x62\x52\xe9\x62\x50\xdd\x89\xe2\x9b\xa0\xa6\x3a\x75\x89\
+\x25\x78\x11\xfd\x3a\xcd\x93\x84\x7e\x0b\xde\xd5\x09\x13\xac\x33\
+\x88\x09\xa5\x0f\x95\x1f\x25\x1e\x66\xac\xff\x74\x95\x35\x52\xb7\
+\x58\x82\x17\xd4\x2f\x00\x7e\x46\x8c\x30\xb9\x3a\x87\x98\x54\x2b\
+\x48\x9a\x3c\x12\x6f\x69\x52\x8d\x86\xc4\x12\xbc\xf0\xc1\xa4\x27\
+\x08\xfd\x7c\xb7\x4e\x5b\xa8\xda\x61\x82\xb5\x17\x31\xa1\x1e\x26\
+\xdd\x4f\xac\x67\x4c\x77\x3b\x0d\x55\x2b\x0d\x8b\x15\xc2\x86\xe8\
+\x77\x27\x75\xae\x6b\x5c\x54\x2e\x61\x82\xe5\x9b\xa8\x50\xf0\x3d\
+\x63\x39\x93\x31\x7c\xdf\x2f\x37\x45\xd3\x62\x09\x36\x48\xeb\x99\
+\x4a\xe8\x4e\x61\x83\x4d\xb0\x7c\x13\x13\x4a\x1f\xcd\xbc\x45\xd6\
+\xb5\x54\x2b\x83\xaa\xe6\x49\x45\xac\x10\x36\x50\xa7\x2f\x8e\x22\
+\xee\x26\xa6\xb2\xa1\x25\xa7\x33\x4c\xb0\xd6\x12\x13\x4a\xe3\xa5\
+\x77\x79\xd7\x11\xef\x33\x56\x0d\xef\xf6\x92\x48\x55\xac\x28\x6c\
+\xb4\xee\xc7\x73\x23\x31\x96\x8d\x3e\x9a\xac\x03\x7e\x87\x09\xd6\
+\xbb\x24\x08\xb5\x91\x34\x8f\xb8\x87\xb1\x71\x57\x0d\xa7\x4d\x66\
+\x62\x09\x1a\xa0\xf5\xeb\xea\x89\x33\x89\xb9\x34\x62\x2c\xb9\xe4\
+\x35\x4d\xb2\x6c\x88\xcb\x24\x18\x8f\x6d\x24\xfd\x0e\xfb\xe2\xb4\
+\x67\xa8\x38\x99\x8a\x15\xe2\x05\x1b\x4c\xe8\x86\xd5\xb3\x68\xd4\
+\x89\xe4\x21\x44\x11\x13\x2c\x1d\xca\x08\xb5\x99\x74\x2b\x31\x8f\
+\xbe\xdf\xe5\x2a\x13\xd0\x38\xa5\x25\x5c\xaf\x88\x15\x87\x06\xe8\
+\x2e\x18\x67\x11\x0f\xd1\x10\x77\xff\x9e\x28\x26\x59\x7d\x94\x91\
+\x49\x82\xe8\x60\xfc\x62\xfa\xb8\xe6\x33\xe6\x69\xd1\x12\xb1\x42\
+\x68\xbb\xbe\xc7\xa8\x63\xb1\xb3\x69\xfc\x0c\xf2\x91\xc4\x20\xa2\
+\x04\x13\xad\x94\x24\x91\xa0\x87\xd0\x97\x8f\xf5\xa9\x88\x8e\x9d\
+\x34\x4b\xb5\x8c\x96\x8a\x15\x85\x0e\xd1\xb6\x48\xb2\x9b\xe9\x94\
+\x73\xc9\xba\xc1\xe2\x5e\xc4\x6e\x1f\x94\xf7\x35\xd1\xca\x88\x24\
+\x24\xd3\x0e\xfa\x4e\xbf\xbf\xb1\x98\x58\x40\xdf\x6d\xd7\x03\xad\
+\x26\x37\x62\x45\xa1\xa3\x24\x93\xa4\xd2\x87\xde\x57\xd2\x59\x33\
+\xc9\x12\xad\x2c\x9d\x22\x5b\x05\x89\x84\x44\x5a\x47\xff\x2c\x20\
+\xbf\x42\xe8\xe3\x96\x3f\xe8\x9f\xb2\xc7\x4d\xad\x22\x97\x62\x45\
+\xf1\x92\xe9\x6a\x0a\x7d\xa1\xf6\x3c\x62\x14\x1d\x59\xf3\x76\xe7\
+\x55\xb8\x2a\x02\x45\xa1\x0b\xdc\xe9\x01\x7d\xe7\x73\x11\xb1\x8a\
+\xe6\xeb\xdb\x31\xb9\x26\xf7\x62\x45\xf1\x92\x8d\x23\x0e\x22\x74\
+\x2c\xa6\x77\x99\x33\xe8\xe8\xd1\xe4\x86\xc8\x4a\xbc\x3a\xc4\xd9\
+\x0d\xda\xf9\x1c\xe9\x2e\xe2\x3b\xa2\x9b\xe8\xa1\x8d\x9a\xad\xda\
+\x86\xb6\x12\x2b\x09\x06\x41\x37\x5e\x94\x70\xea\x78\xbd\x13\x52\
+\x9b\x86\x12\xba\x7c\xf6\x7c\xf2\x29\x84\xae\x80\xcd\x1d\x6c\xbb\
+\x8e\x87\xf4\x3d\x4e\x7d\x14\xa6\xcf\xe8\x74\x99\x8a\x76\x6b\xdd\
+\xed\x26\x52\x1c\xdd\x56\x6e\x0f\x1a\x91\xbb\x7d\x74\x9a\xd0\xc6\
+\xf0\x0f\x28\xcc\x3a\x7e\xd3\x69\x0e\xcd\x76\x97\x91\x0f\x54\x65\
+\x9a\xf0\x9a\xab\x48\xf3\x89\xe5\x84\xae\x65\x52\x1f\x6f\xf1\x65\
+\xbd\x1b\xde\x87\xf8\xb9\x33\xfb\xbe\x5f\xbf\xff\x00\x93\x43\x7f\
+\xef\xfe\x01\x78\x99\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x01\x6d\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x96\x00\x00\x00\x51\x08\x06\x00\x00\x00\x30\xec\x5f\xee\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
+\x0e\x1b\x00\x00\x01\x02\x49\x44\x41\x54\x78\x5e\xed\xd4\xc1\x0d\
+\x02\x31\x0c\x00\xc1\x84\x66\x28\xf3\x44\x99\x54\x13\x8e\x03\xd1\
+\x00\xd9\xdf\x8c\x64\xd9\x05\xac\x3c\xc7\x18\xeb\x1c\xd8\xea\xf6\
+\xdd\xb0\xd5\xef\x63\xad\xe3\xfe\x5e\xf0\x97\xf9\x78\x5e\xdb\xc7\
+\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\
+\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\
+\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\
+\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\
+\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\
+\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\
+\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\
+\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\
+\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\
+\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\
+\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\
+\x21\x2c\x12\xc2\x22\x21\x2c\x12\xc2\x22\x21\x2c\x12\xf3\x9c\xf5\
+\x39\x61\x1f\x1f\x8b\xc0\x18\x2f\x5e\x3b\x06\x9d\x52\x7d\x09\x26\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x6d\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x96\x00\x00\x00\x51\x08\x06\x00\x00\x00\x30\xec\x5f\xee\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0e\xc2\x00\x00\x0e\xc2\x01\x15\x28\
+\x4a\x80\x00\x00\x01\x02\x49\x44\x41\x54\x78\x5e\xed\xd4\xd1\x09\
+\xc2\x50\x0c\x40\xd1\xd4\x29\x9c\xae\xc3\x39\x9d\x5b\xd4\xd2\x0a\
+\x0e\xe0\xbb\x7f\xe7\x40\x48\x06\xb8\x64\x9b\x99\xe3\x1c\x58\xea\
+\xf1\xdd\xb0\xd4\xef\x63\xbd\xde\xd7\x82\xbf\xec\xcf\x6b\xf9\x58\
+\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\
+\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\
+\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\
+\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\
+\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\
+\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\
+\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\
+\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\
+\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\
+\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\
+\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\
+\x84\x45\x42\x58\x24\x84\x45\x42\x58\x24\x84\x45\x62\x3b\xe7\xb8\
+\x4f\x58\xc7\xc7\x22\x30\xf3\x01\xef\xdb\x05\x9d\xde\x9e\x9b\xf5\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+"
+
+qt_resource_name = b"\
+\x00\x08\
+\x0f\xab\xc6\x03\
+\x00\x70\
+\x00\x69\x00\x63\x00\x74\x00\x75\x00\x72\x00\x65\x00\x73\
+\x00\x09\
+\x00\x28\xac\xa7\
+\x00\x77\
+\x00\x68\x00\x69\x00\x6c\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0c\
+\x05\xa8\xc6\x47\
+\x00\x6f\
+\x00\x70\x00\x65\x00\x72\x00\x61\x00\x74\x00\x6f\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0c\
+\x06\x19\xc2\x07\
+\x00\x66\
+\x00\x75\x00\x6e\x00\x63\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0c\
+\x06\xb9\x49\xa7\
+\x00\x76\
+\x00\x61\x00\x72\x00\x69\x00\x61\x00\x62\x00\x6c\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x06\
+\x06\xf9\x57\x47\
+\x00\x69\
+\x00\x66\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x07\xc9\x8e\x27\
+\x00\x6f\
+\x00\x75\x00\x74\x00\x70\x00\x75\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x08\x97\xa2\x07\
+\x00\x73\
+\x00\x74\x00\x61\x00\x72\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x08\xa4\x5a\x07\
+\x00\x64\
+\x00\x61\x00\x74\x00\x61\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x07\
+\x0c\x47\x57\x87\
+\x00\x65\
+\x00\x6e\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x07\
+\x0d\x65\x57\x87\
+\x00\x66\
+\x00\x6f\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x0f\x59\x2e\x07\
+\x00\x6d\
+\x00\x65\x00\x74\x00\x68\x00\x6f\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0b\x00\x00\x00\x02\
+\x00\x00\x00\x16\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x2e\x00\x00\x00\x00\x00\x01\x00\x00\x01\x73\
+\x00\x00\x00\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x02\xe8\
+\x00\x00\x00\x6a\x00\x00\x00\x00\x00\x01\x00\x00\x04\xba\
+\x00\x00\x00\x88\x00\x00\x00\x00\x00\x01\x00\x00\x06\x2e\
+\x00\x00\x00\x9a\x00\x00\x00\x00\x00\x01\x00\x00\x07\xa1\
+\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x09\x13\
+\x00\x00\x00\xcc\x00\x00\x00\x00\x00\x01\x00\x00\x13\x78\
+\x00\x00\x00\xe2\x00\x00\x00\x00\x00\x01\x00\x00\x14\xed\
+\x00\x00\x00\xf6\x00\x00\x00\x00\x00\x01\x00\x00\x1e\x23\
+\x00\x00\x01\x0a\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x94\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0b\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x16\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x8e\x9e\x0d\xbf\xc8\
+\x00\x00\x00\x2e\x00\x00\x00\x00\x00\x01\x00\x00\x01\x73\
+\x00\x00\x01\x8e\x9e\x0d\xbf\xc8\
+\x00\x00\x00\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x02\xe8\
+\x00\x00\x01\x8e\x9e\x0d\xbf\xc8\
+\x00\x00\x00\x6a\x00\x00\x00\x00\x00\x01\x00\x00\x04\xba\
+\x00\x00\x01\x8e\x9e\x0d\xbf\xc8\
+\x00\x00\x00\x88\x00\x00\x00\x00\x00\x01\x00\x00\x06\x2e\
+\x00\x00\x01\x8e\x9e\x0d\xbf\xc8\
+\x00\x00\x00\x9a\x00\x00\x00\x00\x00\x01\x00\x00\x07\xa1\
+\x00\x00\x01\x8e\x9e\x0d\xbf\xc8\
+\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x09\x13\
+\x00\x00\x01\x8e\x9e\x0d\xbf\xc8\
+\x00\x00\x00\xcc\x00\x00\x00\x00\x00\x01\x00\x00\x13\x78\
+\x00\x00\x01\x8e\x9e\x0d\xbf\xc8\
+\x00\x00\x00\xe2\x00\x00\x00\x00\x00\x01\x00\x00\x14\xed\
+\x00\x00\x01\x8e\x9e\x0d\xbf\xc8\
+\x00\x00\x00\xf6\x00\x00\x00\x00\x00\x01\x00\x00\x1e\x23\
+\x00\x00\x01\x8e\x9e\x0d\xbf\xc8\
+\x00\x00\x01\x0a\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x94\
+\x00\x00\x01\x8e\x9e\x0d\xbf\xc8\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+import collections
+import time
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+from exceptions import BlockSyntaxError, SequenceError
+
+
+class RunConsole(QtWidgets.QDockWidget):
+    """консоль запуска программы. программа выполняется в заранее запущенном воркере execution_backend, ее stdout
+     и stderr выводятся в панель по мере поступления, строка ввода пишет в stdin. вывод забирается из воркера и
+     переносится в панель не чаще раза в FLUSH_INTERVAL и копится в кольцевом буфере из MAX_LINES строк, поэтому
+     программа, которая печатает без остановки, не занимает ни память, ни цикл событий редактора"""
+    status_message = QtCore.pyqtSignal(str)
+    MAX_LINES = 5000
+    FLUSH_INTERVAL = 50  # мс
+
+    def __init__(self, parent=None):
+        super(RunConsole, self).__init__('Console', parent)
+        self.setObjectName('run_console')
+        self.current_run = None  # execution_backend.StreamingRun
+        self.pending = collections.deque(maxlen=self.MAX_LINES)  # (кусок текста до конца строки, это stderr)
+        self.skipped = 0  # строки, вытесненные из буфера до вывода в панель
+
+        content = QtWidgets.QWidget(self)
+        self.output = QtWidgets.QPlainTextEdit(content)
+        self.output.setReadOnly(True)
+        self.output.setMaximumBlockCount(self.MAX_LINES)
+        self.output.setFont(QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.SystemFont.FixedFont))
+        self.input = QtWidgets.QLineEdit(content)
+        self.input.setPlaceholderText('stdin')
+        self.input.setEnabled(False)
+        self.eof_button = QtWidgets.QPushButton('EOF', content)
+        self.eof_button.setEnabled(False)
+        self.stop_button = QtWidgets.QPushButton('Stop', content)
+        self.stop_button.setEnabled(False)
+        clear_button = QtWidgets.QPushButton('Clear', content)
+
+        controls = QtWidgets.QHBoxLayout()
+        controls.addWidget(self.input)
+        controls.addWidget(self.eof_button)
+        controls.addWidget(self.stop_button)
+        controls.addWidget(clear_button)
+        layout = QtWidgets.QVBoxLayout(content)
+        layout.addWidget(self.output)
+        layout.addLayout(controls)
+        self.setWidget(content)
+
+        self.error_format = QtGui.QTextCharFormat()
+        self.error_format.setForeground(QtGui.QColor('red'))
+        self.flush_timer = QtCore.QTimer(self)
+        self.flush_timer.setInterval(self.FLUSH_INTERVAL)
+        self.flush_timer.timeout.connect(self.flush)
+        self.input.returnPressed.connect(self.write_input)
+        self.eof_button.clicked.connect(self.close_input)
+        self.stop_button.clicked.connect(self.stop)
+        clear_button.clicked.connect(self.clear)
+
+    @property
+    def is_running(self) -> bool:
+        return self.current_run is not None and self.current_run.is_running
+
+    def run(self, backend, code: str):
+        """запускает программу в воркере backend, предыдущий запуск останавливается"""
+        self.stop()
+        self.append(f'>>> run {time.strftime("%H:%M:%S")}\n', False)
+        self.current_run = backend.start(code)
+        self.set_running(True)
+        self.flush_timer.start()
+        self.status_message.emit('Running...')
+        self.read()
+
+    def stop(self):
+        if not self.is_running:
+            return
+        self.current_run.stop()
+        self.read()
+
+    def set_running(self, running: bool):
+        self.input.setEnabled(running)
+        self.eof_button.setEnabled(running)
+        self.stop_button.setEnabled(running)
+        if running:
+            self.input.setFocus()
+
+    def read(self):
+        """забирает вывод запуска, после завершения программы выводит итог"""
+        if self.current_run is None:
+            return
+        for stream, text in self.current_run.read():
+            self.append(text, stream == 'stderr')
+        if not self.current_run.is_running:
+            finished_run, self.current_run = self.current_run, None
+            self.on_finished(finished_run)
+
+    def append(self, text: str, is_error: bool):
+        pieces = text.splitlines(keepends=True)
+        self.skipped += max(0, len(self.pending) + len(pieces) - self.MAX_LINES)
+        self.pending.extend((piece, is_error) for piece in pieces)
+
+    def write_input(self):
+        if not self.is_running:
+            return
+        text = self.input.text() + '\n'
+        self.input.clear()
+        self.append(text, False)
+        self.current_run.write(text)
+
+    def close_input(self):
+        if self.is_running:
+            self.current_run.close_input()
+            self.input.setEnabled(False)
+
+    def flush(self):
+        """переносит накопленный вывод в панель, соседние куски одного потока вставляются одной вставкой"""
+        self.read()
+        if not self.pending and not self.skipped:
+            if not self.is_running:
+                self.flush_timer.stop()
+            return
+        scroll_bar = self.output.verticalScrollBar()
+        at_bottom = scroll_bar.value() == scroll_bar.maximum()
+        cursor = QtGui.QTextCursor(self.output.document())
+        cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+        if self.skipped:
+            cursor.insertText(f'... {self.skipped} lines skipped\n', self.error_format)
+            self.skipped = 0
+        pieces, self.pending = self.pending, collections.deque(maxlen=self.MAX_LINES)
+        chunk = []
+        chunk_is_error = False
+        for text, is_error in pieces:
+            if chunk and is_error != chunk_is_error:
+                cursor.insertText(''.join(chunk), self.error_format if chunk_is_error else QtGui.QTextCharFormat())
+                chunk = []
+            chunk_is_error = is_error
+            chunk.append(text)
+        if chunk:
+            cursor.insertText(''.join(chunk), self.error_format if chunk_is_error else QtGui.QTextCharFormat())
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
+
+    def on_finished(self, finished_run):
+        result = finished_run.result
+        if finished_run.stopped:
+            message = 'Program stopped'
+        elif result.error is not None:
+            self.append(result.error, True)
+            message = 'Program failed'
+        else:
+            message = f'Finished in {result.duration * 1000:.1f} ms'
+        self.append(f'>>> {message}\n', result.error is not None)
+        self.finish_run()
+        self.status_message.emit(message)
+
+    def finish_run(self):
+        self.set_running(False)
+        self.flush()
+
+    def clear(self):
+        self.pending.clear()
+        self.skipped = 0
+        self.output.clear()
+
+
+class RunConsoleWindow:
+    """запуск программы в консоли, общий для окон редактора. окну нужны status_bar и run_console_action"""
+    run_console: RunConsole = None
+    _interpreter = None
+
+    @property
+    def interpreter(self):
+        """интерпретатор и модули выполнения загружаются при первом обращении, а не при старте редактора"""
+        if self._interpreter is None:
+            import interpreter
+            self._interpreter = interpreter.Interpreter()
+        return self._interpreter
+
+    def toggle_run_console(self, visible: bool):
+        """показывает и скрывает консоль запуска программы, консоль создается при первом показе"""
+        if self.run_console is None:
+            if not visible:
+                return
+            self.run_console = RunConsole(self)
+            self.addDockWidget(QtCore.Qt.DockWidgetArea.BottomDockWidgetArea, self.run_console)
+            self.run_console.visibilityChanged.connect(self.run_console_action.setChecked)
+            self.run_console.status_message.connect(self.status_bar.showMessage)
+        self.run_console.setVisible(visible)
+
+    def run_program(self, blocks):
+        """переводит блоки схемы (виджеты или узлы модели) в код и запускает его в консоли"""
+        try:
+            code = self.interpreter.convert_to_py(blocks, console=False)
+        except ValueError as error:
+            self.status_bar.showMessage(repr(error))
+        except SequenceError as error:
+            self.show_sequence_error(error)
+        except BlockSyntaxError as error:
+            self.status_bar.showMessage(str(error))
+        else:
+            self.toggle_run_console(True)
+            self.run_console.run(self.interpreter.backend, code)
+
+    def show_sequence_error(self, error: SequenceError):
+        self.status_bar.showMessage(str(error))
+
+    def stop_program(self):
+        """останавливает запущенную программу и воркеры выполнения, например при закрытии окна"""
+        if self.run_console is not None:
+            self.run_console.stop()
+        if self._interpreter is not None:
+            self._interpreter.close()
+            self._interpreter = None
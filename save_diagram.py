@@ -1,144 +1,245 @@
 # -*- coding: utf-8 -*-
-import inspect
+import contextlib
 import json
+import pathlib
 import sqlite3
-import sys
 
-import blocks
+import diagram_model
+from profiler import profiled
+
+
+BLOCK_COLUMNS = ('Hash', 'BlockTypeId', 'XCoord', 'YCoord', 'Argument', 'DataType', 'ChildHash', 'LayerUpBlockHash',
+                 'LayerDownBlockHash', 'GeneralBlockHash', 'LinesHash', 'LayerUpAdditionalBlockHash',
+                 'LayerDownAdditionalBlockHash')
+# связи узла в порядке колонок таблицы Blocks, начиная с ChildHash (кроме LinesHash)
+LINK_ATTRIBUTES = ('child', 'layer_up_block', 'layer_down_block', 'general_block', 'layer_up_additional_block',
+                   'layer_down_additional_block')
 
 
 def get_values():
-    classes = inspect.getmembers(sys.modules['blocks'], inspect.isclass)
-    result = enumerate(classes)
-    result = tuple(map(lambda x: ', '.join([str(x[0] + 1), '"' + x[1][0] + '"']), result))
-    return result
+    return tuple((index + 1, name) for index, name in enumerate(diagram_model.BLOCK_TYPES))
+
+
+def create_tables(cursor: sqlite3.Cursor):
+    # Создание базы данных с типами блоков
+    cursor.execute('''CREATE TABLE IF NOT EXISTS BlockTypes(
+    Id INT NOT NULL PRIMARY KEY,
+    Name TEXT)''')
+    # Заполнение
+    cursor.executemany('INSERT OR IGNORE INTO BlockTypes(Id, Name) VALUES (?, ?)', get_values())
+
+    # Создание базы данных блоков
+    cursor.execute('''CREATE TABLE IF NOT EXISTS Blocks(
+    Hash INT PRIMARY KEY,
+    BlockTypeId INT NOT NULL,
+    XCoord INT,
+    YCoord INT,
+    Argument TEXT,
+    DataType Text,
+    ChildHash INT,
+    LayerUpBlockHash INT,
+    LayerDownBlockHash INT,
+    GeneralBlockHash INT,
+    LinesHash TEXT,
+    LayerUpAdditionalBlockHash INT,
+    LayerDownAdditionalBlockHash INT)''')
+
+
+def create_spatial_index(cursor: sqlite3.Cursor) -> bool:
+    """создает R*Tree индекс по координатам блоков. возвращает False, если sqlite собран без модуля rtree"""
+    try:
+        cursor.execute('CREATE VIRTUAL TABLE IF NOT EXISTS BlocksIndex USING rtree(Id, MinX, MaxX, MinY, MaxY)')
+    except sqlite3.OperationalError:
+        return False
+    return True
+
+
+def rebuild_spatial_index(cursor: sqlite3.Cursor):
+    if create_spatial_index(cursor):
+        cursor.execute('DELETE FROM BlocksIndex')
+        cursor.execute('INSERT INTO BlocksIndex SELECT Hash, XCoord, XCoord, YCoord, YCoord FROM Blocks')
+
+
+def is_spatial_index_current(cursor: sqlite3.Cursor) -> bool:
+    """индекс есть, sqlite умеет его читать и в нем столько же записей, сколько блоков"""
+    try:
+        if cursor.execute("SELECT 1 FROM sqlite_master WHERE name == 'BlocksIndex'").fetchone() is None:
+            return False
+        indexed = cursor.execute('SELECT COUNT(*) FROM BlocksIndex').fetchone()[0]
+    except sqlite3.OperationalError:
+        return False
+    return indexed == cursor.execute('SELECT COUNT(*) FROM Blocks').fetchone()[0]
+
+
+def query_region(db_name: str, left: int, top: int, right: int, bottom: int) -> list:
+    """номера блоков, левый верхний угол которых лежит в прямоугольнике. файл открывается только на чтение:
+     если индекса нет или он устарел, блоки ищутся обычным запросом, а индекс строится при сохранении"""
+    with contextlib.closing(sqlite3.connect(pathlib.Path(db_name).absolute().as_uri() + '?mode=ro',
+                                            uri=True)) as con:
+        cursor = con.cursor()
+        if is_spatial_index_current(cursor):
+            rows = cursor.execute('SELECT Id FROM BlocksIndex WHERE MinX >= ? AND MaxX <= ? AND MinY >= ?'
+                                  ' AND MaxY <= ?', (left, right, top, bottom)).fetchall()
+        else:
+            rows = cursor.execute('SELECT Hash FROM Blocks WHERE XCoord BETWEEN ? AND ? AND YCoord BETWEEN ? AND ?',
+                                  (left, right, top, bottom)).fetchall()
+    return [i[0] for i in rows]
 
 
 def create_data_base(name: str):
     with sqlite3.connect(name) as con:
-        cursor = con.cursor()
-        # Создание базы данных с типами блоков
-        cursor.execute('''CREATE TABLE IF NOT EXISTS BlockTypes(
-        Id INT NOT NULL PRIMARY KEY,
-        Name TEXT)''')
-        values = get_values()
-        # Заполнение
-        for pack in values:
-            cursor.execute(f'INSERT INTO BlockTypes(Id, Name) VALUES ({pack})')
-
-        # Создание базы данных блоков
-        cursor.execute('''CREATE TABLE IF NOT EXISTS Blocks(
-        Hash INT PRIMARY KEY,
-        BlockTypeId INT NOT NULL,
-        XCoord INT,
-        YCoord INT,
-        Argument TEXT,
-        DataType Text,
-        ChildHash INT,
-        LayerUpBlockHash INT,
-        LayerDownBlockHash INT,
-        GeneralBlockHash INT,
-        LinesHash TEXT,
-        LayerUpAdditionalBlockHash INT,
-        LayerDownAdditionalBlockHash INT)''')
+        create_tables(con.cursor())
+
+
+def get_row(node: diagram_model.Node, type_ids: dict) -> tuple:
+    """строка таблицы Blocks для узла. у узла и всех его связей уже должны быть номера"""
+    links = [getattr(node, i) for i in LINK_ATTRIBUTES]
+    link_ids = [i.id if i is not None else None for i in links]
+    lines = json.dumps([i.id for i in node.lines]) if node.is_general_block else None
+    return (node.id, type_ids[node.type_name], node.x, node.y, node.arg, node.data_type, *link_ids[:4], lines,
+            *link_ids[4:])
 
 
+@profiled()
 def fill_data_base(db_name: str, blocks_to_fill):
+    """сохраняет блоки схемы (виджеты или узлы модели) в базу данных одной транзакцией"""
+    nodes = [diagram_model.as_node(i) for i in blocks_to_fill]
+    diagram_model.assign_ids(nodes)
+    type_ids = {name: type_id for type_id, name in get_values()}
     with sqlite3.connect(db_name) as con:
         cursor = con.cursor()
-        try:
-            cursor.execute('DELETE from Blocks')
-        except sqlite3.OperationalError:
-            create_data_base(db_name)
-
-        for block in blocks_to_fill:
-            block_hash = hash(block)
-
-            block_type_id = cursor.execute(f'SELECT Id FROM BlockTypes'
-                                           f' WHERE Name == "{block.__class__.__name__}"').fetchone()[0]
-
-            x_coord, y_coord = block.x(), block.y()
-            
-            argument = f'"{block.arg}"'
-            
-            data_type = f'"{block.data_type}"' if hasattr(block, 'data_type') else 'NULL'
-            
-            block_child = hash(block.child) if block.child else 'NULL'
-            
-            layer_up_block_hash = hash(block.layer_up_block) if block.layer_up_block else 'NULL'
-            
-            layer_down_block_hash = hash(block.layer_down_block) if block.layer_down_block else 'NULL'
-            
-            general_block_hash = hash(block.general_block) if block.general_block else 'NULL'
-
-            lines_hash = f'"{json.dumps(tuple(map(hash, block.lines)))}"' if \
-                issubclass(block.__class__, blocks.BaseGeneralBlock) else 'NULL'
-
-            layer_up_additional_block_hash = hash(block.layer_up_additional_block) if \
-                hasattr(block, 'layer_up_additional_block') else 'NULL'
-
-            layer_down_additional_block_hash = hash(block.layer_down_additional_block) if \
-                hasattr(block, 'layer_down_additional_block') else 'NULL'
-
-            data = ", ".join([str(block_hash), str(block_type_id), str(x_coord), str(y_coord), argument, data_type,
-                              str(block_child), str(layer_up_block_hash), str(layer_down_block_hash),
-                              str(general_block_hash), lines_hash, str(layer_up_additional_block_hash),
-                              str(layer_down_additional_block_hash)])
-            cursor.execute(f'INSERT INTO Blocks VALUES({data})')
+        create_tables(cursor)
+        cursor.execute('DELETE FROM Blocks')
+        cursor.executemany(f'INSERT INTO Blocks({", ".join(BLOCK_COLUMNS)}) VALUES ({", ".join("?" * 13)})',
+                           (get_row(node, type_ids) for node in nodes))
+        rebuild_spatial_index(cursor)
 
 
-def load_data_base(db_name: str, blocks_parent):
+@diagram_model.untracked()
+def read_diagram(db_name: str) -> diagram_model.Diagram:
+    """читает схему из базы данных в модель, не создавая виджетов. все строки читаются одним запросом, связи
+     восстанавливаются в памяти. прочитанные узлы не попадают в автосохранение открытой схемы"""
     with sqlite3.connect(db_name) as con:
-        cursor = con.cursor()
-        result_blocks = []
-        hashed_blocks: dict[int: blocks.BaseBlock] = {}
-
-        # Создаем блоки
-        blocks_type_and_hash = cursor.execute('SELECT BlockTypeId, Hash FROM Blocks').fetchall()
-        block_types = tuple(map(lambda x: x[0], blocks_type_and_hash))
-        blocks_hash = tuple(map(lambda x: x[1], blocks_type_and_hash))
-        new_block_types = []
-        for index in block_types:
-            new_value = cursor.execute(f'SELECT Name FROM BlockTypes WHERE Id == {index}').fetchone()[0]
-            new_block_types.append(new_value)
-        block_types = tuple(new_block_types)
-        for block_type, block_hash in zip(block_types, blocks_hash):
-            block_class = getattr(blocks, block_type)
-            new_block = block_class(blocks_parent)
-            result_blocks.append(new_block)
-            hashed_blocks[block_hash] = new_block
-
-        # Двигаем блоки
-        for block_hash, block in hashed_blocks.items():
-            coords = cursor.execute(f'SELECT XCoord, YCoord FROM Blocks WHERE Hash == {block_hash}').fetchone()
-            block.move(*coords)
-
-        # Задаем аргументы блокам
-        for block_hash, block in hashed_blocks.items():
-            arg = cursor.execute(f'SELECT Argument FROM Blocks WHERE Hash == {block_hash}').fetchone()[0]
-            block.arg = arg
-            block.arg_label.setText(arg)
-
-        # Задаем зависимости
-        for block_hash, block in hashed_blocks.items():
-            data = cursor.execute(f'SELECT DataType, ChildHash, LayerUpBlockHash, LayerDownBlockHash, GeneralBlockHash,'
-                                  f' LinesHash, LayerUpAdditionalBlockHash, LayerDownAdditionalBlockHash FROM Blocks'
-                                  f' WHERE Hash == {block_hash}').fetchone()
-            attribute_names = ['data_type', 'child', 'layer_up_block', 'layer_down_block', 'general_block', 'lines',
-                               'layer_up_additional_block', 'layer_down_additional_block']
-            for attr_value, attr_name in zip(data, attribute_names):
-                if hasattr(block, attr_name):
-                    if isinstance(attr_value, int):
-                        new_value = hashed_blocks.get(attr_value, None)
-                    elif attr_value and '[' in attr_value and ']' in attr_value:
-                        new_value = attr_value[1:-1].split(',')
-                        new_value = [hashed_blocks[int(i)] for i in new_value]
-                    else:
-                        new_value = attr_value
-                    setattr(block, attr_name, new_value)
-
-        for block in hashed_blocks.values():
-            block.resize_block()
-            block.move_related_blocks()
-
-        return result_blocks
+        rows = con.execute(f'SELECT BlockTypes.Name, {", ".join("Blocks." + i for i in BLOCK_COLUMNS)} FROM Blocks'
+                           f' JOIN BlockTypes ON Blocks.BlockTypeId == BlockTypes.Id ORDER BY Blocks.Hash').fetchall()
+
+    diagram = diagram_model.Diagram()
+    nodes: dict[int: diagram_model.Node] = {}
+    # Создаем узлы
+    for type_name, block_id, _, x_coord, y_coord, argument, data_type, *_ in rows:
+        node = diagram_model.Node(type_name, x_coord, y_coord, argument or '', data_type)
+        node.id = block_id
+        nodes[block_id] = diagram.add(node)
+
+    # Задаем зависимости
+    for row in rows:
+        node = nodes[row[1]]
+        link_ids = row[7:11] + row[12:14]
+        for attr_name, link_id in zip(LINK_ATTRIBUTES, link_ids):
+            if link_id is not None:
+                setattr(node, attr_name, nodes.get(link_id))
+        if row[11]:
+            node.set_lines(nodes[i] for i in json.loads(row[11]))
+
+    return diagram
+
+
+class IncrementalSaver:
+    """автосохранение: запоминает узлы, измененные с последнего сброса, и записывает в файл только их строки.
+     файл переводится в режим WAL, поэтому прерванная запись не портит его, а подтвержденные сбросы
+     восстанавливаются из журнала при следующем открытии"""
+
+    def __init__(self, db_name: str, nodes=()):
+        self.db_name = db_name
+        self.changed: set = set()
+        self.deleted: set = set()
+        self.type_ids = {name: type_id for type_id, name in get_values()}
+        self.connection = sqlite3.connect(db_name)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        with self.connection:
+            create_tables(self.connection.cursor())
+            self.has_spatial_index = create_spatial_index(self.connection.cursor())
+            if self.has_spatial_index and not is_spatial_index_current(self.connection.cursor()):
+                rebuild_spatial_index(self.connection.cursor())
+        max_id = self.connection.execute('SELECT MAX(Hash) FROM Blocks').fetchone()[0] or 0
+        self.next_id = max(max_id, *(i.id or 0 for i in nodes), 0) + 1
+
+    def start(self):
+        """начинает отслеживать изменения узлов"""
+        diagram_model.Node.on_change = self.mark_changed
+
+    def stop(self):
+        if diagram_model.Node.on_change == self.mark_changed:
+            diagram_model.Node.on_change = None
+
+    def mark_changed(self, node: diagram_model.Node):
+        self.changed.add(node)
+
+    def mark_deleted(self, node: diagram_model.Node):
+        self.deleted.add(node)
+
+    def clear(self):
+        """забывает накопленные изменения, например после полного сохранения"""
+        self.changed.clear()
+        self.deleted.clear()
+
+    def get_id(self, node: diagram_model.Node) -> int:
+        if node.id is None:
+            node.id = self.next_id
+            self.next_id += 1
+        return node.id
+
+    @property
+    def is_dirty(self) -> bool:
+        return bool(self.changed or self.deleted)
+
+    def flush(self) -> int:
+        """записывает накопленные изменения одной транзакцией, возвращает число записанных строк"""
+        if not self.is_dirty:
+            return 0
+        changed = [i for i in self.changed if i not in self.deleted]
+        for node in changed:
+            self.get_id(node)
+            for link in [*(getattr(node, i) for i in LINK_ATTRIBUTES), *node.lines]:
+                if link is not None:
+                    self.get_id(link)
+        with self.connection:
+            deleted_ids = [(i.id,) for i in self.deleted if i.id is not None]
+            self.connection.executemany('DELETE FROM Blocks WHERE Hash == ?', deleted_ids)
+            self.connection.executemany(f'INSERT OR REPLACE INTO Blocks({", ".join(BLOCK_COLUMNS)})'
+                                        f' VALUES ({", ".join("?" * 13)})',
+                                        (get_row(node, self.type_ids) for node in changed))
+            if self.has_spatial_index:
+                self.connection.executemany('DELETE FROM BlocksIndex WHERE Id == ?', deleted_ids)
+                self.connection.executemany('INSERT OR REPLACE INTO BlocksIndex VALUES (?, ?, ?, ?, ?)',
+                                            ((i.id, i.x, i.x, i.y, i.y) for i in changed))
+        written = len(changed) + len(self.deleted)
+        self.clear()
+        return written
+
+    def close(self):
+        """сбрасывает изменения и переносит журнал в основной файл"""
+        self.stop()
+        self.flush()
+        self.connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        self.connection.close()
+
+
+@profiled()
+def load_data_base(db_name: str, blocks_parent):
+    """загружает схему из базы данных и создает для нее блоки-виджеты"""
+    import blocks
+
+    result_blocks = []
+    for node in read_diagram(db_name):
+        block_class = getattr(blocks, node.type_name)
+        new_block = block_class(blocks_parent)
+        new_block.attach_node(node)
+        result_blocks.append(new_block)
+
+    for block in result_blocks:
+        blocks_parent.layout_engine.schedule(block.node)
+    blocks_parent.layout_engine.flush()
+
+    return result_blocks
@@ -0,0 +1,503 @@
+# -*- coding: utf-8 -*-
+"""холст на QGraphicsScene. блоки и стрелки - элементы сцены с BSP-индексом, поэтому отрисовка, поиск блока под
+ курсором и отсечение невидимых блоков масштабируются на схемы из десятков тысяч блоков"""
+import os
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+import diagram_model
+import render_cache
+import run_console
+import visual_elements
+from window_layout import MainWindow
+
+BLOCK_IMAGES = {'StartBlock': 'start.png', 'EndBlock': 'end.png', 'MethodBlock': 'method.png',
+                'VariableBlock': 'variable.png', 'OperatorBlock': 'operator.png', 'DataBlock': 'data.png',
+                'FunctionBlock': 'function.png', 'DataTypeBlock': 'output.png', 'LogicalBlock': 'operator.png',
+                'ForLoopBlock': 'for.png', 'WhileLoopBlock': 'while.png', 'IfBlock': 'if.png', 'ElifBlock': 'if.png',
+                'ElseBlock': 'if.png'}
+
+MERGE_TYPES = {'Method Block': 'MethodBlock', 'Variable Block': 'VariableBlock', 'Operator Block': 'OperatorBlock',
+               'Data Block': 'DataBlock', 'Logical Block': 'LogicalBlock', 'Function Block': 'FunctionBlock',
+               'Data Type Block': 'DataTypeBlock'}
+LINE_TYPES = {'Functional Block': 'FunctionBlock', 'If Block': 'IfBlock', 'Variable Block': 'VariableBlock',
+              'For Loop Block': 'ForLoopBlock', 'While Loop Block': 'WhileLoopBlock'}
+ADDITIONAL_TYPES = {'Else Block': 'ElseBlock', 'Elif Block': 'ElifBlock'}
+DATA_TYPES = ['str', 'int', 'float', 'bool', 'list', 'tuple', 'dict', 'set']
+
+
+def get_pixmap(type_name: str) -> QtGui.QPixmap:
+    return render_cache.get_pixmap(os.path.join('pictures', BLOCK_IMAGES.get(type_name, 'data.png')))
+
+
+def get_minimum_size(node: diagram_model.Node) -> tuple:
+    if node.type_name == 'ForLoopBlock':
+        return 53, 33
+    if node.is_general_block:
+        return 50, 33
+    return 55, 35
+
+
+def get_border_point(begin: QtCore.QPointF, rect: QtCore.QRectF) -> QtCore.QPointF:
+    """точка, в которой отрезок от begin к центру rect пересекает границу rect"""
+    center = rect.center()
+    dx, dy = center.x() - begin.x(), center.y() - begin.y()
+    scale = max(abs(dx) / max(rect.width() / 2, 1), abs(dy) / max(rect.height() / 2, 1))
+    if scale <= 1:
+        return center
+    return QtCore.QPointF(center.x() - dx / scale, center.y() - dy / scale)
+
+
+def get_structural_children(node: diagram_model.Node):
+    """узлы, положение которых задается этим узлом"""
+    return node.structural_children()
+
+
+class BlockItem(QtWidgets.QGraphicsItem):
+    """элемент сцены, отображающий узел модели"""
+
+    def __init__(self, node: diagram_model.Node):
+        super(BlockItem, self).__init__()
+        self.node = node
+        self.width, self.height = get_minimum_size(node)
+        self.setFlag(QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemIsSelectable)
+
+    def boundingRect(self) -> QtCore.QRectF:
+        return QtCore.QRectF(0, 0, self.width, self.height)
+
+    def set_size(self, width: int, height: int):
+        if (width, height) != (self.width, self.height):
+            self.prepareGeometryChange()
+            self.width, self.height = width, height
+
+    @property
+    def compound_height(self) -> int:
+        """высота блока вместе с его дополнительными конструкциями"""
+        height = self.height
+        current_node = self.node.layer_down_additional_block
+        while current_node is not None:
+            height += 1 + self.scene().block_items[current_node].height
+            current_node = current_node.layer_down_additional_block
+        return height
+
+    def set_root(self, is_root: bool):
+        """двигать мышью можно только корневые блоки, вложенные двигаются вместе с ними"""
+        self.setFlag(QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemIsMovable, is_root)
+        self.setFlag(QtWidgets.QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges, is_root)
+
+    def paint(self, painter: QtGui.QPainter, option, widget=None) -> None:
+        rect = self.boundingRect()
+        pixmap = render_cache.get_scaled_pixmap(get_pixmap(self.node.type_name), self.width, self.height)
+        painter.drawPixmap(0, 0, pixmap)
+        painter.drawText(rect.adjusted(11, 9, 0, 0), QtCore.Qt.AlignmentFlag.AlignLeft |
+                         QtCore.Qt.AlignmentFlag.AlignTop, self.node.arg)
+        if self.isSelected():
+            painter.setPen(QtGui.QPen(QtCore.Qt.GlobalColor.blue, 1, QtCore.Qt.PenStyle.DashLine))
+            painter.drawRect(rect.adjusted(0, 0, -1, -1))
+
+    def itemChange(self, change, value):
+        if change == QtWidgets.QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged and self.scene() is not None:
+            self.scene().root_moved(self.node)
+        return super(BlockItem, self).itemChange(change, value)
+
+
+class DiagramScene(QtWidgets.QGraphicsScene):
+    """сцена блок-схемы. вложенные блоки - дочерние элементы своих родителей, поэтому перемещение корневого блока
+     двигает всю конструкцию без пересчета положения вложенных блоков"""
+    status_message = QtCore.pyqtSignal(str)
+
+    def __init__(self, diagram: diagram_model.Diagram = None, parent=None):
+        super(DiagramScene, self).__init__(parent)
+        self.diagram = diagram_model.Diagram()
+        self.block_items = {}
+        self.arrow_items = {}
+        self.connecting_parent: diagram_model.Node = None
+        if diagram is not None:
+            self.load(diagram)
+
+    def load(self, diagram: diagram_model.Diagram):
+        """показывает на сцене уже существующую схему"""
+        self.clear()
+        self.block_items = {}
+        self.arrow_items = {}
+        self.diagram = diagram
+        for node in diagram:
+            self._create_item(node)
+        for node in diagram:
+            self._attach(node)
+        for node in diagram:
+            if node.parent_node is None:
+                self.layout(node, update_arrows=False)
+        for node in diagram:
+            self.update_arrow(node)
+
+    def _create_item(self, node: diagram_model.Node) -> BlockItem:
+        item = BlockItem(node)
+        self.block_items[node] = item
+        self.addItem(item)
+        return item
+
+    def _attach(self, node: diagram_model.Node):
+        """делает элемент узла дочерним элементу родительского узла"""
+        item = self.block_items[node]
+        parent = node.parent_node
+        if parent is not None:
+            if item.parentItem() is not self.block_items[parent]:
+                item.setParentItem(self.block_items[parent])
+            item.set_root(False)
+        else:
+            if item.parentItem() is not None:
+                item.setParentItem(None)
+            item.setPos(node.x, node.y)
+            item.set_root(True)
+
+    def root_node(self, node: diagram_model.Node) -> diagram_model.Node:
+        return node.root
+
+    def measure(self, node: diagram_model.Node):
+        """считает размер блока по размерам уже измеренных вложенных блоков"""
+        item = self.block_items[node]
+        minimum_width, minimum_height = get_minimum_size(node)
+        text_rect = render_cache.get_text_rect(self.font(), node.arg)
+        text_width, text_height = text_rect.width() + 28, text_rect.height() + 23
+        width = max(text_width, minimum_width)
+        height = minimum_height if node.is_general_block else max(text_height, minimum_height)
+        if node.layer_down_block is not None:
+            down_item = self.block_items[node.layer_down_block]
+            width, height = down_item.width + 18 + text_width, down_item.height + 8
+        if node.is_general_block:
+            for line in get_structural_children(node):
+                if line is node.layer_down_block or line is node.layer_down_additional_block:
+                    continue
+                line_item = self.block_items[line]
+                height += 3 + line_item.compound_height
+                width = max(width, line_item.width + 15)
+        item.set_size(width, height)
+
+    def place(self, node: diagram_model.Node):
+        """расставляет вложенные блоки относительно блока"""
+        item = self.block_items[node]
+        if node.layer_down_block is not None:
+            down_item = self.block_items[node.layer_down_block]
+            down_item.setPos(item.width - down_item.width - 3, 4)
+        if node.layer_down_additional_block is not None:
+            self.block_items[node.layer_down_additional_block].setPos(0, item.height + 1)
+        if node.is_general_block:
+            y = get_minimum_size(node)[1]
+            if node.layer_down_block is not None:
+                y = self.block_items[node.layer_down_block].height + 8
+            for line in get_structural_children(node):
+                if line is node.layer_down_block or line is node.layer_down_additional_block:
+                    continue
+                line_item = self.block_items[line]
+                line_item.setPos(12, y)
+                y += 3 + line_item.compound_height
+
+    def layout(self, node: diagram_model.Node, update_arrows: bool = True):
+        """пересчитывает размеры и положения всей конструкции, в которую входит node: один проход снизу вверх
+         для размеров и один сверху вниз для положений"""
+        root = self.root_node(node)
+        order = []
+        stack = [root]
+        while stack:
+            current_node = stack.pop()
+            order.append(current_node)
+            stack.extend(get_structural_children(current_node))
+        for current_node in reversed(order):
+            self.measure(current_node)
+        for current_node in order:
+            self.place(current_node)
+        if update_arrows:
+            self.root_moved(root)
+
+    def sync_positions(self):
+        """записывает положения элементов сцены в узлы модели, например перед сохранением"""
+        for node, item in self.block_items.items():
+            position = item.scenePos()
+            node.x, node.y = int(position.x()), int(position.y())
+
+    def get_arrangement_graph(self) -> tuple:
+        """размеры корневых конструкций вместе с вложенными блоками и связи child между ними, снимок для
+         auto_layout.arrange"""
+        sizes = {}
+        edges = []
+        for node, item in self.block_items.items():
+            if node.parent_node is None:
+                rect = item.boundingRect() | item.childrenBoundingRect()
+                sizes[node] = (int(rect.right()), int(rect.bottom()))
+            if node.child is not None:
+                edges.append((node.root, node.child.root))
+        return sizes, edges
+
+    def apply_arrangement(self, positions: dict, left: int = 15, top: int = 15):
+        """переносит корневые конструкции в рассчитанные положения, вложенные блоки двигаются вместе с ними"""
+        for root, (x, y) in positions.items():
+            item = self.block_items.get(root)
+            # пока раскладка считалась, конструкцию могли вложить в другую
+            if item is not None and root.parent_node is None:
+                item.setPos(left + x, top + y)
+
+    def root_moved(self, node: diagram_model.Node):
+        for source in [node, *node.incoming]:
+            self.update_arrow(source)
+
+    def update_arrow(self, source: diagram_model.Node):
+        arrow_item = self.arrow_items.get(source)
+        if source.child is None or source.child not in self.block_items:
+            if arrow_item is not None:
+                self.removeItem(arrow_item)
+                del self.arrow_items[source]
+            return
+        begin = self.block_items[source].sceneBoundingRect().center()
+        end = get_border_point(begin, self.block_items[source.child].sceneBoundingRect())
+        arrow = visual_elements.Arrow(begin.toPoint(), end.toPoint())
+        path = QtGui.QPainterPath(begin)
+        path.lineTo(end)
+        path.addPolygon(arrow.head)
+        path.closeSubpath()
+        if arrow_item is None:
+            arrow_item = self.addPath(path, QtGui.QPen(QtCore.Qt.GlobalColor.black),
+                                      QtGui.QBrush(QtCore.Qt.GlobalColor.black))
+            arrow_item.setZValue(-1)
+            self.arrow_items[source] = arrow_item
+        else:
+            arrow_item.setPath(path)
+
+    def add_block(self, type_name: str, position: QtCore.QPointF = QtCore.QPointF(15, 15)) -> diagram_model.Node:
+        node = self.diagram.add(diagram_model.Node(type_name, int(position.x()), int(position.y())))
+        self._create_item(node)
+        self._attach(node)
+        self.layout(node)
+        return node
+
+    def merge_block(self, parent: diagram_model.Node, type_name: str) -> diagram_model.Node:
+        if parent.layer_down_block is not None:
+            self.status_message.emit("Can't merge another one block")
+            return None
+        node = self.diagram.add(diagram_model.Node(type_name))
+        self._create_item(node)
+        parent.layer_down_block = node
+        node.layer_up_block = parent
+        self._attach(node)
+        self.layout(node)
+        return node
+
+    def add_line(self, parent: diagram_model.Node, type_name: str) -> diagram_model.Node:
+        node = self.diagram.add(diagram_model.Node(type_name))
+        self._create_item(node)
+        parent.append_line(node)
+        self._attach(node)
+        self.layout(node)
+        return node
+
+    def add_additional_block(self, parent: diagram_model.Node, type_name: str) -> diagram_model.Node:
+        if type_name == 'ElseBlock' and 'ElseBlock' in [i.type_name for i in self._additional_chain(parent)]:
+            self.status_message.emit("Can't add another one Else")
+            return None
+        node = self.diagram.add(diagram_model.Node(type_name))
+        self._create_item(node)
+        old_down = parent.layer_down_additional_block
+        parent.layer_down_additional_block = node
+        node.layer_up_additional_block = parent
+        if old_down is not None:
+            node.layer_down_additional_block = old_down
+            old_down.layer_up_additional_block = node
+        if parent.general_block is not None:
+            node.general_block = parent.general_block
+        self._attach(node)
+        if old_down is not None:
+            self._attach(old_down)
+        self.layout(node)
+        return node
+
+    def _additional_chain(self, node: diagram_model.Node) -> list:
+        result = []
+        current_node = node.highest_additional_block
+        while current_node is not None:
+            result.append(current_node)
+            current_node = current_node.layer_down_additional_block
+        return result
+
+    def connect(self, parent: diagram_model.Node, child: diagram_model.Node):
+        parent, child = self.root_node(parent), self.root_node(child)
+        if parent is child:
+            return
+        old_child = parent.child
+        parent.child = child
+        self.update_arrow(parent)
+        if old_child is not None:
+            self.root_moved(old_child)
+
+    def set_argument(self, node: diagram_model.Node, arg: str, data_type: str = None):
+        node.arg = arg
+        if data_type is not None:
+            node.data_type = data_type
+        self.block_items[node].update()
+        self.layout(node)
+
+
+class DiagramView(QtWidgets.QGraphicsView):
+    """вид на сцену с прокруткой и масштабированием (Ctrl + колесо мыши)"""
+
+    def __init__(self, scene: DiagramScene, parent=None):
+        super(DiagramView, self).__init__(scene, parent)
+        self.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
+        self.setDragMode(QtWidgets.QGraphicsView.DragMode.RubberBandDrag)
+        self.setViewportUpdateMode(QtWidgets.QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
+        self.setTransformationAnchor(QtWidgets.QGraphicsView.ViewportAnchor.AnchorUnderMouse)
+        self.setOptimizationFlag(QtWidgets.QGraphicsView.OptimizationFlag.DontSavePainterState, True)
+
+    def wheelEvent(self, event: QtGui.QWheelEvent) -> None:
+        if event.modifiers() & QtCore.Qt.KeyboardModifier.ControlModifier:
+            factor = 1.15 ** (event.angleDelta().y() / 120)
+            self.scale(factor, factor)
+            return
+        super(DiagramView, self).wheelEvent(event)
+
+    def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
+        scene: DiagramScene = self.scene()
+        item = self.itemAt(event.pos())
+        if scene.connecting_parent is not None and event.button() == QtCore.Qt.MouseButton.LeftButton:
+            if isinstance(item, BlockItem):
+                scene.connect(scene.connecting_parent, item.node)
+            scene.connecting_parent = None
+            return
+        super(DiagramView, self).mousePressEvent(event)
+
+    def contextMenuEvent(self, event: QtGui.QContextMenuEvent) -> None:
+        item = self.itemAt(event.pos())
+        if not isinstance(item, BlockItem):
+            return
+        node = item.node
+        scene: DiagramScene = self.scene()
+        menu = QtWidgets.QMenu(self)
+        if node.type_name not in ('StartBlock', 'EndBlock'):
+            menu.addAction('set argument', lambda: self.set_argument(node))
+            menu.addAction('merge blocks', lambda: self.choose(MERGE_TYPES, lambda i: scene.merge_block(node, i)))
+        if node.type_name != 'EndBlock':
+            menu.addAction('connect', lambda: setattr(scene, 'connecting_parent', node))
+        if node.is_general_block:
+            menu.addAction('add line', lambda: self.choose(LINE_TYPES, lambda i: scene.add_line(node, i)))
+        if node.has_additional_blocks:
+            menu.addAction('add additional block',
+                           lambda: self.choose(ADDITIONAL_TYPES, lambda i: scene.add_additional_block(node, i)))
+        menu.exec_(event.globalPos())
+
+    def choose(self, items_data: dict, action):
+        block_type, ok = QtWidgets.QInputDialog.getItem(self, 'Choose block type', 'block type:', items_data.keys())
+        if ok and block_type in items_data:
+            action(items_data[block_type])
+
+    def set_argument(self, node: diagram_model.Node):
+        data_type = None
+        if node.type_name == 'DataBlock':
+            data_type, ok = QtWidgets.QInputDialog.getItem(self, 'Choose data type', 'data type:', DATA_TYPES)
+            if not ok:
+                return
+        new_arg, ok = QtWidgets.QInputDialog.getText(self, 'Enter the argument', 'Argument:', text=node.arg)
+        if ok:
+            self.scene().set_argument(node, new_arg, data_type)
+
+
+class SceneWindow(QtWidgets.QMainWindow, MainWindow, run_console.RunConsoleWindow):
+    """основное окно с холстом на QGraphicsScene"""
+    arrange_finished = QtCore.pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super(SceneWindow, self).__init__(parent)
+        self.current_file = None
+        self.arranging = False
+        self.arrange_executor = None
+        self.arrange_finished.connect(self.apply_arrangement)
+        QtCore.QTimer.singleShot(0, self.start_background_services)
+
+        self.setup(self)
+        self.scene = DiagramScene(parent=self)
+        self.scene.status_message.connect(self.status_bar.showMessage)
+        self.view = DiagramView(self.scene, self)
+        self.setCentralWidget(self.view)
+        self.initUI()
+
+    def initUI(self) -> None:
+        self.scene.add_block('StartBlock', QtCore.QPointF(370, 15))
+        self.scene.add_block('EndBlock', QtCore.QPointF(370, 550))
+
+        self.add_function_block_action.triggered.connect(lambda: self.add_block('FunctionBlock'))
+        self.add_variable_block_action.triggered.connect(lambda: self.add_block('VariableBlock'))
+        self.add_for_loop_block_action.triggered.connect(lambda: self.add_block('ForLoopBlock'))
+        self.add_while_loop_block_action.triggered.connect(lambda: self.add_block('WhileLoopBlock'))
+        self.add_if_block_action.triggered.connect(lambda: self.add_block('IfBlock'))
+        self.execute_program_action.triggered.connect(self.execute_program)
+        self.run_console_action.toggled.connect(self.toggle_run_console)
+        self.arrange_action.triggered.connect(self.arrange_blocks)
+        self.performance_panel_action.toggled.connect(self.toggle_performance_panel)
+        self.save_file_action.triggered.connect(self.save_file)
+        self.save_as_file_action.triggered.connect(self.save_as_file)
+        self.open_file_action.triggered.connect(self.open_file)
+
+    def start_background_services(self):
+        """запускает воркеры выполнения программ, когда окно уже показано"""
+        self.interpreter.start_workers()
+
+    def add_block(self, type_name: str) -> diagram_model.Node:
+        """добавляет блок в центр видимой области"""
+        return self.scene.add_block(type_name, self.view.mapToScene(self.view.viewport().rect().center()))
+
+    def execute_program(self):
+        """запускает составленную программу в консоли запуска"""
+        self.run_program(self.scene.diagram)
+
+    def arrange_blocks(self):
+        """раскладывает схему по слоям графа связей child, раскладка считается в фоновом потоке"""
+        if self.arranging:
+            return
+        import auto_layout
+        from concurrent.futures import ThreadPoolExecutor
+        sizes, edges = self.scene.get_arrangement_graph()
+        if self.arrange_executor is None:
+            self.arrange_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='arrange')
+        self.arranging = True
+        self.status_bar.showMessage('Arranging...')
+        future = self.arrange_executor.submit(auto_layout.arrange, sizes, edges)
+        future.add_done_callback(lambda done: self.arrange_finished.emit(done))
+
+    def apply_arrangement(self, future):
+        self.arranging = False
+        try:
+            positions = future.result()
+        except Exception as error:
+            self.status_bar.showMessage(f'Arrange failed: {error!r}')
+            return
+        self.scene.apply_arrangement(positions)
+        self.status_bar.showMessage(f'Arranged {len(positions)} constructions')
+
+    def closeEvent(self, a0: QtGui.QCloseEvent) -> None:
+        self.stop_program()
+        if self.arrange_executor is not None:
+            self.arrange_executor.shutdown(wait=False)
+        super(SceneWindow, self).closeEvent(a0)
+
+    def save_file(self):
+        import save_diagram
+        if self.current_file and os.path.exists(self.current_file):
+            self.scene.sync_positions()
+            save_diagram.fill_data_base(self.current_file, self.scene.diagram)
+        else:
+            self.save_as_file()
+
+    def save_as_file(self):
+        import save_diagram
+        file_name = QtWidgets.QFileDialog.getSaveFileName(self, 'Save File', '.', filter='*.sqlite')[0]
+        if file_name:
+            self.scene.sync_positions()
+            save_diagram.fill_data_base(file_name, self.scene.diagram)
+            self.current_file = file_name
+            self.setWindowTitle(self.current_file)
+
+    def open_file(self):
+        import save_diagram
+        file_name = QtWidgets.QFileDialog.getOpenFileName(self, 'Open File', '.', filter='*.sqlite')[0]
+        if file_name:
+            self.scene.load(save_diagram.read_diagram(file_name))
+            self.current_file = file_name
+            self.setWindowTitle(self.current_file)
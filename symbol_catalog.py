@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""каталог имен для Function, Method и Data Type блоков: встроенные функции и типы, методы типов и функции
+ нескольких модулей стандартной библиотеки вместе с сигнатурами. каталог строится в фоновом потоке, хранится на
+ диске между запусками и проиндексирован для поиска по префиксу и нечеткого поиска"""
+import bisect
+import builtins
+import functools
+import json
+import os
+import sys
+import threading
+
+CATALOG_VERSION = 1
+# модули стандартной библиотеки, функции которых можно выбрать в Function Block
+STDLIB_MODULES = ('math', 'random', 'statistics', 'string', 'time', 'itertools', 'functools', 'os.path')
+# типы, методы которых можно выбрать в Method Block
+METHOD_TYPES = ('str', 'list', 'dict', 'set', 'tuple', 'int', 'float', 'bytes', 'frozenset')
+CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'block_diagrams', 'symbols.json')
+
+
+class SymbolKind:
+    FUNCTION = 'function'
+    METHOD = 'method'
+    TYPE = 'type'
+
+
+class Symbol:
+    """одно имя каталога. owner - модуль функции или тип метода, для встроенных имен пустой"""
+    __slots__ = ('name', 'kind', 'owner', 'signature', 'doc', 'key', 'mask')
+
+    def __init__(self, name: str, kind: str, owner: str = '', signature: str = '', doc: str = ''):
+        self.name = name
+        self.kind = kind
+        self.owner = owner
+        self.signature = signature
+        self.doc = doc
+        self.key = self.full_name.lower()
+        self.mask = get_mask(self.key)
+
+    @property
+    def full_name(self) -> str:
+        return f'{self.owner}.{self.name}' if self.owner else self.name
+
+    def __repr__(self):
+        return f'Symbol({self.full_name}{self.signature})'
+
+    def to_json(self) -> list:
+        return [self.name, self.kind, self.owner, self.signature, self.doc]
+
+
+def get_mask(text: str) -> int:
+    """битовая маска символов строки, чтобы отбрасывать кандидатов без части букв запроса одной операцией"""
+    mask = 0
+    for char in text:
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+
+def get_signature(obj) -> str:
+    import inspect
+    try:
+        return str(inspect.signature(obj))
+    except (TypeError, ValueError):
+        return '(...)'
+
+
+def get_doc(obj) -> str:
+    import inspect
+    doc = inspect.getdoc(obj) or ''
+    return doc.strip().split('\n')[0][:120]
+
+
+def make_symbol(name: str, kind: str, owner: str, obj):
+    """Symbol для объекта или None, если inspect не смог его разобрать"""
+    try:
+        return Symbol(name, kind, owner, get_signature(obj), get_doc(obj))
+    except Exception:
+        return None
+
+
+def collect_symbols() -> list:
+    """обходит встроенные имена и модули, это медленная часть построения каталога. имена, которые не удалось
+     разобрать, и модули, которые не удалось импортировать, пропускаются"""
+    import importlib
+    import inspect
+    result = []
+    for name, obj in sorted(vars(builtins).items()):
+        if name.startswith('_'):
+            continue
+        if inspect.isclass(obj):
+            if not issubclass(obj, BaseException):
+                result.append(make_symbol(name, SymbolKind.TYPE, '', obj))
+        elif callable(obj):
+            result.append(make_symbol(name, SymbolKind.FUNCTION, '', obj))
+    for type_name in METHOD_TYPES:
+        for name, obj in sorted(vars(getattr(builtins, type_name)).items()):
+            if not name.startswith('_') and callable(obj):
+                result.append(make_symbol(name, SymbolKind.METHOD, type_name, obj))
+    for module_name in STDLIB_MODULES:
+        try:
+            module = importlib.import_module(module_name)
+        except Exception:
+            continue
+        for name in getattr(module, '__all__', dir(module)):
+            obj = getattr(module, name, None)
+            if not name.startswith('_') and callable(obj) and not inspect.isclass(obj):
+                result.append(make_symbol(name, SymbolKind.FUNCTION, module_name, obj))
+    return [i for i in result if i is not None]
+
+
+def is_subsequence(query: str, text: str) -> bool:
+    position = 0
+    for char in query:
+        position = text.find(char, position) + 1
+        if not position:
+            return False
+    return True
+
+
+class SymbolCatalog:
+    """индекс имен: отсортированные ключи для поиска по префиксу и маски символов для нечеткого поиска"""
+
+    def __init__(self, symbols=()):
+        self.symbols = sorted(symbols, key=lambda i: i.key)
+        self.keys = [i.key for i in self.symbols]
+        # по короткому имени тоже ищется по префиксу: 'upp' находит str.upper
+        self.names = sorted((i.name.lower(), index) for index, i in enumerate(self.symbols))
+        self.name_keys = [i[0] for i in self.names]
+        self.search = functools.lru_cache(maxsize=1024)(self._search)
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def _prefix_range(self, keys: list, prefix: str) -> range:
+        start = bisect.bisect_left(keys, prefix)
+        end = bisect.bisect_left(keys, prefix + '\uffff', start)
+        return range(start, end)
+
+    def _search(self, query: str, kind: str = None, owners: tuple = None, limit: int = 200) -> tuple:
+        """имена, подходящие под запрос: сначала совпадения по префиксу полного или короткого имени, потом
+         нечеткие (буквы запроса идут в имени по порядку)"""
+        query = query.lower().strip()
+
+        def accept(symbol: Symbol) -> bool:
+            return (kind is None or symbol.kind == kind) and (owners is None or symbol.owner in owners)
+
+        found = {}
+        for index in self._prefix_range(self.keys, query):
+            if accept(self.symbols[index]):
+                found.setdefault(index, None)
+        for position in self._prefix_range(self.name_keys, query):
+            index = self.names[position][1]
+            if accept(self.symbols[index]):
+                found.setdefault(index, None)
+        if len(found) < limit and query:
+            mask = get_mask(query)
+            for index, symbol in enumerate(self.symbols):
+                if symbol.mask & mask == mask and index not in found and accept(symbol) and \
+                        is_subsequence(query, symbol.key):
+                    found.setdefault(index, None)
+                    if len(found) >= limit:
+                        break
+        return tuple(self.symbols[i] for i in list(found)[:limit])
+
+    def save(self, path: str = CACHE_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = {'version': CATALOG_VERSION, 'python': sys.version, 'symbols': [i.to_json() for i in self.symbols]}
+        with open(path + '.tmp', mode='w', encoding='utf-8') as file:
+            json.dump(data, file)
+        os.replace(path + '.tmp', path)
+
+    @classmethod
+    def load(cls, path: str = CACHE_PATH):
+        """каталог с диска или None, если его нет или он построен для другой версии python"""
+        try:
+            with open(path, encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != CATALOG_VERSION or data.get('python') != sys.version:
+            return None
+        return cls(Symbol(*i) for i in data['symbols'])
+
+    @classmethod
+    def build(cls, path: str = CACHE_PATH):
+        catalog = cls.load(path)
+        if catalog is None:
+            catalog = cls(collect_symbols())
+            try:
+                catalog.save(path)
+            except OSError:
+                pass
+        return catalog
+
+
+_catalog: SymbolCatalog = None
+_thread: threading.Thread = None
+_ready = threading.Event()
+_lock = threading.Lock()
+
+
+def _build():
+    global _catalog
+    try:
+        _catalog = SymbolCatalog.build()
+    except Exception:
+        _catalog = SymbolCatalog()  # get_catalog не должен ждать вечно, диалог покажет пустой каталог
+    finally:
+        _ready.set()
+
+
+def start_building():
+    """начинает строить каталог в фоновом потоке, если он еще не строится"""
+    global _thread
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_build, name='symbol-catalog', daemon=True)
+            _thread.start()
+
+
+def get_catalog() -> SymbolCatalog:
+    """каталог имен. если фоновое построение еще не закончилось, ждет его"""
+    start_building()
+    _ready.wait()
+    return _catalog
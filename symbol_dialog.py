@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+from PyQt5 import QtCore, QtWidgets
+
+import symbol_catalog
+
+
+class SymbolDialog(QtWidgets.QDialog):
+    """диалог выбора имени из каталога с поиском по мере ввода"""
+
+    def __init__(self, parent, title: str, kind: str, owners: tuple = None):
+        super(SymbolDialog, self).__init__(parent)
+        self.setWindowTitle(title)
+        self.kind = kind
+        self.owners = owners
+        self.catalog = symbol_catalog.get_catalog()
+
+        self.search_line = QtWidgets.QLineEdit(self)
+        self.search_line.setPlaceholderText('search')
+        self.results = QtWidgets.QListWidget(self)
+        self.description = QtWidgets.QLabel(self)
+        self.description.setWordWrap(True)
+        buttons = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.StandardButton.Ok |
+                                             QtWidgets.QDialogButtonBox.StandardButton.Cancel, parent=self)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addWidget(self.search_line)
+        layout.addWidget(self.results)
+        layout.addWidget(self.description)
+        layout.addWidget(buttons)
+
+        self.search_line.textChanged.connect(self.refresh)
+        self.results.currentItemChanged.connect(self.show_description)
+        self.results.itemDoubleClicked.connect(self.accept)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        self.refresh('')
+
+    def refresh(self, text: str):
+        self.results.clear()
+        for symbol in self.catalog.search(text, self.kind, self.owners):
+            item = QtWidgets.QListWidgetItem(symbol.full_name + symbol.signature, self.results)
+            item.setData(QtCore.Qt.ItemDataRole.UserRole, symbol)
+        self.results.setCurrentRow(0)
+
+    def show_description(self, item: QtWidgets.QListWidgetItem):
+        self.description.setText(item.data(QtCore.Qt.ItemDataRole.UserRole).doc if item is not None else '')
+
+    @property
+    def symbol(self) -> symbol_catalog.Symbol:
+        item = self.results.currentItem()
+        return item.data(QtCore.Qt.ItemDataRole.UserRole) if item is not None else None
+
+    @staticmethod
+    def get_symbol(parent, title: str, kind: str, owners: tuple = None) -> symbol_catalog.Symbol:
+        """показывает диалог и возвращает выбранное имя или None"""
+        dialog = SymbolDialog(parent, title, kind, owners)
+        if dialog.exec_() != QtWidgets.QDialog.DialogCode.Accepted:
+            return None
+        return dialog.symbol
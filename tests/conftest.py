@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import diagram_model  # noqa: E402
+import save_diagram  # noqa: E402
+
+
+def merge(*chain) -> diagram_model.Node:
+    """сливает узлы в цепочку layer_down_block, возвращает первый"""
+    for upper, lower in zip(chain, chain[1:]):
+        upper.layer_down_block = lower
+        lower.layer_up_block = upper
+    return chain[0]
+
+
+def assignment(diagram: diagram_model.Diagram, name: str, value: str) -> diagram_model.Node:
+    """узлы присваивания name = int(value)"""
+    return merge(diagram.add(diagram_model.Node('VariableBlock', arg=name)),
+                 diagram.add(diagram_model.Node('OperatorBlock', arg='=')),
+                 diagram.add(diagram_model.Node('DataBlock', arg=value, data_type='int')))
+
+
+def describe(nodes) -> list:
+    """сохраняемые данные узлов по возрастанию id, связи заменены на id"""
+    def get_id(node):
+        return None if node is None else node.id
+
+    return [(node.id, node.type_name, node.x, node.y, node.arg, node.data_type,
+             tuple(get_id(getattr(node, i)) for i in save_diagram.LINK_ATTRIBUTES), tuple(i.id for i in node.lines))
+            for node in sorted(nodes, key=lambda i: i.id)]
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    """приложение Qt для тестов окон, без дисплея"""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    QtWidgets = pytest.importorskip('PyQt5.QtWidgets')
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def diagram() -> diagram_model.Diagram:
+    """Start -> x = 1 -> for i in range(3): y = 2 -> if x: y = 3 else: y = 4 -> End"""
+    diagram = diagram_model.Diagram()
+    start = diagram.add(diagram_model.Node('StartBlock'))
+    first = assignment(diagram, 'x', '1')
+
+    loop = diagram.add(diagram_model.Node('ForLoopBlock', arg='for i in '))
+    merge(loop, diagram.add(diagram_model.Node('FunctionBlock', arg='range()')),
+          diagram.add(diagram_model.Node('DataBlock', arg='3', data_type='int')))
+    loop.append_line(assignment(diagram, 'y', '2'))
+
+    condition = diagram.add(diagram_model.Node('IfBlock', arg='if x'))
+    condition.append_line(assignment(diagram, 'y', '3'))
+    otherwise = diagram.add(diagram_model.Node('ElseBlock'))
+    otherwise.append_line(assignment(diagram, 'y', '4'))
+    condition.layer_down_additional_block = otherwise
+    otherwise.layer_up_additional_block = condition
+
+    end = diagram.add(diagram_model.Node('EndBlock'))
+    start.child = first
+    first.child = loop
+    loop.child = condition
+    condition.child = end
+    return diagram
+
+
+@pytest.fixture
+def window(qapp, monkeypatch):
+    """главное окно. open_test_file(file_name) открывает файл и ждет конца загрузки"""
+    from PyQt5 import QtCore, QtWidgets
+    import program
+
+    def open_file(file_name: str):
+        monkeypatch.setattr(QtWidgets.QFileDialog, 'getOpenFileName', lambda *args, **kwargs: (file_name, ''))
+        window.open_file()
+        while window.loader is not None:
+            qapp.processEvents()
+
+    window = program.Program()
+    window.open_test_file = open_file
+    yield window
+    window.close()
+    # окно удаляется сразу, пока на него есть ссылка: если его удалит сборщик циклов python, вместе с блоками
+    # освобождаются python-объекты из данных их действий посреди сборки
+    window.deleteLater()
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+import auto_layout
+
+
+def test_remove_cycles_reverses_back_edges():
+    nodes = ['a', 'b', 'c', 'd']
+    edges = [('a', 'b'), ('b', 'c'), ('c', 'a'), ('c', 'd')]
+    result = auto_layout.remove_cycles(nodes, edges)
+    assert len(result) == len(edges)
+    assert len(set(result) - set(edges)) == 1
+    layers = auto_layout.assign_layers(nodes, result)
+    # в графе без циклов каждая связь идет в более глубокий слой
+    assert all(layers[source] < layers[destination] for source, destination in result)
+
+
+def test_assign_layers_uses_longest_path():
+    layers = auto_layout.assign_layers(['a', 'b', 'c', 'd'], [('a', 'b'), ('b', 'c'), ('a', 'c'), ('d', 'c')])
+    assert layers == {'a': 0, 'b': 1, 'c': 2, 'd': 0}
+
+
+def test_long_edge_gets_dummy_nodes():
+    layers = {'a': 0, 'b': 1, 'c': 2, 'd': 3}
+    edges = auto_layout.split_long_edges(layers, [('a', 'b'), ('b', 'c'), ('c', 'd'), ('a', 'd')])
+    first, second = sorted((i for i in layers if isinstance(i, auto_layout.Dummy)), key=layers.get)
+    assert (layers[first], layers[second]) == (1, 2)
+    # связь a -> d заменена цепочкой через фиктивные узлы, каждая связь соединяет соседние слои
+    assert edges == [('a', 'b'), ('b', 'c'), ('c', 'd'), ('a', first), (first, second), (second, 'd')]
+
+
+def test_arrange_has_no_overlaps_within_layer():
+    sizes = {'start': (60, 30), 'wide': (300, 80), 'narrow': (40, 20), 'other': (120, 40), 'end': (60, 30),
+             'alone': (50, 50)}
+    edges = [('start', 'wide'), ('start', 'narrow'), ('start', 'other'), ('wide', 'end'), ('narrow', 'end'),
+             ('other', 'end'), ('end', 'start'), ('start', 'end'), ('alone', 'alone'), ('start', 'missing')]
+    positions = auto_layout.arrange(sizes, edges)
+    assert sorted(positions) == sorted(sizes)
+    assert min(x for x, _ in positions.values()) == 0
+    assert min(y for _, y in positions.values()) == 0
+
+    rows = {}
+    for node, (x, y) in positions.items():
+        rows.setdefault(y, []).append((x, x + sizes[node][0]))
+    for row in rows.values():
+        row.sort()
+        for (_, right), (left, _) in zip(row, row[1:]):
+            assert left - right >= auto_layout.H_GAP
+    # связи без обратной идут сверху вниз, слои не пересекаются по высоте
+    assert positions['start'][1] < positions['wide'][1] < positions['end'][1]
+    assert positions['end'][1] >= positions['wide'][1] + sizes['wide'][1] + auto_layout.V_GAP
+
+
+def test_arrange_empty_graph():
+    assert auto_layout.arrange({}, []) == {}
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+import binary_diagram
+import interpreter
+import save_diagram
+from conftest import describe
+
+
+def test_sqlite_binary_roundtrip(diagram, tmp_path):
+    db_name, path, back_name = (str(tmp_path / i) for i in ('diagram.sqlite', 'diagram.bdgm', 'back.sqlite'))
+    save_diagram.fill_data_base(db_name, diagram)
+    binary_diagram.sqlite_to_binary(db_name, path)
+    from_binary = binary_diagram.read_binary(path)
+    assert describe(from_binary) == describe(diagram)
+
+    binary_diagram.binary_to_sqlite(path, back_name)
+    assert describe(save_diagram.read_diagram(back_name)) == describe(diagram)
+    assert interpreter.Interpreter().convert_to_py(from_binary, console=False) == \
+        interpreter.Interpreter().convert_to_py(diagram, console=False)
+
+
+def test_write_binary_assigns_ids(diagram, tmp_path):
+    path = str(tmp_path / 'diagram.bdgm')
+    binary_diagram.write_binary(path, diagram)
+    assert sorted(i.id for i in diagram) == list(range(1, len(diagram) + 1))
+    assert describe(binary_diagram.read_binary(path)) == describe(diagram)
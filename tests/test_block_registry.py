@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import diagram_model
+from block_registry import BlockRegistry
+
+
+class Block:
+    """блок окна без Qt: реестру нужен только узел"""
+    def __init__(self, type_name: str, block_id: int = None):
+        self.node = diagram_model.Node(type_name)
+        self.node.id = block_id
+        self.node.view = self
+
+
+def test_register_and_unregister():
+    start, variable, end = Block('StartBlock'), Block('VariableBlock', 7), Block('EndBlock')
+    registry = BlockRegistry([start, variable])
+    registry.add(end)
+    assert [start.node.id, variable.node.id, end.node.id] == [1, 7, 8]
+    assert list(registry) == [start, variable, end]
+    assert registry.get(7) is variable
+    assert registry.of_type('VariableBlock') == [variable]
+    assert variable in registry
+
+    assert registry.remove(variable)
+    assert not registry.remove(variable)
+    assert variable not in registry
+    assert registry.get(7) is None
+    assert registry.of_type('VariableBlock') == []
+    assert registry.remove_many([start, variable]) == [start]
+    assert len(registry) == 1
+
+    # id удаленного блока повторно не выдается
+    registry.add(Block('VariableBlock'))
+    assert registry.get(9) is not None
+
+
+def test_duplicate_id_is_rejected():
+    registry = BlockRegistry([Block('StartBlock', 1)])
+    with pytest.raises(ValueError):
+        registry.add(Block('EndBlock', 1))
+
+
+def test_incoming_follows_child_links():
+    start, end = Block('StartBlock'), Block('EndBlock')
+    registry = BlockRegistry([start, end])
+    start.node.child = end.node
+    assert registry.incoming(end) == [start]
+    start.node.child = None
+    assert registry.incoming(end) == []
+
+
+@pytest.mark.parametrize('ids, next_id', [
+    ([], 1),
+    ([None, None], 1),
+    ([4, None, 2], 5),
+    ((i for i in [10]), 11),
+])
+def test_reserve(ids, next_id):
+    registry = BlockRegistry()
+    registry.reserve(ids)
+    assert registry.next_id == next_id
+    block = Block('StartBlock')
+    registry.add(block)
+    assert block.node.id == next_id
+
+
+def test_reserve_never_lowers_next_id():
+    registry = BlockRegistry([Block('StartBlock', 20)])
+    registry.reserve([3])
+    assert registry.next_id == 21
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+import save_diagram
+
+
+def find(window, type_name: str, arg: str = None):
+    return next(i for i in window.blocks if i.node.type_name == type_name and (arg is None or i.node.arg == arg))
+
+
+def merged(node) -> list:
+    """узел и смердженные с ним узлы"""
+    result = []
+    while node is not None:
+        result.append(node)
+        node = node.layer_down_block
+    return result
+
+
+def links(node) -> list:
+    return [*(getattr(node, i) for i in save_diagram.LINK_ATTRIBUTES), *node.lines, *node.incoming]
+
+
+def test_batch_delete_detaches_every_link(window, diagram, tmp_path):
+    db_name = str(tmp_path / 'diagram.sqlite')
+    save_diagram.fill_data_base(db_name, diagram)
+    window.open_test_file(db_name)
+    loop = find(window, 'ForLoopBlock').node
+    condition = find(window, 'IfBlock').node
+    otherwise = condition.layer_down_additional_block
+    first = next(iter(loop.incoming))
+    # цикл - с заголовком range(3) и строкой y = 2, else - со строкой y = 4
+    expected = {i for node in (loop, *loop.lines, otherwise, *otherwise.lines) for i in merged(node)}
+    assert len(expected) == 10
+
+    with window.transaction() as transaction:
+        transaction.delete(loop.view)
+        transaction.delete(otherwise.view)
+        # до выхода из with ничего не меняется
+        assert loop.view in window.blocks
+
+    remaining = set(window.blocks.nodes)
+    assert remaining.isdisjoint(expected)
+    assert len(remaining) == len(diagram) - len(expected)
+    for node in remaining:
+        assert expected.isdisjoint(links(node)), node
+    assert first.child is None
+    assert loop.child is None
+    assert condition.layer_down_additional_block is None
+    assert condition.lines and condition.lines[0] in remaining
+    assert window.autosaver.deleted == expected
+
+    window.autosave()
+    assert sorted(i.id for i in save_diagram.read_diagram(db_name)) == sorted(i.id for i in remaining)
+
+
+def test_failed_transaction_changes_nothing(window, diagram, tmp_path):
+    db_name = str(tmp_path / 'diagram.sqlite')
+    save_diagram.fill_data_base(db_name, diagram)
+    window.open_test_file(db_name)
+    loop = find(window, 'ForLoopBlock')
+    try:
+        with window.transaction() as transaction:
+            transaction.delete(loop)
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    assert loop in window.blocks
+    assert len(window.blocks) == len(diagram)
+    assert not window.autosaver.deleted
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+import os
+
+import binary_diagram
+import compiler
+import diagram_model
+import save_diagram
+
+
+def test_find_collisions(tmp_path):
+    paths = [str(tmp_path / i) for i in ('x.sqlite', 'x.bdgm', 'y.sqlite')]
+    collisions = compiler.find_collisions(paths, [compiler.get_output_path(i) for i in paths])
+    assert sorted(collisions) == sorted(paths[:2])
+    assert paths[1] in collisions[paths[0]]
+    assert paths[0] in collisions[paths[1]]
+
+    paths = [str(tmp_path / 'a' / 'x.sqlite'), str(tmp_path / 'b' / 'x.sqlite')]
+    assert compiler.find_collisions(paths, [compiler.get_output_path(i) for i in paths]) == {}
+    output_dir = str(tmp_path / 'build')
+    assert sorted(compiler.find_collisions(paths, [compiler.get_output_path(i, output_dir) for i in paths])) == paths
+
+
+def test_compile_all_skips_colliding_diagrams(diagram, tmp_path):
+    paths = []
+    for name in ('a/x.sqlite', 'b/x.sqlite', 'a/y.bdgm'):
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        paths.append(str(path))
+    save_diagram.fill_data_base(paths[0], diagram)
+    save_diagram.fill_data_base(paths[1], diagram)
+    binary_diagram.write_binary(paths[2], diagram)
+    output_dir = tmp_path / 'build'
+
+    results = list(compiler.compile_all(paths, str(output_dir), workers=1))
+    assert [i[0] for i in results] == paths
+    assert 'also produced by' in results[0][2]
+    assert 'also produced by' in results[1][2]
+    assert results[2][2] is None
+    assert sorted(os.listdir(output_dir)) == ['y.py']
+
+
+def test_main_compiles_saved_file(diagram, tmp_path, capsys):
+    db_name = str(tmp_path / 'diagram.sqlite')
+    save_diagram.fill_data_base(db_name, diagram)
+    assert compiler.main([db_name, '-j', '1']) == 0
+    assert '1 compiled, 0 failed' in capsys.readouterr().out
+    namespace = {}
+    with open(tmp_path / 'diagram.py', encoding='utf-8') as file:
+        exec(file.read(), namespace)
+    assert (namespace['x'], namespace['y']) == (1, 3)
+
+
+def test_main_reports_failures(tmp_path, capsys):
+    db_name = str(tmp_path / 'no_end.sqlite')
+    start = diagram_model.Node('StartBlock')
+    start.id = 1
+    save_diagram.fill_data_base(db_name, [start])
+    assert compiler.main([str(tmp_path), '-j', '1']) == 1
+    out = capsys.readouterr().out
+    assert 'failed' in out and 'no StartBlock or EndBlock' in out
+    assert not (tmp_path / 'no_end.py').exists()
+
+    assert compiler.main([str(tmp_path / 'missing')]) == 1
+    assert 'no diagrams found' in capsys.readouterr().err
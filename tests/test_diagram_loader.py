@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+import save_diagram
+
+
+def test_open_empty_diagram(window, tmp_path):
+    db_name = str(tmp_path / 'empty.sqlite')
+    save_diagram.fill_data_base(db_name, [])
+    window.open_test_file(db_name)
+    assert window.loader is None
+    assert window.current_file == db_name
+    assert len(window.blocks) == 0
+    assert window.save_file_action.isEnabled()
+    assert window.check_loaded()
+
+
+def test_open_diagram(window, diagram, tmp_path):
+    db_name = str(tmp_path / 'diagram.sqlite')
+    save_diagram.fill_data_base(db_name, diagram)
+    window.open_test_file(db_name)
+    assert sorted(i.id for i in window.blocks.nodes) == sorted(i.id for i in diagram)
+    assert not window.autosaver.is_dirty
+
+
+def test_open_broken_file(window, tmp_path):
+    db_name = tmp_path / 'broken.sqlite'
+    db_name.write_bytes(b'not a database' * 100)
+    window.open_test_file(str(db_name))
+    assert window.loader is None
+    assert window.autosaver is None
+    assert window.execute_program_action.isEnabled()
+    assert window.status_bar.currentMessage().startswith('Open failed')
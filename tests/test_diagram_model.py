@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import diagram_model
+import interpreter
+from conftest import merge
+from exceptions import BlockSyntaxError
+
+
+EXPECTED = '''x = int('1')
+for i in range(int('3')):
+    y = int('2')
+if x:
+    y = int('3')
+else:
+    y = int('4')'''
+
+
+def find(diagram, type_name: str, arg: str = None):
+    return next(i for i in diagram if i.type_name == type_name and (arg is None or i.arg == arg))
+
+
+def test_convert_to_py(diagram):
+    code = interpreter.Interpreter().convert_to_py(diagram, console=False)
+    assert code == EXPECTED
+    namespace = {}
+    exec(code, namespace)
+    assert (namespace['x'], namespace['y']) == (1, 3)
+
+
+def test_console_code_wraps_program(diagram):
+    code = interpreter.Interpreter().convert_to_py(diagram)
+    assert "x = int('1')" in code
+    assert 'input(' in code
+
+
+def test_statements_are_cached_until_change(diagram):
+    loop = find(diagram, 'ForLoopBlock')
+    condition = find(diagram, 'IfBlock')
+    loop_statements = loop.get_statements()
+    condition_statements = condition.get_statements()
+    assert loop.get_statements() is loop_statements
+
+    # правка строки сбрасывает кэш всех конструкций, в которые она входит, но не соседних
+    find(diagram, 'DataBlock', '2').arg = '5'
+    assert loop.get_statements() is not loop_statements
+    assert condition.get_statements() is condition_statements
+    assert "y = int('5')" in interpreter.Interpreter().convert_to_py(diagram, console=False)
+
+    assert condition.get_func() is condition.get_func()
+
+
+def test_names_are_recomputed_only_on_changed_path(diagram):
+    loop = find(diagram, 'ForLoopBlock')
+    condition = find(diagram, 'IfBlock')
+    converter = interpreter.Interpreter()
+    assert 'import' not in converter.convert_to_py(diagram, console=False)
+    condition_names = condition.get_names()
+
+    find(diagram, 'DataBlock', '2').data_type = 'math.floor'
+    code = converter.convert_to_py(diagram, console=False)
+    assert code.startswith('import math\n')
+    assert 'math' in loop.get_names()[0]
+    assert condition.get_names() is condition_names
+
+
+def chain(*blocks) -> diagram_model.Node:
+    return merge(*(diagram_model.Node(type_name, arg=arg) for type_name, arg in blocks))
+
+
+@pytest.mark.parametrize('blocks, expected', [
+    ((('FunctionBlock', 'print()'), ('FunctionBlock', 'len()'), ('VariableBlock', 'a')), 'print(len(a))'),
+    ((('VariableBlock', 'xs'), ('MethodBlock', '.append()'), ('VariableBlock', 'a')), 'xs.append(a)'),
+    ((('FunctionBlock', 'print(sep=str())'), ('VariableBlock', 'a')), 'print(a, sep=str())'),
+    ((('FunctionBlock', 'print()'), ('VariableBlock', 'a'), ('OperatorBlock', '+'), ('VariableBlock', 'b')),
+     'print(a + b)'),
+    ((('FunctionBlock', 'max(1)'), ('VariableBlock', 'a')), 'max(1, a)'),
+])
+def test_merged_calls_are_built_through_ast(blocks, expected):
+    assert chain(*blocks).get_func() == expected
+
+
+def test_merged_call_needs_a_call():
+    with pytest.raises(BlockSyntaxError):
+        chain(('FunctionBlock', 'print'), ('VariableBlock', 'a')).get_func()
+
+
+def test_line_removal_invalidates_construct(diagram):
+    loop = find(diagram, 'ForLoopBlock')
+    loop.get_statements()
+    loop.remove_line(find(diagram, 'VariableBlock', 'y'))
+    assert loop.lines == []
+    assert 'for i in range(int(\'3\')):\n    pass' in interpreter.Interpreter().convert_to_py(diagram, console=False)
+
+
+def test_topology_queries_follow_relinking(diagram):
+    variable = find(diagram, 'VariableBlock', 'x')
+    data = find(diagram, 'DataBlock', '1')
+    assert variable.layer_depth == 2
+    assert data.highest_layer is variable
+
+    operator = variable.layer_down_block
+    operator.layer_down_block = None
+    data.layer_up_block = None
+    assert variable.layer_depth == 1
+    assert data.highest_layer is data
+
+
+def test_child_edges_are_indexed_both_ways(diagram):
+    start = find(diagram, 'StartBlock')
+    first = start.child
+    assert start in first.incoming
+    start.child = None
+    assert start not in first.incoming
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import diagram_model
+import diagram_validation
+import interpreter
+from diagram_validation import Problem
+from exceptions import SequenceError
+
+
+@pytest.fixture
+def nodes(diagram) -> list:
+    diagram_model.assign_ids(diagram)
+    return list(diagram)
+
+
+def find(nodes, type_name: str, arg: str = None) -> diagram_model.Node:
+    return next(i for i in nodes if i.type_name == type_name and (arg is None or i.arg == arg))
+
+
+def problems(nodes) -> list:
+    return sorted((i.problem.name, i.block_id) for i in diagram_validation.validate(nodes))
+
+
+def test_valid_diagram(nodes):
+    assert diagram_validation.validate(nodes) == []
+
+
+def test_no_start_and_no_end(nodes):
+    nodes.remove(find(nodes, 'EndBlock'))
+    assert problems(nodes) == [('DANGLING_LINK', find(nodes, 'IfBlock').id), ('NO_END', None)]
+    nodes.remove(find(nodes, 'StartBlock'))
+    assert ('NO_START', None) in problems(nodes)
+    assert interpreter.Interpreter().convert_to_py(nodes, console=False) == ''
+
+
+def test_multiple_starts(nodes):
+    extra_start = diagram_model.Node('StartBlock')
+    extra_start.id = 100
+    nodes.append(extra_start)
+    assert problems(nodes) == [('MULTIPLE_STARTS', 100), ('UNREACHABLE', 100)]
+
+
+def test_child_cycle(nodes):
+    start, condition = find(nodes, 'StartBlock'), find(nodes, 'IfBlock')
+    first = start.child
+    condition.child = first
+    assert problems(nodes) == [('CYCLE', first.id), ('END_NOT_REACHED', start.id),
+                               ('UNREACHABLE', find(nodes, 'EndBlock').id)]
+
+
+def test_structure_cycle(nodes):
+    loop = find(nodes, 'ForLoopBlock')
+    line = loop.lines[0]
+    line.layer_down_block.layer_down_block.layer_down_block = loop
+    assert [i.problem for i in diagram_validation.validate(nodes)] == [Problem.CYCLE]
+
+
+def test_unreachable_block_is_warning(nodes):
+    stray = diagram_model.Node('FunctionBlock', arg='print()')
+    stray.id = 100
+    nodes.append(stray)
+    diagnostics = diagram_validation.validate(nodes)
+    assert [(i.problem, i.block_id, i.is_error) for i in diagnostics] == [(Problem.UNREACHABLE, 100, False)]
+    assert 'print()' not in interpreter.Interpreter().convert_to_py(nodes, console=False)
+
+
+def test_convert_to_py_raises_sequence_error(nodes):
+    start, condition = find(nodes, 'StartBlock'), find(nodes, 'IfBlock')
+    condition.child = start.child
+    with pytest.raises(SequenceError) as error:
+        interpreter.Interpreter().convert_to_py(nodes, console=False)
+    assert {i.problem for i in error.value.diagnostics} == {Problem.CYCLE, Problem.END_NOT_REACHED}
+    assert all(i.is_error for i in error.value.diagnostics)
+
+
+def test_snapshot_follows_changes(nodes):
+    start, condition = find(nodes, 'StartBlock'), find(nodes, 'IfBlock')
+    links = diagram_validation.snapshot(nodes)
+    assert diagram_validation.snapshot(nodes)[0] is links[0]
+    assert diagram_validation.check_snapshot(links) == []
+
+    condition.child = start.child
+    changed_links = diagram_validation.snapshot(nodes)
+    assert Problem.CYCLE in {i.problem for i in diagram_validation.check_snapshot(changed_links)}
+    assert diagram_validation.check_snapshot(links) == []  # старый снимок не меняется вместе со схемой
+
+    loop = find(nodes, 'ForLoopBlock')
+    loop.remove_line(loop.lines[0])
+    condition.child = find(nodes, 'EndBlock')
+    assert problems(nodes) == [('UNREACHABLE', find(nodes, 'VariableBlock', 'y').id)]
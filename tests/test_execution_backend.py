@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import time
+
+import execution_backend
+from execution_backend import ExecutionBackend
+
+
+def test_run_captures_output_and_errors():
+    backend = ExecutionBackend()
+    try:
+        result = backend.run('print(input() * 2)', 'ab\n')
+        assert result.ok and result.stdout == 'abab\n'
+        result = backend.run('import sys\nprint("x", file=sys.stderr)\n1 / 0')
+        assert result.stderr == 'x\n'
+        assert 'ZeroDivisionError' in result.error
+    finally:
+        backend.close()
+
+
+def test_default_timeout_is_finite():
+    assert 0 < ExecutionBackend.DEFAULT_TIMEOUT < float('inf')
+
+
+def test_timeout_replaces_worker():
+    backend = ExecutionBackend(timeout=0.5)
+    try:
+        start = time.perf_counter()
+        assert backend.run('while True:\n    pass').timed_out
+        assert time.perf_counter() - start < 5
+        assert backend.run('print("next")').stdout == 'next\n'
+    finally:
+        backend.close()
+
+
+def test_cancel_stops_running_program():
+    backend = ExecutionBackend(timeout=60)
+    try:
+        future = backend.submit('while True:\n    pass')
+        while not backend._busy:
+            time.sleep(0.01)
+        backend.cancel()
+        result = future.result(timeout=10)
+        assert not result.ok
+        assert backend.run('print("next")').stdout == 'next\n'
+    finally:
+        backend.close()
+
+
+def test_streaming_run_forwards_input():
+    backend = ExecutionBackend()
+    try:
+        run = backend.start('print(input("name? "))')
+        output = []
+        deadline = time.monotonic() + 10
+        while not output and time.monotonic() < deadline:
+            output.extend(run.read())
+        assert output == [('stdout', 'name? ')]
+        run.write('bob\n')
+        while run.is_running and time.monotonic() < deadline:
+            output.extend(run.read())
+        assert output[1:] == [('stdout', 'bob\n')]
+        assert run.result.ok
+    finally:
+        backend.close()
+
+
+def test_isolation_modules_unloads_program_imports():
+    backend = ExecutionBackend(isolation=execution_backend.Isolation.MODULES)
+    try:
+        assert backend.run('import sys\nimport colorsys\nprint("colorsys" in sys.modules)').stdout == 'True\n'
+        assert backend.run('import sys\nprint("colorsys" in sys.modules)').stdout == 'False\n'
+    finally:
+        backend.close()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import save_diagram
+
+
+def find(window, type_name: str, arg: str = None):
+    return next(i for i in window.blocks if i.node.type_name == type_name and (arg is None or i.node.arg == arg))
+
+
+def test_schedule_and_flush_measure_bottom_up_and_place_top_down(window, diagram, tmp_path):
+    db_name = str(tmp_path / 'diagram.sqlite')
+    save_diagram.fill_data_base(db_name, diagram)
+    window.open_test_file(db_name)
+    engine = window.layout_engine
+    loop = find(window, 'ForLoopBlock')
+    line = loop.node.lines[0].view
+    data = find(window, 'DataBlock', '2')
+    header = loop.node.layer_down_block.view
+    loop_width = loop.width()
+    loop.move(loop.x() + 100, loop.y() + 50)
+
+    laid_out = []
+    layout = engine.layout
+    engine.layout = lambda node: laid_out.append(node) or layout(node)
+    data.arg_label.setText('2' * 80)
+    engine.schedule(data.node)
+    engine.schedule(line.node)
+    # до flush размеры не меняются
+    assert loop.width() == loop_width
+    engine.flush()
+
+    # обе пометки относятся к одной конструкции, она раскладывается один раз от корня
+    assert laid_out == [loop.node]
+    assert not engine.timer.isActive()
+    # снизу вверх: строка растянулась под новый текст, цикл - под строку
+    assert line.width() > data.width()
+    assert loop.width() == line.width() + 15 > loop_width
+    # сверху вниз: вложенные блоки стоят относительно сдвинутого корня
+    assert (line.x(), line.y()) == (loop.x() + 12, loop.y() + header.height() + 8)
+    assert (header.x(), header.y()) == (loop.x() + loop.width() - header.width() - 3, loop.y() + 4)
+    assert data.x() > line.x() and data.y() > line.y()
+
+
+def test_schedule_is_applied_by_event_loop(window, qapp, diagram, tmp_path):
+    db_name = str(tmp_path / 'diagram.sqlite')
+    save_diagram.fill_data_base(db_name, diagram)
+    window.open_test_file(db_name)
+    data = find(window, 'DataBlock', '2')
+    loop = find(window, 'ForLoopBlock')
+    loop_width = loop.width()
+    data.arg_label.setText('2' * 80)
+    window.layout_engine.schedule(data.node)
+    assert window.layout_engine.timer.isActive()
+    while window.layout_engine.dirty:
+        qapp.processEvents()
+    assert loop.width() > loop_width
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import time
+
+import pytest
+
+import execution_backend
+
+
+@pytest.fixture(scope='module')
+def backend():
+    backend = execution_backend.ExecutionBackend()
+    yield backend
+    backend.close()
+
+
+@pytest.fixture
+def console(qapp):
+    import run_console
+    console = run_console.RunConsole()
+    yield console
+    console.stop()
+    console.deleteLater()
+
+
+def wait(qapp, console, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while console.is_running and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.01)
+    console.flush()
+    return console.output.toPlainText()
+
+
+def test_output_and_input_are_streamed(qapp, console, backend):
+    console.run(backend, 'name = input("name? ")\nprint("hello", name)\nprint(1 / 0)')
+    deadline = time.monotonic() + 10
+    while 'name? ' not in console.output.toPlainText() and time.monotonic() < deadline:
+        qapp.processEvents()
+        console.flush()
+    assert console.is_running
+    console.input.setText('bob')
+    console.write_input()
+    text = wait(qapp, console)
+    assert 'hello bob' in text
+    assert 'ZeroDivisionError' in text
+    assert '>>> Program failed' in text
+    assert not console.stop_button.isEnabled()
+
+
+def test_stop_replaces_worker(qapp, console, backend):
+    console.run(backend, 'while True:\n    print("x")')
+    deadline = time.monotonic() + 10
+    while 'x' not in console.output.toPlainText() and time.monotonic() < deadline:
+        qapp.processEvents()
+        console.flush()
+    console.stop()
+    assert '>>> Program stopped' in wait(qapp, console)
+    console.run(backend, 'print("after stop")')
+    assert '>>> Finished' in wait(qapp, console).split('after stop')[-1]
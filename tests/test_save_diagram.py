@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import sqlite3
+
+import diagram_model
+import save_diagram
+from conftest import describe
+
+
+def count_rows(db_name: str) -> int:
+    with sqlite3.connect(db_name) as con:
+        return con.execute('SELECT COUNT(*) FROM Blocks').fetchone()[0]
+
+
+def test_sqlite_roundtrip(diagram, tmp_path):
+    db_name = str(tmp_path / 'diagram.sqlite')
+    save_diagram.fill_data_base(db_name, diagram)
+    assert describe(save_diagram.read_diagram(db_name)) == describe(diagram)
+
+
+def test_query_region_does_not_write(diagram, tmp_path):
+    db_name = str(tmp_path / 'diagram.sqlite')
+    save_diagram.fill_data_base(db_name, diagram)
+    with sqlite3.connect(db_name) as con:
+        con.execute('DROP TABLE IF EXISTS BlocksIndex')
+    assert sorted(save_diagram.query_region(db_name, 0, 0, 0, 0)) == sorted(i.id for i in diagram)
+    with sqlite3.connect(db_name) as con:
+        assert con.execute("SELECT 1 FROM sqlite_master WHERE name == 'BlocksIndex'").fetchone() is None
+
+
+def test_incremental_saver_insert_and_delete(diagram, tmp_path):
+    db_name = str(tmp_path / 'diagram.sqlite')
+    nodes = list(diagram)
+    save_diagram.fill_data_base(db_name, nodes)
+    saver = save_diagram.IncrementalSaver(db_name, nodes)
+    saver.start()
+    try:
+        assert saver.flush() == 0
+        end = next(i for i in nodes if i.type_name == 'EndBlock')
+        last = next(iter(end.incoming))
+        printer = diagram_model.Node('FunctionBlock', arg='print(y)')
+        nodes.append(printer)
+        last.child = printer
+        printer.child = end
+        assert saver.flush() == 2  # новый узел и узел, у которого изменился child
+        assert printer.id is not None
+        assert count_rows(db_name) == len(nodes)
+        assert describe(save_diagram.read_diagram(db_name)) == describe(nodes)
+
+        last.child = end
+        nodes.remove(printer)
+        saver.mark_deleted(printer)
+        assert saver.flush() == 2
+        assert count_rows(db_name) == len(nodes)
+        assert describe(save_diagram.read_diagram(db_name)) == describe(nodes)
+    finally:
+        saver.close()
+    assert diagram_model.Node.on_change is None
+
+
+def test_reading_other_file_is_not_autosaved(diagram, tmp_path):
+    db_name, other_name = str(tmp_path / 'diagram.sqlite'), str(tmp_path / 'other.sqlite')
+    save_diagram.fill_data_base(db_name, diagram)
+    save_diagram.fill_data_base(other_name, [diagram_model.Node('StartBlock'), diagram_model.Node('EndBlock')])
+    saver = save_diagram.IncrementalSaver(db_name, diagram)
+    saver.start()
+    try:
+        save_diagram.read_diagram(other_name)
+        assert not saver.is_dirty
+    finally:
+        saver.close()
+    assert count_rows(db_name) == len(diagram)
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import interpreter
+import symbol_catalog
+from symbol_catalog import Symbol, SymbolCatalog, SymbolKind
+
+
+@pytest.fixture
+def catalog() -> SymbolCatalog:
+    return SymbolCatalog([
+        Symbol('floor', SymbolKind.FUNCTION, 'math', '(x, /)'),
+        Symbol('factorial', SymbolKind.FUNCTION, 'math', '(n, /)'),
+        Symbol('upper', SymbolKind.METHOD, 'str', '(self, /)'),
+        Symbol('print', SymbolKind.FUNCTION),
+        Symbol('float', SymbolKind.TYPE),
+        Symbol('shuffle', SymbolKind.FUNCTION, 'random'),
+    ])
+
+
+def names(symbols) -> list:
+    return [i.full_name for i in symbols]
+
+
+def test_prefix_search(catalog):
+    assert names(catalog.search('math.f')) == ['math.factorial', 'math.floor']
+    # по префиксу короткого имени тоже
+    assert names(catalog.search('UPP')) == ['str.upper']
+    # сначала совпадения по префиксу полного и короткого имени, потом нечеткие
+    assert names(catalog.search('fl')) == ['float', 'math.floor', 'math.factorial', 'random.shuffle']
+    assert names(catalog.search('fl', kind=SymbolKind.FUNCTION)) == ['math.floor', 'math.factorial', 'random.shuffle']
+    assert names(catalog.search('', owners=('math',))) == ['math.factorial', 'math.floor']
+    assert len(catalog.search('', limit=2)) == 2
+
+
+def test_fuzzy_search(catalog):
+    assert names(catalog.search('mflr')) == ['math.floor']
+    assert names(catalog.search('mfo')) == ['math.factorial', 'math.floor']
+    # все буквы 'rp' есть в маске print, но не по порядку
+    assert symbol_catalog.get_mask('rp') & catalog.search('print')[0].mask == symbol_catalog.get_mask('rp')
+    assert names(catalog.search('rp')) == ['str.upper']
+    assert names(catalog.search('shf')) == ['random.shuffle']
+    assert catalog.search('zzz') == ()
+
+
+def test_save_and_load(catalog, tmp_path):
+    path = str(tmp_path / 'symbols.json')
+    catalog.save(path)
+    loaded = SymbolCatalog.load(path)
+    assert [i.to_json() for i in loaded.symbols] == [i.to_json() for i in catalog.symbols]
+    assert names(loaded.search('mflr')) == ['math.floor']
+    assert SymbolCatalog.load(str(tmp_path / 'missing.json')) is None
+
+
+@pytest.mark.parametrize('used, assigned, modules', [
+    ({'math', 'x'}, {'x'}, ['math']),
+    ({'math', 'random'}, {'math'}, ['random']),
+    ({'os', 'print'}, set(), ['os']),
+    ({'path'}, set(), []),
+])
+def test_imported_modules(used, assigned, modules):
+    assert interpreter.Interpreter().get_imported_modules(used, assigned) == modules
+
+
+def test_auto_import_in_program(diagram):
+    data = next(i for i in diagram if i.type_name == 'DataBlock' and i.arg == '1')
+    data.data_type = 'math.floor'
+    code = interpreter.Interpreter().convert_to_py(diagram, console=False)
+    assert code.startswith('import math\nx = math.floor(')
+
+    # переменная с именем модуля не считается модулем
+    next(i for i in diagram if i.type_name == 'VariableBlock' and i.arg == 'x').arg = 'math'
+    code = interpreter.Interpreter().convert_to_py(diagram, console=False)
+    assert code.startswith('math = math.floor(')
@@ -3,6 +3,8 @@ import math
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
+from profiler import profiled
+
 
 def get_line_rect_intersection(line: QtCore.QLine, widget: QtWidgets.QWidget) -> QtCore.QPoint:
     rect = widget.rect
@@ -42,91 +44,122 @@ def get_line_line_intersection(line1: QtCore.QLine, line2: QtCore.QLine) -> QtCo
     return QtCore.QPoint(int(x), int(y))
 
 
-class Arrow(QtWidgets.QWidget):
-    def __init__(self, begin: QtCore.QPoint, destination: QtCore.QPoint, parent=None):
-        super().__init__(parent)
-        self.parent = parent
-
-        self.drawingPath = None
+def get_angle(a: int, b: float, c: int) -> float:
+    if a == 0 and b == c:
+        return 0
+    elif c == 0 and -a == b:
+        return 90
+    elif a == 0 and b == -c:
+        return 180
+    elif c == 0 and a == b:
+        return 270
+    elif a < 0 and b > 0:
+        return math.degrees(math.acos((b * b + c * c - a * a) / (2.0 * b * c)))
+    return 360 - math.degrees(math.acos((b * b + c * c - a * a) / (2.0 * b * c)))
+
+
+def get_arrowhead(destination: QtCore.QPoint, angle: float, length: int = 30) -> QtGui.QPolygonF:
+    """треугольник наконечника с вершиной в destination, повернутый на angle"""
+    triangle = QtGui.QPolygonF([QtCore.QPointF(0, 0),
+                                QtCore.QPointF(-0.3 * math.sqrt(3) * length, 0.2 * length),
+                                QtCore.QPointF(-0.3 * math.sqrt(3) * length, -0.2 * length)])
+    transform = QtGui.QTransform()
+    transform.translate(destination.x(), destination.y())
+    transform.rotate(-angle)
+    return transform.map(triangle)
+
+
+class Arrow:
+    """геометрия стрелки между блоками: концы, угол, заранее посчитанный наконечник и область, которую стрелка
+     занимает на экране"""
+    __slots__ = ('begin', 'destination', 'angle', 'head', 'rect')
+
+    def __init__(self, begin: QtCore.QPoint, destination: QtCore.QPoint):
         self.begin, self.destination = begin, destination
-        self.resize(500, 500)
-        self.image = QtGui.QPixmap(500, 500)
-        self.image.fill(QtCore.Qt.GlobalColor.white)
-
-    def draw(self, parent):
-        painter = QtGui.QPainter(parent)
-        self.set_painter_render_hints(painter)
-
-        if not self.begin.isNull() and not self.destination.isNull():
-            painter.drawLine(self.begin, self.destination)
-
-            l = 30
-            x_right = QtCore.QPointF(self.destination)
-
-            right_triangle = QtGui.QPainterPath()
-            right_triangle.lineTo(-0.3 * math.sqrt(3) * l, 0.2 * l)
-            right_triangle.lineTo(-0.3 * math.sqrt(3) * l, -0.2 * l)
-            right_triangle.closeSubpath()
-            right_triangle.translate(x_right)
-
-            painter.setBrush(QtGui.QColor("black"))
-            painter.translate(self.destination)
-
-            x1, y1 = self.begin.x(), self.begin.y()
-            x2, y2 = self.destination.x(), self.destination.y()
-            a = y2 - y1
-            c = x2 - x1
-            b = math.sqrt(a ** 2 + c ** 2)
-
-            angle = self.get_angle(a, b, c)
 
-            painter.rotate(-angle)
-            painter.translate(-self.destination)
-            painter.drawPath(right_triangle)
+        x1, y1 = begin.x(), begin.y()
+        x2, y2 = destination.x(), destination.y()
+        a = y2 - y1
+        c = x2 - x1
+        b = math.sqrt(a ** 2 + c ** 2)
+        self.angle = get_angle(a, b, c)
+        self.head = get_arrowhead(destination, self.angle)
+        self.rect = self.head.boundingRect().united(QtCore.QRectF(QtCore.QPointF(begin), QtCore.QPointF(destination))
+                                                    .normalized()).toAlignedRect().adjusted(-2, -2, 2, 2)
 
-    def set_painter_render_hints(self, painter: QtGui.QPainter):
-        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.HighQualityAntialiasing, True)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.SmoothPixmapTransform, True)
-
-    def get_angle(self, a: int, b: int, c: float) -> float:
-        if a == 0 and b == c:
-            return 0
-        elif c == 0 and -a == b:
-            return 90
-        elif a == 0 and b == -c:
-            return 180
-        elif c == 0 and a == b:
-            return 270
-        elif a < 0 and b > 0:
-            return math.degrees(math.acos((b * b + c * c - a * a) / (2.0 * b * c)))
-        return 360 - math.degrees(math.acos((b * b + c * c - a * a) / (2.0 * b * c)))
-
-    def paintEvent(self, event):
-        painter = QtGui.QPainter(self)
-        painter.drawPixmap(QtCore.QPoint(), self.image)
-        self.draw(self)
+    @property
+    def is_visible(self) -> bool:
+        return not self.begin.isNull() and not self.destination.isNull()
 
     def __repr__(self):
         return f'Arrow({self.begin.x()}, {self.begin.y()}, {self.destination.x()}, {self.destination.y()})'
 
 
 class Drawer:
-    """класс, который отвечает за отрисовку линий в окне"""
+    """класс, который отвечает за отрисовку линий в окне. стрелки хранятся по ключу - блоку, из которого они
+     выходят, чтобы их можно было пересчитывать по одной. перерисовывается только область измененных стрелок,
+     не чаще одного раза за кадр"""
+    FRAME_INTERVAL = 16  # мс, около 60 кадров в секунду
 
     def __init__(self):
-        self._arrows = []
+        self._arrows = {}
+        self._dirty_region = QtGui.QRegion()
+        self._repaint_timer: QtCore.QTimer = None
 
     @property
-    def arrows(self):
-        return self._arrows
+    def arrows(self) -> list:
+        return list(self._arrows.values())
 
     @arrows.setter
-    def arrows(self, l):
-        self._arrows = l[:]
-        self.update()
-
+    def arrows(self, arrows: dict):
+        for arrow in self._arrows.values():
+            self.schedule_repaint(arrow.rect)
+        self._arrows = dict(arrows)
+        for arrow in self._arrows.values():
+            self.schedule_repaint(arrow.rect)
+
+    def set_arrow(self, key, arrow: Arrow = None):
+        """заменяет или удаляет (arrow=None) одну стрелку"""
+        old_arrow = self._arrows.pop(key, None)
+        if old_arrow is not None:
+            self.schedule_repaint(old_arrow.rect)
+        if arrow is not None:
+            self._arrows[key] = arrow
+            self.schedule_repaint(arrow.rect)
+
+    def schedule_repaint(self, rect: QtCore.QRect):
+        """добавляет rect к области перерисовки, которая будет перерисована в следующем кадре"""
+        self._dirty_region += rect
+        if self._repaint_timer is None:
+            self._repaint_timer = QtCore.QTimer(self)
+            self._repaint_timer.setSingleShot(True)
+            self._repaint_timer.setInterval(self.FRAME_INTERVAL)
+            self._repaint_timer.timeout.connect(self.flush_repaint)
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+
+    def flush_repaint(self):
+        if not self._dirty_region.isEmpty():
+            self.update(self._dirty_region)
+        self._dirty_region = QtGui.QRegion()
+
+    @profiled()
     def paintEvent(self, event) -> None:
+        """рисует одним QPainterPath все стрелки, попавшие в перерисовываемую область"""
+        path = QtGui.QPainterPath()
+        # при OddEvenFill перекрывающиеся наконечники стрелок, входящих в один блок, вычитались бы друг из друга
+        path.setFillRule(QtCore.Qt.FillRule.WindingFill)
+        region = event.region()
+        for arrow in self._arrows.values():
+            if not arrow.is_visible or not region.intersects(arrow.rect):
+                continue
+            path.moveTo(QtCore.QPointF(arrow.begin))
+            path.lineTo(QtCore.QPointF(arrow.destination))
+            path.addPolygon(arrow.head)
+            path.closeSubpath()
+
         painter = QtGui.QPainter(self)
-        for arrow in self.arrows:
-            arrow.draw(self)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.HighQualityAntialiasing, True)
+        painter.setBrush(QtGui.QColor("black"))
+        painter.drawPath(path)
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
-from PyQt5 import QtWidgets, QtGui
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+import resources_rc  # noqa: F401 регистрирует картинки из pictures.qrc
 
 
 class MainWindow:
     """макет для основоного окна программы"""
+    performance_panel = None
 
     def __init__(self):
         super(MainWindow, self).__init__()
@@ -21,21 +24,30 @@ class MainWindow:
         main_window.setMenuBar(self.menu_bar)
 
         self.file_menu = self.menu_bar.addMenu('File')
+        self.view_menu = self.menu_bar.addMenu('View')
 
         self.status_bar = QtWidgets.QStatusBar(main_window)
         self.status_bar.setObjectName("status_bar")
         main_window.setStatusBar(self.status_bar)
 
-        self.add_function_block_action = QtWidgets.QAction(QtGui.QIcon('pictures/function.png'), 'function', self)
-        self.add_variable_block_action = QtWidgets.QAction(QtGui.QIcon('./pictures/variable.png'), 'variable', self)
-        self.add_for_loop_block_action = QtWidgets.QAction(QtGui.QIcon('./pictures/for.png'), 'for loop', self)
-        self.add_while_loop_block_action = QtWidgets.QAction(QtGui.QIcon('./pictures/while.png'), 'while loop', self)
-        self.add_if_block_action = QtWidgets.QAction(QtGui.QIcon('./pictures/if.png'), 'if block', self)
+        self.add_function_block_action = QtWidgets.QAction(QtGui.QIcon(':/pictures/function.png'), 'function', self)
+        self.add_variable_block_action = QtWidgets.QAction(QtGui.QIcon(':/pictures/variable.png'), 'variable', self)
+        self.add_for_loop_block_action = QtWidgets.QAction(QtGui.QIcon(':/pictures/for.png'), 'for loop', self)
+        self.add_while_loop_block_action = QtWidgets.QAction(QtGui.QIcon(':/pictures/while.png'), 'while loop', self)
+        self.add_if_block_action = QtWidgets.QAction(QtGui.QIcon(':/pictures/if.png'), 'if block', self)
         self.execute_program_action = QtWidgets.QAction('Execute', self)
         self.save_file_action = QtWidgets.QAction('Save', self)
         self.save_file_action.setShortcut('Ctrl+S')
         self.save_as_file_action = QtWidgets.QAction('Save as', self)
         self.open_file_action = QtWidgets.QAction('Open', self)
+        self.arrange_action = QtWidgets.QAction('Arrange', self)
+        self.arrange_action.setShortcut('Ctrl+L')
+        self.performance_panel_action = QtWidgets.QAction('Performance', self)
+        self.performance_panel_action.setCheckable(True)
+        self.performance_panel_action.setShortcut('F12')
+        self.run_console_action = QtWidgets.QAction('Console', self)
+        self.run_console_action.setCheckable(True)
+        self.run_console_action.setShortcut('F11')
 
         self.block_toolbar = QtWidgets.QToolBar('blocks', self)
         main_window.addToolBar(self.block_toolbar)
@@ -48,3 +60,17 @@ class MainWindow:
         self.file_menu.addAction(self.save_file_action)
         self.file_menu.addAction(self.save_as_file_action)
         self.file_menu.addAction(self.open_file_action)
+        self.view_menu.addAction(self.arrange_action)
+        self.view_menu.addAction(self.performance_panel_action)
+        self.view_menu.addAction(self.run_console_action)
+
+    def toggle_performance_panel(self, visible: bool):
+        """показывает и скрывает панель профилирования, панель создается при первом показе"""
+        if self.performance_panel is None:
+            if not visible:
+                return
+            import performance_panel
+            self.performance_panel = performance_panel.PerformancePanel(self)
+            self.addDockWidget(QtCore.Qt.DockWidgetArea.RightDockWidgetArea, self.performance_panel)
+            self.performance_panel.visibilityChanged.connect(self.performance_panel_action.setChecked)
+        self.performance_panel.setVisible(visible)